@@ -0,0 +1,4 @@
+"""Offline benchmarks for the extraction and normalization hot paths.
+
+Run with `python -m benchmarks --help` from the repo root.
+"""
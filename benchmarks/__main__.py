@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+from .harness import BENCHMARKS, MIN_COMPARE_REPEAT, CorpusSpec, compare, run_suite, select
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure throughput and peak memory of the extraction/normalization hot paths (offline).",
+    )
+    parser.add_argument(
+        "--size", type=int, action="append", help="Corpus size in items; repeat for several (default 10000)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark; the fastest counts")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus")
+    parser.add_argument("--corpus", choices=("synthetic", "fixture"), default="synthetic")
+    parser.add_argument("--html-dir", type=Path, help="Extra saved org pages for the fixture corpus")
+    parser.add_argument("--only", action="append", help="Run benchmarks whose name contains this; repeatable")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.10,
+        help=(
+            "Fail (exit 1) if median throughput drops by more than this fraction plus the "
+            "run-to-run spread, or peak memory grows by more than this fraction"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(bench.name)
+        return 0
+
+    benches = select(args.only)
+    if not benches:
+        parser.error(f"no benchmark matches {args.only}")
+    sizes = args.size or [10_000]
+    if any(s <= 0 for s in sizes):
+        parser.error("--size must be positive")
+    if args.baseline is not None and args.repeat < MIN_COMPARE_REPEAT:
+        parser.error(f"--baseline needs --repeat {MIN_COMPARE_REPEAT} or more to tell regressions from noise")
+
+    def progress(r: dict) -> None:
+        rate = f"{r['items_per_s']:,.0f} items/s" if r["items_per_s"] else "n/a"
+        print(
+            f"{r['name']} [{r['corpus']}, n={r['size']}]: {rate}, peak {r['peak_alloc_bytes'] / 1e6:.1f} MB",
+            file=sys.stderr,
+        )
+
+    report = run_suite(
+        benches,
+        sizes=sizes,
+        repeat=args.repeat,
+        seed=args.seed,
+        spec=CorpusSpec(kind=args.corpus, html_dir=args.html_dir),
+        progress=progress,
+    )
+
+    failed = False
+    if args.baseline is not None:
+        rows = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), max_regression=args.max_regression)
+        report["comparison"] = {"baseline": str(args.baseline), "max_regression": args.max_regression, "rows": rows}
+        for row in rows:
+            if row["regressed"]:
+                failed = True
+                print(
+                    f"REGRESSION {row['name']} [n={row['size']}]: throughput {row['throughput_change']:+.1%} "
+                    f"(noise {row['noise']:.1%}), peak memory {row['peak_alloc_change']:+.1%}",
+                    file=sys.stderr,
+                )
+
+    text = json.dumps(report, indent=2)
+    if args.out is not None:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import random
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TC_RSS_FIXTURE = REPO_ROOT / "packages" / "techcrunch_extractor" / "tests" / "fixtures" / "sample_rss.xml"
+CB_HTML_FIXTURES = REPO_ROOT / "packages" / "crunchbase_intel" / "tests" / "fixtures"
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_SYLLABLES = ("ar", "bo", "cel", "da", "en", "fi", "gra", "hex", "io", "jun", "ka", "lum", "mo", "nex", "or", "pi", "qua", "ra", "syn", "tor", "vy", "zen")
+_INVESTORS = (
+    "Sequoia Capital",
+    "Andreessen Horowitz",
+    "Accel",
+    "Index Ventures",
+    "Lightspeed",
+    "General Catalyst",
+    "Khosla Ventures",
+    "Y Combinator",
+    "SoftBank Vision Fund",
+    "Greylock",
+)
+_STAGES = ("pre-seed", "seed", "Series A", "Series B", "Series C", "Series D")
+_CATEGORIES = ("AI", "Startups", "Venture", "Fintech", "Enterprise", "Apps", "Climate", "Hardware", "Security")
+_AI_BLURBS = (
+    "builds large language model tooling for enterprises",
+    "uses machine learning to automate compliance",
+    "sells generative AI agents to support teams",
+    "trains foundation models for robotics",
+)
+_OTHER_BLURBS = (
+    "makes payroll software for small businesses",
+    "operates a marketplace for used EV batteries",
+    "sells developer tools for mobile teams",
+    "runs a subscription service for office snacks",
+)
+_FILLER = (
+    "The company said it will use the money to hire engineers and expand internationally. "
+    "Customers include several Fortune 500 companies, according to the founders. "
+)
+
+
+def company_name(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize() + rng.choice(
+        ("", " AI", " Labs", " Robotics", " Health")
+    )
+
+
+def _published(rng: random.Random, i: int) -> datetime:
+    return _EPOCH + timedelta(minutes=i * 7, seconds=rng.randint(0, 59))
+
+
+def _story(rng: random.Random) -> tuple[str, str, list[str]]:
+    """A headline, summary and categories; roughly half are AI funding stories."""
+    company = company_name(rng)
+    ai = rng.random() < 0.5
+    blurb = rng.choice(_AI_BLURBS if ai else _OTHER_BLURBS)
+    kind = rng.random()
+    if kind < 0.6:
+        amount = f"${rng.randint(1, 950)}{rng.choice(('M', ' million', 'B'))}"
+        stage = rng.choice(_STAGES)
+        lead, other = rng.sample(_INVESTORS, 2)
+        title = f"{company} raises {amount} {stage} to scale"
+        summary = f"{company}, which {blurb}, raised {amount} in a {stage} round led by {lead}, with participation from {other}."
+    elif kind < 0.75:
+        target = company_name(rng)
+        title = f"{company} acquires {target}"
+        summary = f"{company} {blurb} and has acquired {target} for an undisclosed sum."
+    else:
+        title = f"{company} launches a new product"
+        summary = f"{company} {blurb}. {_FILLER}"
+    categories = rng.sample(_CATEGORIES, rng.randint(1, 3))
+    if ai and "AI" not in categories:
+        categories.append("AI")
+    return title, summary, categories
+
+
+def synthetic_articles(n: int, rng: random.Random) -> list[Any]:
+    from techcrunch_intel.models import Article
+
+    out = []
+    for i in range(n):
+        title, summary, categories = _story(rng)
+        out.append(
+            Article(
+                title=title,
+                url=f"https://techcrunch.com/2026/01/01/story-{i}/",
+                published_at=_published(rng, i),
+                summary=summary,
+                author=rng.choice(("Jane Doe", "Sam Lee", None)),
+                categories=categories,
+                guid=f"https://techcrunch.com/?p={1_000_000 + i}",
+            )
+        )
+    return out
+
+
+def synthetic_rss_items(n: int, rng: random.Random) -> list[Any]:
+    from techcrunch_extractor.fetcher import TechCrunchRssItem
+
+    out = []
+    for i in range(n):
+        title, summary, categories = _story(rng)
+        out.append(
+            TechCrunchRssItem(
+                guid=f"https://techcrunch.com/?p={1_000_000 + i}",
+                title=title,
+                link=f"https://techcrunch.com/2026/01/01/story-{i}/",
+                description=summary,
+                pub_date=_published(rng, i).strftime("%a, %d %b %Y %H:%M:%S +0000"),
+                categories=categories,
+                author=rng.choice(("Jane Doe", "Sam Lee", None)),
+            )
+        )
+    return out
+
+
+def synthetic_reddit_posts(n: int, rng: random.Random) -> list[Any]:
+    from reddit_extractor.fetcher import RedditPost
+
+    out = []
+    for i in range(n):
+        title, summary, _ = _story(rng)
+        ticker = rng.choice(("$NVDA ", "$MSFT ", "GOOG ", ""))
+        post_id = f"t{i:07x}"
+        out.append(
+            RedditPost(
+                id=post_id,
+                fullname=f"t3_{post_id}",
+                subreddit=rng.choice(("startups", "venturecapital", "investing")),
+                title=ticker + title,
+                selftext=summary if rng.random() < 0.7 else "",
+                permalink=f"/r/startups/comments/{post_id}/story/",
+                url=f"https://www.reddit.com/r/startups/comments/{post_id}/story/",
+                created_utc=_published(rng, i).timestamp(),
+                author=f"user{rng.randint(1, 5000)}",
+                score=rng.randint(0, 5000),
+                num_comments=rng.randint(0, 400),
+            )
+        )
+    return out
+
+
+def synthetic_funding_round_pages(n: int, rng: random.Random, *, page_size: int = 1000) -> list[dict[str, Any]]:
+    """Crunchbase search responses holding `n` funding-round entities in total."""
+    entities = []
+    for i in range(n):
+        company = company_name(rng)
+        permalink = company.lower().replace(" ", "-")
+        money = {"value": rng.randint(1, 500) * 1_000_000, "currency": "USD"} if rng.random() < 0.9 else None
+        entities.append(
+            {
+                "uuid": f"00000000-0000-0000-0000-{i:012d}",
+                "properties": {
+                    "identifier": {
+                        "uuid": f"00000000-0000-0000-0000-{i:012d}",
+                        "value": f"{rng.choice(_STAGES)} - {company}",
+                        "permalink": f"{permalink}-round-{i}",
+                    },
+                    "announced_on": _published(rng, i).date().isoformat(),
+                    "funded_organization_identifier": {"value": company, "permalink": permalink},
+                    "money_raised": money,
+                },
+            }
+        )
+    return [
+        {"count": n, "data": {"entities": entities[i : i + page_size]}} for i in range(0, n, page_size)
+    ]
+
+
+def synthetic_org_page(rng: random.Random, i: int, *, filler_paragraphs: int = 40) -> str:
+    company = company_name(rng)
+    slug = f"{company.lower().replace(' ', '-')}-{i}"
+    jsonld = {
+        "@context": "https://schema.org",
+        "@type": "Organization",
+        "name": company,
+        "url": f"https://www.crunchbase.com/organization/{slug}",
+        "description": f"{company} {rng.choice(_AI_BLURBS + _OTHER_BLURBS)}.",
+        "sameAs": [f"https://{slug}.example.com", f"https://www.linkedin.com/company/{slug}"],
+    }
+    body = "".join(f"<p class=\"copy\">{_FILLER}</p>" for _ in range(filler_paragraphs))
+    return (
+        "<!doctype html><html><head>"
+        f"<title>{company} - Crunchbase Company Profile</title>"
+        f'<meta property="og:title" content="{company}" />'
+        f'<meta property="og:description" content="{company} on Crunchbase" />'
+        '<script src="/app.js"></script>'
+        f'<script type="application/ld+json">{json.dumps(jsonld)}</script>'
+        f"</head><body><main><h1>{company}</h1>{body}</main></body></html>"
+    )
+
+
+def synthetic_org_pages(n: int, rng: random.Random, *, pool: int = 1000) -> list[str]:
+    """`n` org pages drawn from `pool` distinct documents (keeps 1M-page runs in memory)."""
+    distinct = [synthetic_org_page(rng, i) for i in range(max(1, min(n, pool)))]
+    return [distinct[i % len(distinct)] for i in range(n)]
+
+
+def fixture_rss_items(n: int) -> list[Any]:
+    from techcrunch_extractor.fetcher import parse_rss_stream
+
+    items = list(parse_rss_stream([TC_RSS_FIXTURE.read_bytes()], source=str(TC_RSS_FIXTURE)))
+    return [items[i % len(items)] for i in range(n)]
+
+
+def fixture_articles(n: int) -> list[Any]:
+    from techcrunch_intel.models import Article
+
+    articles = [
+        Article(
+            title=item.title or "",
+            url=item.link or "",
+            published_at=_EPOCH,
+            summary=item.description,
+            author=item.author,
+            categories=list(item.categories),
+            guid=item.guid,
+        )
+        for item in fixture_rss_items(1)
+    ]
+    return [articles[i % len(articles)] for i in range(n)]
+
+
+def fixture_org_pages(n: int, extra_dir: Path | None = None) -> list[str]:
+    paths = sorted(CB_HTML_FIXTURES.glob("*.html"))
+    if extra_dir is not None:
+        paths += sorted(p for p in Path(extra_dir).rglob("*") if p.suffix.lower() in (".html", ".htm"))
+    pages = [p.read_text(encoding="utf-8", errors="replace") for p in paths]
+    return [pages[i % len(pages)] for i in range(n)]
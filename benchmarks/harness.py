@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import gc
+import os
+from pathlib import Path
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence
+
+from . import corpus
+
+# The packages are independently installable; make them importable from a plain checkout
+# the same way the test conftests do.
+for _path in [corpus.REPO_ROOT / "techcrunch_intel", *sorted((corpus.REPO_ROOT / "packages").glob("*/src"))]:
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+SCHEMA_VERSION = 1
+# Inputs run once, untimed, before timing (imports, regex compilation, caches).
+_WARMUP_ITEMS = 100
+# Peak-memory growth below this many bytes is noise, not a regression.
+_MEMORY_NOISE_BYTES = 64 * 1024
+# Fewer timed runs than this give no usable spread, so `compare` cannot tell noise apart.
+MIN_COMPARE_REPEAT = 3
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Which corpus to build: `synthetic`, or `fixture` (test fixtures, cycled to size).
+
+    `html_dir` adds saved org-page snapshots to the fixture corpus. Benchmarks with no
+    fixture data (Reddit posts, Crunchbase funding rounds) always use synthetic data.
+    """
+
+    kind: str = "synthetic"
+    html_dir: Path | None = None
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    # Builds the (untimed) input for `size` items; returns it and the corpus kind used.
+    setup: Callable[[int, random.Random, CorpusSpec], tuple[list[Any], str]]
+    # Processes the whole input (a list) once; returns the number of items processed.
+    run: Callable[[list[Any]], int]
+
+
+def _articles(size: int, rng: random.Random, spec: CorpusSpec) -> tuple[list[Any], str]:
+    if spec.kind == "fixture":
+        return corpus.fixture_articles(size), "fixture"
+    return corpus.synthetic_articles(size, rng), "synthetic"
+
+
+def _run_is_relevant(articles: list[Any]) -> int:
+    from techcrunch_intel.filter import is_relevant
+
+    for a in articles:
+        is_relevant(a)
+    return len(articles)
+
+
+def _run_extract(articles: list[Any]) -> int:
+    from techcrunch_intel.extract import extract_investment_signal
+
+    for a in articles:
+        extract_investment_signal(a)
+    return len(articles)
+
+
+def _setup_kg(size: int, rng: random.Random, spec: CorpusSpec) -> tuple[list[Any], str]:
+    from techcrunch_intel.extract import extract_investment_signal
+    from techcrunch_intel.models import IntelRecord
+
+    articles, kind = _articles(size, rng, spec)
+    extracted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    records = [
+        IntelRecord(article=a, investment=extract_investment_signal(a), extracted_at=extracted_at)
+        for a in articles
+    ]
+    return records, kind
+
+
+def _run_kg(records: list[Any]) -> int:
+    from techcrunch_intel.kg import build_kg_bundle
+
+    build_kg_bundle(records)
+    return len(records)
+
+
+def _run_cluster(records: list[Any]) -> int:
+    from techcrunch_intel.cluster import cluster_records
+
+    cluster_records(records)
+    return len(records)
+
+
+def _setup_rss_items(size: int, rng: random.Random, spec: CorpusSpec) -> tuple[list[Any], str]:
+    if spec.kind == "fixture":
+        return corpus.fixture_rss_items(size), "fixture"
+    return corpus.synthetic_rss_items(size, rng), "synthetic"
+
+
+def _run_normalize_rss_item(items: list[Any]) -> int:
+    from techcrunch_extractor.normalizer import normalize_rss_item
+
+    for item in items:
+        normalize_rss_item(item)
+    return len(items)
+
+
+def _run_normalize_post(posts: list[Any]) -> int:
+    from reddit_extractor.normalizer import normalize_post
+
+    for post in posts:
+        normalize_post(post)
+    return len(posts)
+
+
+def _run_normalize_funding_rounds(pages: list[dict[str, Any]]) -> int:
+    from crunchbase_extractor.normalizer import normalize_funding_round_search_result
+
+    return sum(len(normalize_funding_round_search_result(page)) for page in pages)
+
+
+def _setup_org_pages(size: int, rng: random.Random, spec: CorpusSpec) -> tuple[list[str], str]:
+    if spec.kind == "fixture":
+        return corpus.fixture_org_pages(size, spec.html_dir), "fixture"
+    return corpus.synthetic_org_pages(size, rng), "synthetic"
+
+
+def _org_page_runner(parser_factory: Callable[[], Any]) -> Callable[[list[str]], int]:
+    def run(pages: list[str]) -> int:
+        parser = parser_factory()
+        for html in pages:
+            parser.parse_company(html, url=None)
+        return len(pages)
+
+    return run
+
+
+def _bs4_parser() -> Any:
+    from crunchbase_intel.infrastructure.bs4_parser import PublicOrgPageParser
+
+    return PublicOrgPageParser()
+
+
+def _stream_parser() -> Any:
+    from crunchbase_intel.infrastructure.stream_parser import StreamingOrgPageParser
+
+    return StreamingOrgPageParser()
+
+
+BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark("techcrunch_intel.is_relevant", _articles, _run_is_relevant),
+    Benchmark("techcrunch_intel.extract_investment_signal", _articles, _run_extract),
+    Benchmark("techcrunch_intel.build_kg_bundle", _setup_kg, _run_kg),
+    Benchmark("techcrunch_intel.cluster_records", _setup_kg, _run_cluster),
+    Benchmark("techcrunch_extractor.normalize_rss_item", _setup_rss_items, _run_normalize_rss_item),
+    Benchmark(
+        "reddit_extractor.normalize_post",
+        lambda size, rng, spec: (corpus.synthetic_reddit_posts(size, rng), "synthetic"),
+        _run_normalize_post,
+    ),
+    Benchmark(
+        "crunchbase_extractor.normalize_funding_round_search_result",
+        lambda size, rng, spec: (corpus.synthetic_funding_round_pages(size, rng), "synthetic"),
+        _run_normalize_funding_rounds,
+    ),
+    Benchmark("crunchbase_intel.PublicOrgPageParser.parse_company", _setup_org_pages, _org_page_runner(_bs4_parser)),
+    Benchmark(
+        "crunchbase_intel.StreamingOrgPageParser.parse_company", _setup_org_pages, _org_page_runner(_stream_parser)
+    ),
+)
+
+
+def select(names: Sequence[str] | None) -> list[Benchmark]:
+    """Benchmarks whose name contains any of `names` (all of them if empty)."""
+    if not names:
+        return list(BENCHMARKS)
+    return [b for b in BENCHMARKS if any(n in b.name for n in names)]
+
+
+def measure(
+    bench: Benchmark,
+    *,
+    size: int,
+    repeat: int = 3,
+    seed: int = 0,
+    spec: CorpusSpec = CorpusSpec(),
+) -> dict[str, Any]:
+    """Time `bench` over a corpus of `size` items.
+
+    The corpus is built once (untimed) from `seed` and a short prefix of it is run as a
+    warm-up. The workload then runs `repeat` times for wall-clock timing, plus once
+    more under `tracemalloc` for the peak memory allocated while it runs (the corpus
+    itself is not counted). Throughput uses the fastest run; all run times are kept in
+    `times_s` so `compare` can judge the noise.
+    """
+    payload, kind = bench.setup(size, random.Random(seed), spec)
+    bench.run(payload[:_WARMUP_ITEMS])
+    times = []
+    items = 0
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        t0 = time.perf_counter()
+        items = bench.run(payload)
+        times.append(time.perf_counter() - t0)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        bench.run(payload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "name": bench.name,
+        "size": size,
+        "corpus": kind,
+        "items": items,
+        "repeat": len(times),
+        "best_s": best,
+        "median_s": statistics.median(times),
+        "times_s": times,
+        "items_per_s": items / best if best > 0 else None,
+        "peak_alloc_bytes": peak,
+    }
+
+
+def run_suite(
+    benches: Sequence[Benchmark],
+    *,
+    sizes: Sequence[int],
+    repeat: int = 3,
+    seed: int = 0,
+    spec: CorpusSpec = CorpusSpec(),
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    results = []
+    for size in sizes:
+        for bench in benches:
+            result = measure(bench, size=size, repeat=repeat, seed=seed, spec=spec)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": environment(),
+        "params": {"sizes": list(sizes), "repeat": repeat, "seed": seed, "corpus": spec.kind},
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_regression: float = 0.10,
+) -> list[dict[str, Any]]:
+    """Compare two suite outputs, matching results by name, size and corpus.
+
+    Throughput is compared on the median run, which a single lucky or unlucky run does
+    not move. Each row carries the relative throughput and peak-memory change and the
+    `noise` margin: the run-to-run jitter, (median - fastest) / median, of the two
+    results added together. `regressed` is set when throughput dropped by more than
+    `max_regression` plus `noise`, or peak memory grew (by more than 64 KiB) by more
+    than `max_regression`.
+    """
+    base = {(r["name"], r["size"], r["corpus"]): r for r in baseline.get("results", [])}
+    rows = []
+    for r in current.get("results", []):
+        b = base.get((r["name"], r["size"], r["corpus"]))
+        if b is None or not b.get("median_s") or not r.get("median_s") or not b.get("items"):
+            continue
+        speed = (r["items"] / r["median_s"]) / (b["items"] / b["median_s"]) - 1.0
+        noise = _jitter(r) + _jitter(b)
+        memory = (r["peak_alloc_bytes"] / b["peak_alloc_bytes"] - 1.0) if b["peak_alloc_bytes"] else 0.0
+        memory_grew = memory > max_regression and r["peak_alloc_bytes"] - b["peak_alloc_bytes"] > _MEMORY_NOISE_BYTES
+        rows.append(
+            {
+                "name": r["name"],
+                "size": r["size"],
+                "corpus": r["corpus"],
+                "throughput_change": speed,
+                "peak_alloc_change": memory,
+                "noise": noise,
+                "regressed": speed < -(max_regression + noise) or memory_grew,
+            }
+        )
+    return rows
+
+
+def _jitter(result: dict[str, Any]) -> float:
+    # Slow outliers (a GC pause, a busy neighbour) do not move the median, so they are
+    # left out of the margin too. Reports written before `times_s` existed carry none.
+    times = result.get("times_s") or []
+    median = result.get("median_s")
+    if len(times) < 2 or not median:
+        return 0.0
+    return (median - min(times)) / median
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": _git_commit(),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=corpus.REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
@@ -1,5 +1,9 @@
 __all__ = [
+    "archive",
+    "cache",
     "client",
+    "columnar",
     "fetcher",
     "normalizer",
+    "ratelimit",
 ]
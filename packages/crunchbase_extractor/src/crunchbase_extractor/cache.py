@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+
+class ResponseCache:
+    """Persistent, TTL-bounded store of Crunchbase JSON responses.
+
+    One JSON file per key (named by the SHA-256 of the key) holds the response and the
+    time it was stored. Entries older than `ttl_s` are treated as missing; `ttl_s=None`
+    keeps them forever.
+    """
+
+    def __init__(self, directory: Path, *, ttl_s: float | None = 7 * 86400.0, clock=time.time) -> None:
+        self._dir = Path(directory)
+        self._ttl_s = ttl_s
+        self._clock = clock
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        stored_at = data.get("stored_at")
+        if self._ttl_s is not None:
+            if not isinstance(stored_at, (int, float)) or self._clock() - stored_at > self._ttl_s:
+                return None
+        payload = data.get("payload")
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        record = {"key": key, "stored_at": self._clock(), "payload": payload}
+        tmp.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._dir / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
@@ -1,19 +1,41 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 import typer
 
 from .config import CrunchbaseConfig, CrunchbaseConfigError
 from .client import CrunchbaseClient
 from .fetcher import autocomplete as cb_autocomplete
-from .fetcher import get_organization, search_funding_rounds
+from .archive import ResponseArchive
+from .cache import ResponseCache
+from .columnar import PARTITIONS, write_parquet
+from .fetcher import (
+    get_organization,
+    get_organizations,
+    iter_funding_round_pages,
+    load_checkpoint_state,
+    search_funding_rounds,
+)
 from .io import emit_json, emit_jsonl
-from .normalizer import normalize_funding_round_search_result, normalize_organization
+from .normalizer import (
+    normalize_funding_round_entity,
+    normalize_funding_round_search_result,
+    normalize_organization,
+)
+from .types import InvestmentIntelItem
+from .ratelimit import TokenBucket
 
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
+# Proactive client-side pacing, below the 200 calls/min of Crunchbase's API plans.
+_DEFAULT_REQUESTS_PER_MINUTE = 120.0
+
+_ORG_FIELD_IDS = ["identifier", "short_description", "website", "founded_on", "rank_org_company"]
+_ORG_CARD_IDS = ["raised_funding_rounds"]
+
 
 def _emit_error(*, kind: str, message: str, code: int, command: str, details: dict | None = None) -> None:
     payload = {
@@ -29,6 +51,29 @@ def _emit_error(*, kind: str, message: str, code: int, command: str, details: di
     raise typer.Exit(code=code)
 
 
+def _load_config(*, command: str, replay: bool) -> CrunchbaseConfig:
+    try:
+        return CrunchbaseConfig.from_env()
+    except CrunchbaseConfigError as exc:
+        if replay:
+            # Replays need no API key, but the base URL must match the recording.
+            base_url = (os.environ.get("CRUNCHBASE_BASE_URL") or "").strip() or CrunchbaseConfig.base_url
+            return CrunchbaseConfig(user_key="", base_url=base_url)
+        _emit_error(kind="config_error", message=str(exc), code=2, command=command)
+
+
+def _open_archive(archive_dir: Path | None, replay: bool, *, command: str) -> ResponseArchive | None:
+    if archive_dir is None:
+        if replay:
+            _emit_error(kind="usage_error", message="--replay requires --archive-dir", code=2, command=command)
+        return None
+    return ResponseArchive(archive_dir, replay=replay)
+
+
+def _rate_limiter(requests_per_minute: float) -> TokenBucket | None:
+    return TokenBucket.per_minute(requests_per_minute) if requests_per_minute > 0 else None
+
+
 @app.callback()
 def main() -> None:
     """Crunchbase extractor CLI."""
@@ -40,13 +85,20 @@ def autocomplete_cmd(
     query: str = typer.Option(..., help="Query text"),
     collection_ids: str | None = typer.Option(None, help="Comma-separated collection_ids"),
     limit: int = typer.Option(10, min=1, max=25, help="Max suggestions (<=25)"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network or API key"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
+    archive = _open_archive(archive_dir, replay, command="autocomplete")
+    config = _load_config(command="autocomplete", replay=replay)
     try:
-        config = CrunchbaseConfig.from_env()
-    except CrunchbaseConfigError as exc:
-        _emit_error(kind="config_error", message=str(exc), code=2, command="autocomplete")
-    try:
-        with CrunchbaseClient(config=config) as client:
+        with CrunchbaseClient(
+            config=config, archive=archive, rate_limiter=_rate_limiter(requests_per_minute)
+        ) as client:
             data = cb_autocomplete(client, query=query, collection_ids=collection_ids, limit=limit)
     except Exception as exc:
         _emit_error(kind="api_error", message=str(exc), code=1, command="autocomplete")
@@ -57,29 +109,95 @@ def autocomplete_cmd(
 def organization_cmd(
     permalink: str = typer.Option(..., help="Organization permalink (e.g. 'tesla-motors')"),
     out: Path | None = typer.Option(None, help="Write normalized JSONL to this path"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network or API key"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
+    archive = _open_archive(archive_dir, replay, command="organization")
+    config = _load_config(command="organization", replay=replay)
     try:
-        config = CrunchbaseConfig.from_env()
-    except CrunchbaseConfigError as exc:
-        _emit_error(kind="config_error", message=str(exc), code=2, command="organization")
-    try:
-        with CrunchbaseClient(config=config) as client:
+        with CrunchbaseClient(
+            config=config, archive=archive, rate_limiter=_rate_limiter(requests_per_minute)
+        ) as client:
             entity = get_organization(
                 client,
                 entity_id=permalink,
-                field_ids=[
-                    "identifier",
-                    "short_description",
-                    "website",
-                    "founded_on",
-                    "rank_org_company",
-                ],
-                card_ids=["raised_funding_rounds"],
+                field_ids=_ORG_FIELD_IDS,
+                card_ids=_ORG_CARD_IDS,
             )
     except Exception as exc:
         _emit_error(kind="api_error", message=str(exc), code=1, command="organization")
     normalized = [normalize_organization(entity)]
-    emit_jsonl(normalized, out)
+    emit_jsonl(normalized, out, append=append)
+
+
+@app.command("organizations")
+def organizations_cmd(
+    permalinks_file: Path = typer.Option(
+        ..., exists=True, dir_okay=False, help="File with one organization permalink per line"
+    ),
+    out: Path | None = typer.Option(None, help="Write normalized JSONL to this path"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    cache_dir: Path | None = typer.Option(None, help="Serve repeat lookups from this on-disk cache"),
+    cache_ttl_hours: float = typer.Option(168.0, min=0.0, help="Max age of cached organizations"),
+    max_concurrency: int = typer.Option(4, min=1, max=32, help="Max concurrent API requests"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network or API key"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
+) -> None:
+    archive = _open_archive(archive_dir, replay, command="organizations")
+    config = _load_config(command="organizations", replay=replay)
+
+    lines = permalinks_file.read_text(encoding="utf-8").splitlines()
+    permalinks = [ln for ln in lines if ln.strip() and not ln.lstrip().startswith("#")]
+    cache = ResponseCache(cache_dir, ttl_s=cache_ttl_hours * 3600.0) if cache_dir else None
+    try:
+        with CrunchbaseClient(
+            config=config,
+            archive=archive,
+            max_connections=max_concurrency,
+            rate_limiter=_rate_limiter(requests_per_minute),
+        ) as client:
+            lookups = get_organizations(
+                client,
+                permalinks,
+                field_ids=_ORG_FIELD_IDS,
+                card_ids=_ORG_CARD_IDS,
+                cache=cache,
+                max_workers=max_concurrency,
+            )
+    except Exception as exc:
+        _emit_error(kind="api_error", message=str(exc), code=1, command="organizations")
+
+    emit_jsonl((normalize_organization(lk.entity) for lk in lookups if lk.entity is not None), out, append=append)
+    failed = [lk for lk in lookups if lk.error]
+    for lk in failed:
+        typer.echo(
+            json.dumps(
+                {
+                    "ok": False,
+                    "error": {
+                        "kind": "api_error",
+                        "message": lk.error,
+                        "command": "organizations",
+                        "details": {"permalink": lk.permalink},
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            err=True,
+        )
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command("funding-rounds")
@@ -89,13 +207,69 @@ def funding_rounds_cmd(
     currency: str = typer.Option("usd", help="Currency code for money_raised predicate"),
     limit: int = typer.Option(100, min=1, max=1000, help="Max results per page (<=1000)"),
     out: Path | None = typer.Option(None, help="Write normalized JSONL to this path"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    all_pages: bool = typer.Option(False, help="Follow pagination until the search is exhausted"),
+    checkpoint: Path | None = typer.Option(
+        None,
+        help="With --all-pages: save the cursor here after each page and resume from it on rerun",
+    ),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network or API key"),
+    parquet_dir: Path | None = typer.Option(
+        None, help="Write a Parquet dataset here (requires pyarrow); JSONL then only goes to --out"
+    ),
+    parquet_partition: str | None = typer.Option(None, help="Partition Parquet by published 'month' or 'day'"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
+    if checkpoint is not None and not all_pages:
+        _emit_error(
+            kind="usage_error",
+            message="--checkpoint requires --all-pages",
+            code=2,
+            command="funding-rounds",
+        )
+    if parquet_dir is not None and all_pages:
+        _emit_error(
+            kind="usage_error",
+            message="--parquet-dir cannot be combined with --all-pages",
+            code=2,
+            command="funding-rounds",
+        )
+    _check_parquet_partition(parquet_partition, command="funding-rounds")
+    archive = _open_archive(archive_dir, replay, command="funding-rounds")
+    config = _load_config(command="funding-rounds", replay=replay)
+
+    if all_pages:
+        try:
+            with CrunchbaseClient(
+                config=config, archive=archive, rate_limiter=_rate_limiter(requests_per_minute)
+            ) as client:
+                _emit_pages(
+                    lambda state: iter_funding_round_pages(
+                        client,
+                        announced_on_gte=announced_on_gte,
+                        money_raised_gte=money_raised_gte,
+                        currency=currency,
+                        page_size=limit,
+                        checkpoint=checkpoint,
+                        checkpoint_state=state,
+                    ),
+                    out,
+                    append=append,
+                    checkpoint=checkpoint,
+                )
+        except Exception as exc:
+            _emit_error(kind="api_error", message=str(exc), code=1, command="funding-rounds")
+        return
+
     try:
-        config = CrunchbaseConfig.from_env()
-    except CrunchbaseConfigError as exc:
-        _emit_error(kind="config_error", message=str(exc), code=2, command="funding-rounds")
-    try:
-        with CrunchbaseClient(config=config) as client:
+        with CrunchbaseClient(
+            config=config, archive=archive, rate_limiter=_rate_limiter(requests_per_minute)
+        ) as client:
             search_resp = search_funding_rounds(
                 client,
                 announced_on_gte=announced_on_gte,
@@ -106,9 +280,73 @@ def funding_rounds_cmd(
     except Exception as exc:
         _emit_error(kind="api_error", message=str(exc), code=1, command="funding-rounds")
     normalized = normalize_funding_round_search_result(search_resp)
-    emit_jsonl(normalized, out)
+    _emit_items(
+        normalized,
+        out,
+        append=append,
+        parquet_dir=parquet_dir,
+        parquet_partition=parquet_partition,
+        command="funding-rounds",
+    )
+
+
+def _emit_pages(open_pages, out: Path | None, *, append: bool, checkpoint: Path | None) -> None:
+    """Stream normalized pages, flushing after each so a checkpointed page is on disk.
+
+    `open_pages(state)` starts the page iterator, with `state` to store in the checkpoint.
+    Output is written in place (not via temp file + rename) so an interrupted run keeps
+    the pages it finished. The checkpoint records the output size after the last finished
+    page; a resumed run first truncates back to it, dropping a half-written page (and
+    any partial line) that is then fetched and written again.
+    """
+    if out is None:
+        for page in open_pages(None):
+            emit_jsonl((normalize_funding_round_entity(e) for e in page), None)
+        return
+    saved = load_checkpoint_state(checkpoint) if checkpoint is not None else None
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("ab") as fh:
+        if saved is not None and "out_offset" in saved:
+            fh.truncate(int(saved["out_offset"]))
+        elif not append and not (checkpoint is not None and checkpoint.exists()):
+            fh.truncate(0)
+        fh.seek(0, os.SEEK_END)
+        for page in open_pages(lambda: {"out_offset": fh.tell()}):
+            lines = "".join(normalize_funding_round_entity(e).model_dump_json() + "\n" for e in page)
+            fh.write(lines.encode("utf-8"))
+            fh.flush()
+            os.fsync(fh.fileno())
 
 
 def _emit_jsonl(items, out: Path | None) -> None:
     # Backwards-compatible wrapper; prefer emit_jsonl() directly.
     emit_jsonl(items, out)
+
+
+def _check_parquet_partition(parquet_partition: str | None, *, command: str) -> None:
+    if parquet_partition is not None and parquet_partition not in PARTITIONS:
+        _emit_error(
+            kind="usage_error",
+            message="--parquet-partition must be 'month' or 'day'",
+            code=2,
+            command=command,
+        )
+
+
+def _emit_items(
+    items: list[InvestmentIntelItem],
+    out: Path | None,
+    *,
+    append: bool,
+    parquet_dir: Path | None,
+    parquet_partition: str | None,
+    command: str,
+) -> None:
+    if parquet_dir is not None:
+        try:
+            write_parquet(items, parquet_dir, partition_by=parquet_partition)
+        except RuntimeError as exc:
+            _emit_error(kind="export_error", message=str(exc), code=1, command=command)
+        if out is None:
+            return
+    emit_jsonl(items, out, append=append)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 
+from .archive import ResponseArchive, request_key
 from .config import CrunchbaseConfig
+from .ratelimit import TokenBucket, host_key
 
 
 class CrunchbaseAuthError(RuntimeError):
@@ -24,23 +26,35 @@ class CrunchbaseClient:
         user_key: str | None = None,
         base_url: str = "https://api.crunchbase.com/v4/data",
         timeout_s: float = 30.0,
+        max_connections: int = 10,
+        rate_limiter: TokenBucket | None = None,
+        archive: ResponseArchive | None = None,
     ) -> None:
         if config is None:
             config = CrunchbaseConfig.from_env()
 
         self._user_key = user_key or config.user_key
-        if not self._user_key:
+        self._archive = archive
+        # Replaying from an archive needs no API key.
+        if not self._user_key and not (archive is not None and archive.replay):
             raise CrunchbaseAuthError("Missing CRUNCHBASE_USER_KEY")
         self._base_url = (base_url or config.base_url).rstrip("/")
-        self._http = httpx.Client(timeout=timeout_s)
+        # One pooled client; safe to share across threads (see fetcher.get_organizations).
+        self._http = httpx.Client(
+            timeout=timeout_s,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
         self._max_retries = 2
+        self._rate_limiter = rate_limiter
 
     def get(self, path: str, *, params: dict[str, Any] | None = None) -> dict[str, Any]:
         url = self._base_url + path
         merged = {"user_key": self._user_key}
         if params:
             merged.update(params)
-        resp = self._request_with_retries("GET", url, params=merged)
+        resp = self._archived(
+            "GET", url, params, None, lambda: self._request_with_retries("GET", url, params=merged)
+        )
         return resp.json()
 
     def post(self, path: str, *, json_body: dict[str, Any], params: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -48,12 +62,38 @@ class CrunchbaseClient:
         merged = {"user_key": self._user_key}
         if params:
             merged.update(params)
-        resp = self._request_with_retries("POST", url, params=merged, json=json_body)
+        resp = self._archived(
+            "POST",
+            url,
+            params,
+            json_body,
+            lambda: self._request_with_retries("POST", url, params=merged, json=json_body),
+        )
         return resp.json()
 
+    def _archived(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        json_body: dict[str, Any] | None,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        if self._archive is None:
+            return send()
+        # Keyed without `user_key`, so archives can be shared and replayed keyless.
+        key = request_key(method, url, params=params, json_body=json_body)
+        if self._archive.replay:
+            return self._archive.replay_response(key, method=method, url=url)
+        resp = send()
+        self._archive.record(key, resp)
+        return resp
+
     def _request_with_retries(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         last_exc: Exception | None = None
         for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(host_key(url))
             try:
                 resp = self._http.request(method, url, **kwargs)
             except httpx.RequestError as exc:
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+import uuid
+
+from pydantic import BaseModel
+
+# partition_by -> (hive column, strftime format of `published_at` in UTC)
+PARTITIONS = {"day": ("published_day", "%Y-%m-%d"), "month": ("published_month", "%Y-%m")}
+_HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+
+def write_parquet(
+    models: Iterable[BaseModel],
+    out_dir: Path,
+    *,
+    partition_by: str | None = None,
+    row_group_size: int = 50_000,
+    max_buffered_rows: int = 200_000,
+    include_raw: bool = True,
+    compression: str = "zstd",
+) -> list[Path]:
+    """Write normalized items as a Parquet dataset under `out_dir` (requires `pyarrow`).
+
+    One typed column per `InvestmentIntelItem` field; `raw` is kept as JSON text in its
+    own `raw_json` column (dropped with `include_raw=False`), so readers that select
+    columns never decode it. See `ParquetDatasetWriter` for partitioning and row groups.
+    Returns the written files.
+    """
+    pa, _ = _pyarrow()
+    schema = item_schema(pa, include_raw=include_raw)
+    with ParquetDatasetWriter(
+        out_dir,
+        schema,
+        partition_by=partition_by,
+        row_group_size=row_group_size,
+        max_buffered_rows=max_buffered_rows,
+        compression=compression,
+    ) as writer:
+        for m in models:
+            writer.write(item_row(m, include_raw=include_raw))
+    return writer.paths
+
+
+def item_schema(pa: Any, *, include_raw: bool = True) -> Any:
+    fields = [
+        ("source", pa.string()),
+        ("source_record_type", pa.string()),
+        ("source_record_id", pa.string()),
+        ("url", pa.string()),
+        ("title", pa.string()),
+        ("summary", pa.string()),
+        ("published_at", pa.timestamp("us", tz="UTC")),
+        ("collected_at", pa.timestamp("us", tz="UTC")),
+        ("entities", pa.list_(pa.string())),
+        ("tags", pa.list_(pa.string())),
+    ]
+    if include_raw:
+        fields.append(("raw_json", pa.string()))
+    return pa.schema(fields)
+
+
+def item_row(model: BaseModel, *, include_raw: bool = True) -> dict[str, Any]:
+    row = model.model_dump()
+    raw = row.pop("raw", None)
+    if include_raw:
+        row["raw_json"] = None if raw is None else json.dumps(raw, ensure_ascii=False, default=str)
+    return row
+
+
+class ParquetDatasetWriter:
+    """Stream rows into a Parquet dataset, one buffered row group at a time.
+
+    - Rows are buffered per output file and flushed as a row group every
+      `row_group_size` rows. At most `max_buffered_rows` rows are held across all
+      partitions: past that, the largest buffer is flushed early (as a smaller row
+      group), so memory does not grow with the number of partitions.
+    - At most `max_open_files` Parquet writers are open at once; opening another
+      finishes the oldest file, and later rows for that partition start a new one.
+    - `partition_by="month"` / `"day"` writes Hive-style directories
+      (`published_month=2026-02/`) from the row's `published_at`; rows without one go to
+      `__HIVE_DEFAULT_PARTITION__`. The partition column lives in the path only.
+    - Files are named `part-<run id>-<n>.parquet`, so repeated runs add files to the
+      same dataset. Each is written under a hidden temp name and renamed on `close()`;
+      on error the temp files are removed.
+    """
+
+    def __init__(
+        self,
+        out_dir: Path,
+        schema: Any,
+        *,
+        partition_by: str | None = None,
+        row_group_size: int = 50_000,
+        max_buffered_rows: int = 200_000,
+        max_open_files: int = 64,
+        compression: str = "zstd",
+    ) -> None:
+        if partition_by is not None and partition_by not in PARTITIONS:
+            raise ValueError(f"Unsupported partition_by: {partition_by!r} (expected None, 'day' or 'month')")
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be >= 1")
+        if max_buffered_rows < 1 or max_open_files < 1:
+            raise ValueError("max_buffered_rows and max_open_files must be >= 1")
+        self._pa, self._pq = _pyarrow()
+        self._out_dir = Path(out_dir)
+        self._schema = schema
+        self._partition = PARTITIONS.get(partition_by) if partition_by else None
+        self._row_group_size = row_group_size
+        self._max_buffered_rows = max_buffered_rows
+        self._max_open_files = max_open_files
+        self._compression = compression
+        self._run = uuid.uuid4().hex[:12]
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._buffered = 0
+        self._open: dict[str, tuple[Any, Path, Path]] = {}
+        self._finished: list[tuple[Path, Path]] = []
+        self._files = 0
+        self.paths: list[Path] = []
+
+    def write(self, row: dict[str, Any]) -> None:
+        key = self._partition_dir(row.get("published_at"))
+        buf = self._buffers.setdefault(key, [])
+        buf.append(row)
+        self._buffered += 1
+        if len(buf) >= self._row_group_size:
+            self._flush(key)
+        elif self._buffered >= self._max_buffered_rows:
+            self._flush(max(self._buffers, key=lambda k: len(self._buffers[k])))
+
+    def close(self) -> list[Path]:
+        for key in list(self._buffers):
+            self._flush(key)
+        for key in list(self._open):
+            self._finish(key)
+        for tmp, final in self._finished:
+            os.replace(tmp, final)
+            self.paths.append(final)
+        self._finished.clear()
+        return self.paths
+
+    def abort(self) -> None:
+        for writer, tmp, _ in self._open.values():
+            writer.close()
+            tmp.unlink(missing_ok=True)
+        for tmp, _ in self._finished:
+            tmp.unlink(missing_ok=True)
+        self._open.clear()
+        self._finished.clear()
+        self._buffers.clear()
+        self._buffered = 0
+
+    def _partition_dir(self, published_at: datetime | None) -> str:
+        if self._partition is None:
+            return ""
+        column, fmt = self._partition
+        if published_at is None:
+            return f"{column}={_HIVE_NULL}"
+        if published_at.tzinfo is not None:
+            published_at = published_at.astimezone(timezone.utc)
+        return f"{column}={published_at.strftime(fmt)}"
+
+    def _flush(self, key: str) -> None:
+        rows = self._buffers.pop(key, None)
+        if not rows:
+            return
+        self._buffered -= len(rows)
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        if key not in self._open:
+            if len(self._open) >= self._max_open_files:
+                self._finish(next(iter(self._open)))
+            directory = self._out_dir / key if key else self._out_dir
+            directory.mkdir(parents=True, exist_ok=True)
+            final = directory / f"part-{self._run}-{self._files:05d}.parquet"
+            tmp = directory / f".{final.name}.tmp"
+            self._files += 1
+            writer = self._pq.ParquetWriter(str(tmp), self._schema, compression=self._compression)
+            self._open[key] = (writer, tmp, final)
+        self._open[key][0].write_table(table, row_group_size=len(rows))
+
+    def _finish(self, key: str) -> None:
+        writer, tmp, final = self._open.pop(key)
+        writer.close()
+        self._finished.append((tmp, final))
+
+    def __enter__(self) -> "ParquetDatasetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise RuntimeError("Parquet export requires the 'pyarrow' package") from exc
+    return pyarrow, pyarrow.parquet
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
+from .cache import ResponseCache
 from .ports import CrunchbaseApi
 
 
@@ -34,6 +39,67 @@ def get_organization(
     return client.get(f"/entities/organizations/{entity_id}", params=params)
 
 
+@dataclass(frozen=True)
+class OrganizationLookup:
+    permalink: str
+    entity: dict[str, Any] | None
+    error: str | None = None
+    cached: bool = False
+
+
+def get_organizations(
+    client: CrunchbaseApi,
+    permalinks: Iterable[str],
+    *,
+    field_ids: list[str] | None = None,
+    card_ids: list[str] | None = None,
+    cache: ResponseCache | None = None,
+    max_workers: int = 8,
+) -> list[OrganizationLookup]:
+    """Look up many organizations, spending API calls only on what is not cached.
+
+    Permalinks are stripped and de-duplicated (first occurrence wins the output slot),
+    served from `cache` when a fresh entry exists for the same permalink/field_ids/card_ids,
+    and the rest are fetched over the shared `client` with at most `max_workers` requests
+    in flight. A failed lookup is reported in `error` instead of aborting the batch, and is
+    not cached.
+    """
+    unique = list(dict.fromkeys(p.strip() for p in permalinks if p and p.strip()))
+    results: dict[str, OrganizationLookup] = {}
+    todo: list[str] = []
+    for permalink in unique:
+        hit = cache.get(organization_cache_key(permalink, field_ids, card_ids)) if cache else None
+        if hit is not None:
+            results[permalink] = OrganizationLookup(permalink=permalink, entity=hit, cached=True)
+        else:
+            todo.append(permalink)
+
+    def fetch_one(permalink: str) -> OrganizationLookup:
+        try:
+            entity = get_organization(client, entity_id=permalink, field_ids=field_ids, card_ids=card_ids)
+        except Exception as exc:
+            return OrganizationLookup(permalink=permalink, entity=None, error=str(exc))
+        if cache is not None:
+            cache.put(organization_cache_key(permalink, field_ids, card_ids), entity)
+        return OrganizationLookup(permalink=permalink, entity=entity)
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(todo)))) as pool:
+            for lookup in pool.map(fetch_one, todo):
+                results[lookup.permalink] = lookup
+
+    return [results[p] for p in unique]
+
+
+def organization_cache_key(
+    permalink: str, field_ids: list[str] | None, card_ids: list[str] | None
+) -> str:
+    """Cache key for an organization lookup; field/card order does not matter."""
+    fields = ",".join(sorted(field_ids or []))
+    cards = ",".join(sorted(card_ids or []))
+    return f"organization:{permalink}?field_ids={fields}&card_ids={cards}"
+
+
 def search_funding_rounds(
     client: CrunchbaseApi,
     *,
@@ -41,6 +107,100 @@ def search_funding_rounds(
     money_raised_gte: int | None,
     currency: str = "usd",
     limit: int = 100,
+) -> dict[str, Any]:
+    body = _funding_rounds_body(
+        announced_on_gte=announced_on_gte,
+        money_raised_gte=money_raised_gte,
+        currency=currency,
+        limit=limit,
+    )
+    return client.post("/searches/funding_rounds", json_body=body)
+
+
+def iter_funding_round_pages(
+    client: CrunchbaseApi,
+    *,
+    announced_on_gte: str | None,
+    money_raised_gte: int | None,
+    currency: str = "usd",
+    page_size: int = 1000,
+    checkpoint: Path | None = None,
+    checkpoint_state: Callable[[], dict[str, Any]] | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield funding-round search results page by page, following `after_id`.
+
+    With `checkpoint`, the cursor is saved to that JSON file once the consumer has
+    finished with a page (i.e. when it asks for the next one), and a later call with the
+    same query resumes after the last finished page. The file is removed once the
+    search is exhausted. Delivery is at-least-once: a page interrupted mid-processing is
+    yielded again on resume.
+
+    `checkpoint_state` is called at each save (and once before the first page) and its
+    result is stored with the cursor; read it back with `load_checkpoint_state`. The CLI
+    keeps its output size there, so a resumed run can cut off a half-written page.
+    """
+    body = _funding_rounds_body(
+        announced_on_gte=announced_on_gte,
+        money_raised_gte=money_raised_gte,
+        currency=currency,
+        limit=page_size,
+    )
+    after_id = None
+    if checkpoint is not None:
+        after_id = _load_checkpoint(checkpoint, body)
+        if after_id is None and checkpoint_state is not None:
+            _save_checkpoint(checkpoint, body, None, checkpoint_state())
+
+    while True:
+        page_body = dict(body)
+        if after_id:
+            page_body["after_id"] = after_id
+        resp = client.post("/searches/funding_rounds", json_body=page_body)
+        entities = (((resp or {}).get("data") or {}).get("entities") or [])
+        if not entities:
+            break
+
+        yield entities
+
+        last_uuid = ((entities[-1].get("properties") or {}).get("identifier") or {}).get("uuid")
+        last_uuid = last_uuid or entities[-1].get("uuid")
+        if not last_uuid or len(entities) < body["limit"]:
+            break
+        after_id = str(last_uuid)
+        if checkpoint is not None:
+            _save_checkpoint(checkpoint, body, after_id, checkpoint_state() if checkpoint_state else None)
+
+    if checkpoint is not None:
+        checkpoint.unlink(missing_ok=True)
+
+
+def iter_funding_rounds(
+    client: CrunchbaseApi,
+    *,
+    announced_on_gte: str | None,
+    money_raised_gte: int | None,
+    currency: str = "usd",
+    page_size: int = 1000,
+    checkpoint: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Flat variant of `iter_funding_round_pages` (one raw entity at a time)."""
+    for page in iter_funding_round_pages(
+        client,
+        announced_on_gte=announced_on_gte,
+        money_raised_gte=money_raised_gte,
+        currency=currency,
+        page_size=page_size,
+        checkpoint=checkpoint,
+    ):
+        yield from page
+
+
+def _funding_rounds_body(
+    *,
+    announced_on_gte: str | None,
+    money_raised_gte: int | None,
+    currency: str,
+    limit: int,
 ) -> dict[str, Any]:
     query: list[dict[str, Any]] = []
     if announced_on_gte:
@@ -62,7 +222,7 @@ def search_funding_rounds(
             }
         )
 
-    body = {
+    return {
         "field_ids": [
             "identifier",
             "announced_on",
@@ -75,4 +235,39 @@ def search_funding_rounds(
         "limit": min(limit, 1000),
         "order": [{"field_id": "announced_on", "sort": "desc"}],
     }
-    return client.post("/searches/funding_rounds", json_body=body)
+
+
+def _load_checkpoint(path: Path, body: dict[str, Any]) -> str | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except ValueError as exc:
+        raise ValueError(f"Unreadable checkpoint file {path}: {exc}") from exc
+    if data.get("query") != body:
+        raise ValueError(
+            f"Checkpoint {path} belongs to a different search; remove it or use another path."
+        )
+    return data.get("after_id") or None
+
+
+def load_checkpoint_state(path: Path) -> dict[str, Any] | None:
+    """The `checkpoint_state` saved with the cursor in `path`, or None if there is none."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    state = data.get("state")
+    return state if isinstance(state, dict) else None
+
+
+def _save_checkpoint(
+    path: Path, body: dict[str, Any], after_id: str | None, state: dict[str, Any] | None = None
+) -> None:
+    data: dict[str, Any] = {"query": body, "after_id": after_id}
+    if state is not None:
+        data["state"] = state
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
@@ -32,49 +32,48 @@ def normalize_organization(entity: dict[str, Any]) -> InvestmentIntelItem:
 
 def normalize_funding_round_search_result(search_resp: dict[str, Any]) -> list[InvestmentIntelItem]:
     entities = (((search_resp or {}).get("data") or {}).get("entities") or [])
-    out: list[InvestmentIntelItem] = []
-    for e in entities:
-        props = (e.get("properties") or {})
-        ident = props.get("identifier") or {}
-        fr_name = ident.get("value")
-        fr_uuid = ident.get("uuid")
-        announced_on = props.get("announced_on")
-        published_at = None
-        if announced_on:
-            try:
-                published_at = datetime.fromisoformat(str(announced_on)).replace(tzinfo=timezone.utc)
-            except Exception:
-                published_at = None
+    return [normalize_funding_round_entity(e) for e in entities]
 
-        funded_org = props.get("funded_organization_identifier") or {}
-        funded_name = funded_org.get("value")
-        funded_permalink = funded_org.get("permalink")
-        url = (
-            f"https://www.crunchbase.com/organization/{funded_permalink}"
-            if funded_permalink
-            else None
-        )
 
-        money_raised = props.get("money_raised")
-        summary = None
-        if isinstance(money_raised, dict):
-            value = money_raised.get("value")
-            currency = money_raised.get("currency")
-            if value is not None and currency:
-                summary = f"Money raised: {value} {currency}"
+def normalize_funding_round_entity(e: dict[str, Any]) -> InvestmentIntelItem:
+    props = (e.get("properties") or {})
+    ident = props.get("identifier") or {}
+    fr_name = ident.get("value")
+    fr_uuid = ident.get("uuid")
+    announced_on = props.get("announced_on")
+    published_at = None
+    if announced_on:
+        try:
+            published_at = datetime.fromisoformat(str(announced_on)).replace(tzinfo=timezone.utc)
+        except Exception:
+            published_at = None
 
-        out.append(
-            InvestmentIntelItem(
-                source="crunchbase",
-                source_record_type="funding_round",
-                source_record_id=fr_uuid,
-                url=url,
-                title=(funded_name or fr_name),
-                summary=summary,
-                published_at=published_at,
-                entities=[f"ORG:{funded_name}"] if funded_name else [],
-                tags=["funding_round"],
-                raw=e,
-            )
-        )
-    return out
+    funded_org = props.get("funded_organization_identifier") or {}
+    funded_name = funded_org.get("value")
+    funded_permalink = funded_org.get("permalink")
+    url = (
+        f"https://www.crunchbase.com/organization/{funded_permalink}"
+        if funded_permalink
+        else None
+    )
+
+    money_raised = props.get("money_raised")
+    summary = None
+    if isinstance(money_raised, dict):
+        value = money_raised.get("value")
+        currency = money_raised.get("currency")
+        if value is not None and currency:
+            summary = f"Money raised: {value} {currency}"
+
+    return InvestmentIntelItem(
+        source="crunchbase",
+        source_record_type="funding_round",
+        source_record_id=fr_uuid,
+        url=url,
+        title=(funded_name or fr_name),
+        summary=summary,
+        published_at=published_at,
+        entities=[f"ORG:{funded_name}"] if funded_name else [],
+        tags=["funding_round"],
+        raw=e,
+    )
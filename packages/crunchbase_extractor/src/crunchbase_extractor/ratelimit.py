@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token-bucket rate limiter with one bucket per key (typically the request host).
+
+    Each key refills at `rate` tokens per second up to `burst`. `acquire()` blocks the
+    calling thread and `acquire_async()` suspends the calling task until a token is
+    available; both can be used on the same instance. Tokens are reserved up front, so
+    concurrent callers queue fairly instead of waking up together. Uses a monotonic clock.
+    """
+
+    def __init__(self, rate: float, *, burst: float = 1.0, clock=time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self._rate = float(rate)
+        self._burst = max(1.0, float(burst))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    @classmethod
+    def per_minute(cls, requests: float, *, burst: float = 1.0) -> "TokenBucket":
+        return cls(requests / 60.0, burst=burst)
+
+    def reserve(self, key: str = "", tokens: float = 1.0) -> float:
+        """Take `tokens` from `key`'s bucket and return how long to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            level, updated = self._buckets.get(key, (self._burst, now))
+            level = min(self._burst, level + (now - updated) * self._rate) - tokens
+            self._buckets[key] = (level, now)
+        return 0.0 if level >= 0 else -level / self._rate
+
+    def acquire(self, key: str = "", tokens: float = 1.0) -> None:
+        delay = self.reserve(key, tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, key: str = "", tokens: float = 1.0) -> None:
+        delay = self.reserve(key, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def host_key(url: str) -> str:
+    """Bucket key for a URL: its lower-cased host."""
+    return (urlsplit(url).hostname or "").lower()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import httpx
+
+from crunchbase_extractor.archive import ResponseArchive
+from crunchbase_extractor.client import CrunchbaseClient
+from crunchbase_extractor.config import CrunchbaseConfig
+from crunchbase_extractor.fetcher import get_organization
+
+
+def test_archive_never_stores_user_key_and_replays_keyless(tmp_path) -> None:
+    def live(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["user_key"] == "secret-key"
+        return httpx.Response(200, json={"properties": {"identifier": {"value": "Tesla"}}})
+
+    with ResponseArchive(tmp_path) as archive:
+        client = CrunchbaseClient(config=CrunchbaseConfig(user_key="secret-key"), archive=archive)
+        client._http = httpx.Client(transport=httpx.MockTransport(live))
+        with client:
+            live_entity = get_organization(client, entity_id="tesla", field_ids=["identifier"])
+
+    index = (tmp_path / "index.sqlite").read_bytes()
+    assert b"secret-key" not in index
+
+    with ResponseArchive(tmp_path, replay=True) as archive:
+        with CrunchbaseClient(config=CrunchbaseConfig(user_key=""), archive=archive) as client:
+            assert get_organization(client, entity_id="tesla", field_ids=["identifier"]) == live_entity
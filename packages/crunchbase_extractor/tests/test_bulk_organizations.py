@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+
+from crunchbase_extractor.cache import ResponseCache
+from crunchbase_extractor.fetcher import get_organizations
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, path: str, *, params: dict | None = None) -> dict:
+        with self._lock:
+            self.paths.append(path)
+        permalink = path.rsplit("/", 1)[-1]
+        if permalink == "broken":
+            raise RuntimeError("404")
+        return {"properties": {"identifier": {"permalink": permalink}}, "params": params}
+
+
+def test_get_organizations_dedups_and_serves_repeats_from_cache(tmp_path) -> None:
+    now = [1000.0]
+    cache = ResponseCache(tmp_path, ttl_s=60.0, clock=lambda: now[0])
+    client = _FakeClient()
+    kwargs = dict(field_ids=["website", "identifier"], card_ids=None, cache=cache, max_workers=4)
+
+    first = get_organizations(client, ["tesla", " openai", "tesla", "broken", "", "openai"], **kwargs)
+
+    assert [lk.permalink for lk in first] == ["tesla", "openai", "broken"]
+    assert sorted(client.paths) == sorted(
+        f"/entities/organizations/{p}" for p in ("tesla", "openai", "broken")
+    )
+    assert first[2].entity is None and first[2].error
+
+    client.paths.clear()
+    second = get_organizations(client, ["openai", "tesla", "broken"], **kwargs)
+    assert [lk.cached for lk in second] == [True, True, False]
+    assert client.paths == ["/entities/organizations/broken"]
+
+    # Field order does not change the key, but a different field set does.
+    client.paths.clear()
+    get_organizations(client, ["tesla"], **{**kwargs, "field_ids": ["identifier", "website"]})
+    assert client.paths == []
+    get_organizations(client, ["tesla"], **{**kwargs, "field_ids": ["identifier"]})
+    assert client.paths == ["/entities/organizations/tesla"]
+
+    now[0] += 61.0
+    client.paths.clear()
+    third = get_organizations(client, ["openai"], **kwargs)
+    assert third[0].cached is False
+    assert client.paths == ["/entities/organizations/openai"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from crunchbase_extractor.fetcher import iter_funding_round_pages, iter_funding_rounds
+
+
+def _entity(i: int) -> dict:
+    return {"properties": {"identifier": {"uuid": f"fr-{i}", "value": f"Round {i}"}}}
+
+
+class _FakeClient:
+    def __init__(self, total: int, *, fail_on_call: int | None = None) -> None:
+        self.total = total
+        self.fail_on_call = fail_on_call
+        self.bodies: list[dict] = []
+
+    def post(self, path: str, *, json_body: dict) -> dict:
+        self.bodies.append(json_body)
+        if self.fail_on_call is not None and len(self.bodies) == self.fail_on_call:
+            raise RuntimeError("boom")
+        start = 0
+        if "after_id" in json_body:
+            start = int(json_body["after_id"].split("-")[1]) + 1
+        ids = range(start, min(start + json_body["limit"], self.total))
+        return {"data": {"entities": [_entity(i) for i in ids]}}
+
+
+def test_iter_funding_rounds_follows_after_id() -> None:
+    client = _FakeClient(total=7)
+
+    uuids = [e["properties"]["identifier"]["uuid"] for e in iter_funding_rounds(
+        client, announced_on_gte="2024-01-01", money_raised_gte=None, page_size=3
+    )]
+
+    assert uuids == [f"fr-{i}" for i in range(7)]
+    assert [b.get("after_id") for b in client.bodies] == [None, "fr-2", "fr-5"]
+
+
+def test_checkpoint_resumes_after_last_finished_page(tmp_path) -> None:
+    ckpt = tmp_path / "ckpt.json"
+    kwargs = dict(announced_on_gte="2024-01-01", money_raised_gte=None, page_size=3, checkpoint=ckpt)
+
+    failing = _FakeClient(total=7, fail_on_call=3)
+    got: list[str] = []
+    with pytest.raises(RuntimeError):
+        for page in iter_funding_round_pages(failing, **kwargs):
+            got.extend(e["properties"]["identifier"]["uuid"] for e in page)
+    assert json.loads(ckpt.read_text())["after_id"] == "fr-5"
+
+    resumed = _FakeClient(total=7)
+    for page in iter_funding_round_pages(resumed, **kwargs):
+        got.extend(e["properties"]["identifier"]["uuid"] for e in page)
+
+    assert got == [f"fr-{i}" for i in range(7)]
+    assert resumed.bodies[0]["after_id"] == "fr-5"
+    assert not ckpt.exists()
+
+    ckpt.write_text(json.dumps({"query": {"other": True}, "after_id": "fr-1"}))
+    with pytest.raises(ValueError):
+        list(iter_funding_round_pages(_FakeClient(total=7), **kwargs))
+
+
+def test_resumed_cli_output_has_no_duplicates_or_torn_lines(tmp_path, monkeypatch) -> None:
+    import crunchbase_extractor.cli as cli_mod
+
+    out = tmp_path / "rounds.jsonl"
+    ckpt = tmp_path / "ckpt.json"
+
+    def run(client: _FakeClient) -> None:
+        cli_mod._emit_pages(
+            lambda state: iter_funding_round_pages(
+                client,
+                announced_on_gte="2024-01-01",
+                money_raised_gte=None,
+                page_size=3,
+                checkpoint=ckpt,
+                checkpoint_state=state,
+            ),
+            out,
+            append=False,
+            checkpoint=ckpt,
+        )
+
+    real_fsync = cli_mod.os.fsync
+    calls = []
+
+    def killed_on_second_page(fd: int) -> None:
+        calls.append(fd)
+        if len(calls) == 2:
+            # Page 2 is written, but the run dies before its cursor is saved, halfway
+            # through writing the next line.
+            with out.open("ab") as fh:
+                fh.write(b'{"source":"crunchbase","source_rec')
+            raise KeyboardInterrupt
+        real_fsync(fd)
+
+    monkeypatch.setattr(cli_mod.os, "fsync", killed_on_second_page)
+    with pytest.raises(KeyboardInterrupt):
+        run(_FakeClient(total=7))
+    monkeypatch.setattr(cli_mod.os, "fsync", real_fsync)
+
+    run(_FakeClient(total=7))
+
+    ids = [json.loads(line)["source_record_id"] for line in out.read_text(encoding="utf-8").splitlines()]
+    assert ids == [f"fr-{i}" for i in range(7)]
+    assert not ckpt.exists()
@@ -1,4 +1,4 @@
-from .extractor import CrunchbaseExtractor
+from .extractor import BatchOutcome, CrunchbaseExtractor, FileOutcome
 from .domain.models import (
     Company,
     ExtractionMethod,
@@ -11,6 +11,8 @@ from .domain.models import (
 
 __all__ = [
     "CrunchbaseExtractor",
+    "BatchOutcome",
+    "FileOutcome",
     "Company",
     "FundingRound",
     "Investor",
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+import glob
 import json
+import os
 from pathlib import Path
+from typing import Callable, Iterator
 
 import typer
 
 from .extractor import CrunchbaseExtractor
+from .infrastructure.archive import ResponseArchive
+from .infrastructure.stream_parser import StreamingOrgPageParser
 from .domain.errors import CrunchbaseIntelError, FetchError, InvalidInputError
 
 
@@ -23,6 +29,10 @@ def org_cmd(
     url: str | None = typer.Option(None, help="Crunchbase organization URL (public)", show_default=False),
     html_file: Path | None = typer.Option(None, exists=True, help="Parse from a saved HTML file"),
     min_delay_s: float = typer.Option(1.0, help="Minimum delay between HTTP requests"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record fetched pages to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve pages from --archive-dir; no network"),
 ) -> None:
     """Extract a Company record from a Crunchbase organization page.
 
@@ -33,7 +43,9 @@ def org_cmd(
         typer.echo("Provide exactly one of --url or --html-file.", err=True)
         raise typer.Exit(code=2)
 
-    extractor = CrunchbaseExtractor(min_delay_s=min_delay_s)
+    extractor = CrunchbaseExtractor(
+        min_delay_s=min_delay_s, archive=_open_archive(archive_dir, replay)
+    )
 
     try:
         if url is not None:
@@ -42,21 +54,7 @@ def org_cmd(
             assert html_file is not None
             result = extractor.extract_org_from_html_file(html_file, url=url)
     except CrunchbaseIntelError as exc:
-        payload: dict[str, object] = {
-            "ok": False,
-            "error": {
-                "type": exc.__class__.__name__,
-                "message": str(exc),
-            },
-        }
-        if isinstance(exc, FetchError):
-            payload["error"] = {
-                **payload["error"],
-                "kind": exc.kind,
-                "url": exc.url,
-                "status_code": exc.status_code,
-            }
-        typer.echo(json.dumps(payload, ensure_ascii=False, indent=2))
+        typer.echo(json.dumps(_error_payload(exc), ensure_ascii=False, indent=2))
         raise typer.Exit(code=2 if isinstance(exc, InvalidInputError) else 1)
     except Exception as exc:
         payload = {
@@ -69,3 +67,130 @@ def org_cmd(
     typer.echo(
         json.dumps({"ok": True, "result": result.model_dump(mode="json")}, ensure_ascii=False, indent=2)
     )
+
+
+@app.command("org-batch")
+def org_batch_cmd(
+    urls_file: Path = typer.Option(
+        ..., exists=True, dir_okay=False, help="File with one organization URL per line"
+    ),
+    out: Path | None = typer.Option(None, help="Write JSONL here instead of stdout"),
+    append: bool = typer.Option(False, help="Append to --out instead of overwriting it"),
+    min_delay_s: float = typer.Option(1.0, help="Minimum delay between HTTP requests"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record fetched pages to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve pages from --archive-dir; no network"),
+) -> None:
+    """Extract Company records from many organization URLs, one JSON line per URL.
+
+    Lines are written as each page completes, in the same envelope as `org`
+    (`{"ok": true, "result": ...}` or `{"ok": false, "error": ...}`). Exits 1 if any URL failed.
+    """
+    lines = urls_file.read_text(encoding="utf-8").splitlines()
+    urls = [ln.strip() for ln in lines if ln.strip() and not ln.lstrip().startswith("#")]
+    extractor = CrunchbaseExtractor(
+        min_delay_s=min_delay_s, archive=_open_archive(archive_dir, replay)
+    )
+
+    failed = False
+    with _jsonl_sink(out, append=append) as emit:
+        for outcome in extractor.extract_many(urls):
+            if outcome.error is not None:
+                failed = True
+                payload = _error_payload(outcome.error)
+                if payload["error"].get("url") is None:
+                    payload["error"]["url"] = outcome.url
+            else:
+                assert outcome.result is not None
+                payload = {"ok": True, "result": outcome.result.model_dump(mode="json")}
+            emit(payload)
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("org-files")
+def org_files_cmd(
+    input_spec: str = typer.Option(
+        ..., "--input", help="Directory of saved .html/.htm pages (searched recursively), or a glob"
+    ),
+    out: Path | None = typer.Option(None, help="Write JSONL here instead of stdout"),
+    append: bool = typer.Option(False, help="Append to --out instead of overwriting it"),
+    processes: int = typer.Option(
+        os.cpu_count() or 1, min=1, help="Worker processes (1 parses in this process)"
+    ),
+    chunksize: int = typer.Option(16, min=1, help="Files handed to a worker at a time"),
+) -> None:
+    """Parse many saved organization pages in parallel, one JSON line per file.
+
+    Files are processed in sorted path order and each line carries the file's `path`;
+    unreadable or unparsable files get an `{"ok": false, ...}` line. Exits 1 if any file
+    failed, 2 if nothing matched.
+    """
+    paths = _snapshot_paths(input_spec)
+    if not paths:
+        typer.echo(f"No HTML files match {input_spec!r}.", err=True)
+        raise typer.Exit(code=2)
+
+    extractor = CrunchbaseExtractor(parser=StreamingOrgPageParser())
+    failed = False
+    with _jsonl_sink(out, append=append) as emit:
+        for outcome in extractor.extract_many_from_html_files(
+            paths, processes=processes, chunksize=chunksize
+        ):
+            if outcome.error is not None:
+                failed = True
+                payload = _error_payload(outcome.error)
+            else:
+                assert outcome.result is not None
+                payload = {"ok": True, "result": outcome.result.model_dump(mode="json")}
+            emit({"path": str(outcome.path), **payload})
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _snapshot_paths(spec: str) -> list[Path]:
+    root = Path(spec)
+    if root.is_dir():
+        found = [
+            p for p in root.rglob("*") if p.suffix.lower() in (".html", ".htm") and p.is_file()
+        ]
+    elif root.is_file():
+        found = [root]
+    else:
+        found = [Path(p) for p in glob.glob(spec, recursive=True) if Path(p).is_file()]
+    return sorted(found)
+
+
+@contextmanager
+def _jsonl_sink(out: Path | None, *, append: bool) -> Iterator[Callable[[dict], None]]:
+    """Yield a callable writing one compact JSON line, flushed so progress is visible."""
+    if out is None:
+        yield lambda payload: typer.echo(json.dumps(payload, ensure_ascii=False))
+        return
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("a" if append else "w", encoding="utf-8") as fh:
+
+        def emit(payload: dict) -> None:
+            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            fh.flush()
+
+        yield emit
+
+
+def _open_archive(archive_dir: Path | None, replay: bool) -> ResponseArchive | None:
+    if archive_dir is None:
+        if replay:
+            typer.echo("--replay requires --archive-dir.", err=True)
+            raise typer.Exit(code=2)
+        return None
+    return ResponseArchive(archive_dir, replay=replay)
+
+
+def _error_payload(exc: Exception) -> dict:
+    error: dict[str, object] = {"type": exc.__class__.__name__, "message": str(exc)}
+    if isinstance(exc, FetchError):
+        error.update({"kind": exc.kind, "url": exc.url, "status_code": exc.status_code})
+    return {"ok": False, "error": error}
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Iterable, Iterator, Sequence
 
 from .application.use_cases import ExtractOrganization
+from .domain.errors import FetchError
 from .domain.models import ExtractionResult
+from .infrastructure.archive import ResponseArchive
 from .infrastructure.bs4_parser import PublicOrgPageParser
 from .infrastructure.http_fetcher import PoliteHttpFetcher
+from .ports import CompanyPageParser
 
 
 class CrunchbaseExtractor:
@@ -22,20 +29,96 @@ class CrunchbaseExtractor:
         *,
         min_delay_s: float = 1.0,
         user_agent: str = "crunchbase-intel/0.1.0 (academic; minimal)",
+        parser: CompanyPageParser | None = None,
+        archive: ResponseArchive | None = None,
     ) -> None:
         self._min_delay_s = min_delay_s
         self._user_agent = user_agent
+        # e.g. StreamingOrgPageParser() for bulk work; output is the same.
+        self._parser = parser or PublicOrgPageParser()
+        self._archive = archive
 
     def extract_org_from_url(self, url: str) -> ExtractionResult:
-        with PoliteHttpFetcher(user_agent=self._user_agent, min_delay_s=self._min_delay_s) as fetcher:
-            use_case = ExtractOrganization(fetcher=fetcher, parser=PublicOrgPageParser())
+        with self._fetcher() as fetcher:
+            use_case = ExtractOrganization(fetcher=fetcher, parser=self._parser)
             return use_case.from_url(url)
 
+    def extract_many(self, urls: Iterable[str]) -> Iterator[BatchOutcome]:
+        """Extract organizations from many URLs, yielding each outcome as it completes.
+
+        One fetcher (and so one connection pool) is shared by the whole batch, and
+        requests are still spaced by `min_delay_s`. Any per-URL failure, including an
+        unexpected parser error, is yielded as an outcome with `error` set; only a
+        rate-limit response (HTTP 429) ends the batch after it is reported, since
+        continuing would only hammer the site.
+        """
+        with self._fetcher() as fetcher:
+            use_case = ExtractOrganization(fetcher=fetcher, parser=self._parser)
+            for url in urls:
+                try:
+                    yield BatchOutcome(url=url, result=use_case.from_url(url))
+                except Exception as exc:
+                    yield BatchOutcome(url=url, error=exc)
+                    if isinstance(exc, FetchError) and exc.kind == "rate_limited":
+                        return
+
+    def _fetcher(self) -> PoliteHttpFetcher:
+        return PoliteHttpFetcher(
+            user_agent=self._user_agent, min_delay_s=self._min_delay_s, archive=self._archive
+        )
+
     def extract_org_from_html_file(self, path: Path, *, url: str | None = None) -> ExtractionResult:
         # No fetcher needed for local HTML.
-        use_case = ExtractOrganization(fetcher=_NoopFetcher(), parser=PublicOrgPageParser())
+        use_case = ExtractOrganization(fetcher=_NoopFetcher(), parser=self._parser)
         return use_case.from_html_file(path, url=url)
 
+    def extract_many_from_html_files(
+        self,
+        paths: Sequence[Path],
+        *,
+        processes: int | None = None,
+        chunksize: int = 16,
+    ) -> Iterator[FileOutcome]:
+        """Parse many saved HTML snapshots, yielding one outcome per path in input order.
+
+        With `processes` > 1 the files are parsed across a process pool (in chunks of
+        `chunksize`); outcomes are still yielded in the order of `paths` as soon as each
+        one is ready. A file that cannot be read or parsed yields an outcome with `error`
+        set instead of aborting the run.
+        """
+        work = partial(_parse_snapshot, self._parser)
+        if not processes or processes <= 1 or len(paths) <= chunksize:
+            yield from map(work, paths)
+            return
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            yield from pool.map(work, paths, chunksize=max(1, chunksize))
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    """One URL's result from `CrunchbaseExtractor.extract_many`: a result or an error."""
+
+    url: str
+    result: ExtractionResult | None = None
+    error: Exception | None = None
+
+
+@dataclass(frozen=True)
+class FileOutcome:
+    """One snapshot's result from `CrunchbaseExtractor.extract_many_from_html_files`."""
+
+    path: Path
+    result: ExtractionResult | None = None
+    error: Exception | None = None
+
+
+def _parse_snapshot(parser: CompanyPageParser, path: Path) -> FileOutcome:
+    use_case = ExtractOrganization(fetcher=_NoopFetcher(), parser=parser)
+    try:
+        return FileOutcome(path=path, result=use_case.from_html_file(path))
+    except Exception as exc:
+        return FileOutcome(path=path, error=exc)
+
 
 class _NoopFetcher:
     def get_text(self, url: str) -> str:  # pragma: no cover
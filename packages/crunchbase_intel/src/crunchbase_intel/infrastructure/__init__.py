@@ -1,6 +1,15 @@
 """Infrastructure layer: HTTP and HTML parsing implementations."""
 
+from .archive import ResponseArchive
 from .bs4_parser import PublicOrgPageParser
 from .http_fetcher import PoliteHttpFetcher
+from .ratelimit import TokenBucket
+from .stream_parser import StreamingOrgPageParser
 
-__all__ = ["PublicOrgPageParser", "PoliteHttpFetcher"]
+__all__ = [
+    "PublicOrgPageParser",
+    "PoliteHttpFetcher",
+    "ResponseArchive",
+    "StreamingOrgPageParser",
+    "TokenBucket",
+]
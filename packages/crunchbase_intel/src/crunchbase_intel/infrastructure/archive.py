@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+# Response headers kept alongside the body; enough to rebuild `.text` / `.json()` and
+# conditional-GET validators on replay.
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+class ArchiveMissError(LookupError):
+    """Raised in replay mode when a request has no archived response."""
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    key: str
+    method: str
+    url: str
+    status: int
+    headers: dict[str, str]
+    sha256: str
+    size: int
+    fetched_at: float
+
+
+class ResponseArchive:
+    """Content-addressed, gzip-compressed store of raw HTTP response bodies.
+
+    Layout under `directory`:
+    - `objects/<2 hex>/<sha256>.gz`: each distinct body once, named by its SHA-256.
+    - `index.sqlite`: one row per recorded response (request key, URL, status, kept
+      headers, body digest, fetch time), indexed by key and by URL + time.
+
+    Clients given an archive record every successful response. With `replay=True` they
+    serve responses from the archive instead and never touch the network; `as_of`
+    (Unix time) replays the latest response recorded at or before that moment.
+    Request keys never include credentials.
+    """
+
+    def __init__(
+        self, directory: Path, *, replay: bool = False, as_of: float | None = None
+    ) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self.replay = replay
+        self._as_of = as_of
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._dir / "index.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "id INTEGER PRIMARY KEY, key TEXT NOT NULL, method TEXT NOT NULL, url TEXT NOT NULL, "
+            "status INTEGER NOT NULL, headers TEXT NOT NULL, sha256 TEXT NOT NULL, "
+            "size INTEGER NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_key ON responses (key, fetched_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_url ON responses (url, fetched_at)"
+        )
+        self._conn.commit()
+
+    def record(self, key: str, resp: httpx.Response) -> ArchiveEntry:
+        body = resp.content
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(body, mtime=0))
+            os.replace(tmp, path)
+
+        entry = ArchiveEntry(
+            key=key,
+            method=resp.request.method,
+            url=_strip_query(str(resp.request.url)),
+            status=resp.status_code,
+            headers={h: resp.headers[h] for h in _KEPT_HEADERS if h in resp.headers},
+            sha256=digest,
+            size=len(body),
+            fetched_at=time.time(),
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO responses "
+                "(key, method, url, status, headers, sha256, size, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.method,
+                    entry.url,
+                    entry.status,
+                    json.dumps(entry.headers),
+                    entry.sha256,
+                    entry.size,
+                    entry.fetched_at,
+                ),
+            )
+        return entry
+
+    def lookup(self, key: str) -> ArchiveEntry | None:
+        """Latest entry for `key` (at or before `as_of`, if set)."""
+        sql = (
+            "SELECT key, method, url, status, headers, sha256, size, fetched_at "
+            "FROM responses WHERE key = ?"
+        )
+        args: list[Any] = [key]
+        if self._as_of is not None:
+            sql += " AND fetched_at <= ?"
+            args.append(self._as_of)
+        sql += " ORDER BY fetched_at DESC, id DESC LIMIT 1"
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        return _entry(row) if row else None
+
+    def history(self, url: str) -> list[ArchiveEntry]:
+        """All recorded responses for `url` (query string ignored), oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, method, url, status, headers, sha256, size, fetched_at FROM responses "
+                "WHERE url = ? ORDER BY fetched_at, id",
+                (_strip_query(url),),
+            ).fetchall()
+        return [_entry(r) for r in rows]
+
+    def read_body(self, sha256: str) -> bytes:
+        return gzip.decompress(self._object_path(sha256).read_bytes())
+
+    def replay_response(self, key: str, *, method: str, url: str) -> httpx.Response:
+        """Rebuild the archived response for `key` as an `httpx.Response`."""
+        entry = self.lookup(key)
+        if entry is None:
+            raise ArchiveMissError(f"No archived response for {key}")
+        return httpx.Response(
+            entry.status,
+            headers=entry.headers,
+            content=self.read_body(entry.sha256),
+            request=httpx.Request(method, url),
+        )
+
+    def _object_path(self, sha256: str) -> Path:
+        return self._dir / "objects" / sha256[:2] / f"{sha256}.gz"
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def request_key(
+    method: str,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    json_body: Any = None,
+) -> str:
+    """Stable identity of a request: method, URL, sorted params and (hashed) JSON body.
+
+    Callers pass only non-secret params (API keys and auth headers stay out).
+    """
+    key = f"{method.upper()} {url}"
+    if params:
+        query = urlencode(sorted((k, str(v)) for k, v in params.items()))
+        key += ("&" if "?" in url else "?") + query
+    if json_body is not None:
+        encoded = json.dumps(json_body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        key += " body=" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return key
+
+
+def _strip_query(url: str) -> str:
+    # Query strings can carry credentials (e.g. Crunchbase `user_key`); never index them.
+    return url.split("?", 1)[0]
+
+
+def _entry(row: tuple) -> ArchiveEntry:
+    key, method, url, status, headers, sha256, size, fetched_at = row
+    return ArchiveEntry(
+        key=key,
+        method=method,
+        url=url,
+        status=int(status),
+        headers=json.loads(headers),
+        sha256=sha256,
+        size=int(size),
+        fetched_at=float(fetched_at),
+    )
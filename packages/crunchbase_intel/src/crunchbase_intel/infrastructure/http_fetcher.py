@@ -5,6 +5,8 @@ import time
 import httpx
 
 from ..domain.errors import FetchError
+from .archive import ArchiveMissError, ResponseArchive, request_key
+from .ratelimit import TokenBucket, host_key
 
 
 class PoliteHttpFetcher:
@@ -12,8 +14,12 @@ class PoliteHttpFetcher:
 
     This is intentionally conservative:
     - single request at a time
-    - minimum delay between requests
+    - minimum delay from the end of one response to the start of the next request
+      (`min_delay_s`), so slow pages never shrink the gap
+    - optional shared `rate_limiter` (token bucket) on top, to cap the request rate across
+      several fetchers; both limits apply
     - no cookies, no authenticated sessions
+    - optional `archive`: record every page fetched, or replay pages with no network
     """
 
     def __init__(
@@ -22,6 +28,8 @@ class PoliteHttpFetcher:
         timeout_s: float = 30.0,
         user_agent: str = "crunchbase-intel/0.1.0 (academic; minimal)",
         min_delay_s: float = 1.0,
+        rate_limiter: TokenBucket | None = None,
+        archive: ResponseArchive | None = None,
     ) -> None:
         self._client = httpx.Client(
             timeout=timeout_s,
@@ -29,37 +37,32 @@ class PoliteHttpFetcher:
             follow_redirects=True,
         )
         self._min_delay_s = max(0.0, float(min_delay_s))
-        self._last_request_t: float | None = None
+        self._last_done_t: float | None = None
+        self._rate_limiter = rate_limiter
+        self._archive = archive
 
     def get_text(self, url: str) -> str:
-        now = time.time()
-        if self._last_request_t is not None:
-            sleep_for = self._min_delay_s - (now - self._last_request_t)
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-
-        try:
-            resp = self._client.get(url)
-        except httpx.RequestError as exc:
-            raise FetchError(
-                f"Network error fetching {url}: {exc}",
-                url=url,
-                status_code=None,
-                kind="network_error",
-            ) from exc
-        finally:
-            self._last_request_t = time.time()
+        key = request_key("GET", url)
+        if self._archive is not None and self._archive.replay:
+            try:
+                resp = self._archive.replay_response(key, method="GET", url=url)
+            except ArchiveMissError as exc:
+                raise FetchError(str(exc), url=url, status_code=None, kind="not_archived") from exc
+        else:
+            resp = self._fetch(url)
 
         if resp.status_code in (401, 403):
             raise FetchError(
-                f"Access denied fetching {url} (HTTP {resp.status_code}). Public access may be restricted.",
+                f"Access denied fetching {url} (HTTP {resp.status_code}). "
+                "Public access may be restricted.",
                 url=url,
                 status_code=resp.status_code,
                 kind="access_denied",
             )
         if resp.status_code == 429:
             raise FetchError(
-                f"Rate limited fetching {url} (HTTP 429). Try again later; do not increase request rate.",
+                f"Rate limited fetching {url} (HTTP 429). "
+                "Try again later; do not increase request rate.",
                 url=url,
                 status_code=429,
                 kind="rate_limited",
@@ -83,8 +86,29 @@ class PoliteHttpFetcher:
                 status_code=resp.status_code,
                 kind="empty_response",
             )
+        if self._archive is not None and not self._archive.replay:
+            self._archive.record(key, resp)
         return text
 
+    def _fetch(self, url: str) -> httpx.Response:
+        if self._last_done_t is not None:
+            sleep_for = self._min_delay_s - (time.monotonic() - self._last_done_t)
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(host_key(url))
+        try:
+            return self._client.get(url)
+        except httpx.RequestError as exc:
+            raise FetchError(
+                f"Network error fetching {url}: {exc}",
+                url=url,
+                status_code=None,
+                kind="network_error",
+            ) from exc
+        finally:
+            self._last_done_t = time.monotonic()
+
     def close(self) -> None:
         self._client.close()
 
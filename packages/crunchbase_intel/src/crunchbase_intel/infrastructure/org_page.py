@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Iterable
+
+from ..domain.models import Company, UnavailableField
+
+JSONLD_TYPE = "application/ld+json"
+ORG_TYPES = ("Organization", "Corporation", "Company")
+
+
+def build_company(
+    *,
+    url: str | None,
+    jsonld_texts: Iterable[str],
+    og: Callable[[str], str | None],
+) -> tuple[Company, list[UnavailableField], dict[str, Any]]:
+    """Shared field policy for organization pages, independent of the HTML backend.
+
+    `jsonld_texts` are the contents of `<script type="application/ld+json">` tags in
+    document order; `og(key)` returns the stripped `content` of the first
+    `<meta property=key>` tag, or None.
+    """
+    raw: dict[str, Any] = {}
+    unavailable: list[UnavailableField] = []
+
+    company = Company(name=None, crunchbase_url=url, description=None, categories=[])
+
+    ld_json = select_jsonld(jsonld_texts)
+    if ld_json is not None:
+        raw["jsonld"] = ld_json
+        company = apply_jsonld(company, ld_json)
+
+    # Meta fallback for name/description if JSON-LD is absent.
+    if company.name is None:
+        og_title = og("og:title")
+        if og_title:
+            company.name = og_title
+
+    if company.description is None:
+        og_desc = og("og:description")
+        if og_desc:
+            company.description = og_desc
+
+    unavailable.extend(
+        [
+            UnavailableField(
+                field="funding_rounds",
+                reason=(
+                    "Funding rounds are not reliably available from public HTML "
+                    "without paid/API access."
+                ),
+            ),
+            UnavailableField(
+                field="investors",
+                reason=(
+                    "Investor lists are not reliably available from public HTML "
+                    "without paid/API access."
+                ),
+            ),
+            UnavailableField(
+                field="people_roles",
+                reason="People/role data is typically not available without paid/API access.",
+            ),
+        ]
+    )
+
+    if company.name is None:
+        unavailable.append(
+            UnavailableField(
+                field="company.name",
+                reason=(
+                    "Company name not found in structured markup or meta tags "
+                    "(page may be blocked or not an org page)."
+                ),
+            )
+        )
+
+    return company, unavailable, raw
+
+
+def select_jsonld(texts: Iterable[str]) -> dict[str, Any] | None:
+    for text in texts:
+        data = parse_jsonld(text)
+        if data is None:
+            continue
+
+        if data.get("@type") in ORG_TYPES:
+            return data
+
+        graph = data.get("@graph")
+        if isinstance(graph, list):
+            for item in graph:
+                if isinstance(item, dict) and item.get("@type") in ORG_TYPES:
+                    return item
+
+        return data
+
+    return None
+
+
+def parse_jsonld(text: str) -> dict[str, Any] | None:
+    """Decode one JSON-LD script body; None if it is empty, invalid, or not an object."""
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        data = json.loads(text)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def apply_jsonld(company: Company, data: dict[str, Any]) -> Company:
+    if not isinstance(data, dict):
+        return company
+
+    name = data.get("name")
+    url = data.get("url")
+    desc = data.get("description")
+
+    if isinstance(name, str) and name.strip():
+        company.name = name.strip()
+    if isinstance(url, str) and url.strip() and company.crunchbase_url is None:
+        company.crunchbase_url = url.strip()
+    if isinstance(desc, str) and desc.strip():
+        company.description = desc.strip()
+
+    return company
+
+
+def clean_meta_content(val: object) -> str | None:
+    if not isinstance(val, str):
+        return None
+    val2 = val.strip()
+    return val2 or None
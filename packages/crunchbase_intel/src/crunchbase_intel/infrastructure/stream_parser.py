@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Any
+
+from ..domain.errors import ParseError
+from ..domain.models import Company, UnavailableField
+from .org_page import JSONLD_TYPE, build_company, clean_meta_content, select_jsonld
+
+_OG_KEYS = ("og:title", "og:description")
+_CHUNK = 64 * 1024
+
+
+class StreamingOrgPageParser:
+    """Drop-in alternative to `PublicOrgPageParser` that never builds a DOM.
+
+    Tokenizes with the same stdlib `html.parser` that BeautifulSoup's "html.parser"
+    backend uses, keeps only JSON-LD script bodies and the first `og:title` /
+    `og:description` meta tags, and stops reading as soon as nothing later in the
+    document can change the result. Output is identical to `PublicOrgPageParser`.
+    """
+
+    def parse_company(
+        self, html: str, *, url: str | None
+    ) -> tuple[Company, list[UnavailableField], dict[str, Any]]:
+        scanner = _OrgPageScanner()
+        try:
+            scanner.scan(html or "")
+        except Exception as exc:
+            raise ParseError(f"Failed to parse HTML: {exc}") from exc
+
+        return build_company(
+            url=url,
+            jsonld_texts=scanner.jsonld_texts,
+            og=lambda key: clean_meta_content(scanner.meta.get(key)),
+        )
+
+
+class _Done(Exception):
+    pass
+
+
+class _OrgPageScanner(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.jsonld_texts: list[str] = []
+        self.meta: dict[str, str] = {}
+        self._jsonld: dict[str, Any] | None = None
+        self._script: list[str] | None = None
+
+    def scan(self, html: str) -> None:
+        try:
+            for i in range(0, len(html), _CHUNK):
+                self.feed(html[i : i + _CHUNK])
+            self.close()
+        except _Done:
+            return
+        self._end_script()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script":
+            if dict(attrs).get("type") == JSONLD_TYPE:
+                self._script = []
+        elif tag == "meta":
+            a = dict(attrs)
+            key = a.get("property")
+            if key in _OG_KEYS and key not in self.meta:
+                # Valueless attributes read as "" in BeautifulSoup, so match that.
+                self.meta[key] = a.get("content") or ""
+                self._check_done()
+
+    def handle_data(self, data: str) -> None:
+        if self._script is not None:
+            self._script.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            self._end_script()
+
+    def _end_script(self) -> None:
+        if self._script is None:
+            return
+        text = "".join(self._script)
+        self._script = None
+        self.jsonld_texts.append(text)
+        if self._jsonld is None:
+            self._jsonld = select_jsonld([text])
+        self._check_done()
+
+    def _check_done(self) -> None:
+        # The first JSON-LD object decides `raw`; og tags only matter for the fields
+        # it does not fill, so stop once those are known.
+        data = self._jsonld
+        if data is None:
+            return
+        for key, field in (("og:title", "name"), ("og:description", "description")):
+            value = data.get(field)
+            if key not in self.meta and not (isinstance(value, str) and value.strip()):
+                return
+        raise _Done
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from crunchbase_intel.cli import app
+from crunchbase_intel.extractor import CrunchbaseExtractor
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _snapshot_dir(tmp_path: Path) -> Path:
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    html = (FIXTURES / "org_minimal_jsonld.html").read_text(encoding="utf-8")
+    for i in range(6):
+        page = html.replace("Crunchbase", f"Org {i}")
+        (tmp_path / f"org-{i}.html").write_text(page, encoding="utf-8")
+    (tmp_path / "org-3.html").write_bytes(b"\xff\xfe not utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    return tmp_path
+
+
+def test_bulk_snapshots_keep_order_and_report_bad_files(tmp_path) -> None:
+    paths = sorted(_snapshot_dir(tmp_path).glob("*.html"))
+
+    outcomes = list(
+        CrunchbaseExtractor().extract_many_from_html_files(paths, processes=2, chunksize=1)
+    )
+
+    assert [o.path for o in outcomes] == paths
+    assert [o.result.company.name if o.result else None for o in outcomes] == [
+        "Org 0", "Org 1", "Org 2", None, "Org 4", "Org 5"
+    ]
+    assert isinstance(outcomes[3].error, UnicodeDecodeError)
+
+
+def test_org_files_cli_streams_jsonl(tmp_path) -> None:
+    snapshots = _snapshot_dir(tmp_path / "snaps")
+    out = tmp_path / "out.jsonl"
+
+    result = CliRunner(mix_stderr=False).invoke(
+        app, ["org-files", "--input", str(snapshots), "--out", str(out), "--processes", "1"]
+    )
+
+    assert result.exit_code == 1
+    lines = [json.loads(ln) for ln in out.read_text(encoding="utf-8").splitlines()]
+    assert [Path(ln["path"]).name for ln in lines] == [f"org-{i}.html" for i in range(6)]
+    assert [ln["ok"] for ln in lines] == [True, True, True, False, True, True]
+    assert lines[3]["error"]["type"] == "UnicodeDecodeError"
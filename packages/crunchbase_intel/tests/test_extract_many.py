@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import crunchbase_intel.extractor as extractor_mod
+from crunchbase_intel.domain.errors import FetchError
+from crunchbase_intel.extractor import CrunchbaseExtractor
+
+FIXTURE = (Path(__file__).parent / "fixtures" / "org_minimal_jsonld.html").read_text(
+    encoding="utf-8"
+)
+
+
+class _FakeFetcher:
+    instances = 0
+
+    def __init__(self, **kwargs) -> None:
+        type(self).instances += 1
+        self.kwargs = kwargs
+
+    def get_text(self, url: str) -> str:
+        if url.endswith("/blocked"):
+            raise FetchError("denied", url=url, status_code=403, kind="access_denied")
+        if url.endswith("/boom"):
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+        if url.endswith("/slow-down"):
+            raise FetchError("429", url=url, status_code=429, kind="rate_limited")
+        return FIXTURE
+
+    def __enter__(self) -> "_FakeFetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+def test_extract_many_shares_one_fetcher_and_reports_per_url_errors(monkeypatch) -> None:
+    monkeypatch.setattr(extractor_mod, "PoliteHttpFetcher", _FakeFetcher)
+    base = "https://www.crunchbase.com/organization/"
+    urls = [base + "a", "https://example.com/not-crunchbase", base + "blocked", base + "boom",
+            base + "b", base + "slow-down", base + "never-fetched"]
+
+    outcomes = list(CrunchbaseExtractor(min_delay_s=0.0).extract_many(urls))
+
+    assert _FakeFetcher.instances == 1
+    assert [o.url for o in outcomes] == urls[:6]
+    assert [o.result is not None for o in outcomes] == [True, False, False, False, True, False]
+    assert outcomes[2].error.kind == "access_denied"
+    # Unexpected errors are reported for that URL and the batch carries on.
+    assert isinstance(outcomes[3].error, UnicodeDecodeError)
+    assert outcomes[5].error.kind == "rate_limited"
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import httpx
+
+import crunchbase_intel.infrastructure.http_fetcher as fetcher_mod
+from crunchbase_intel.infrastructure.http_fetcher import PoliteHttpFetcher
+from crunchbase_intel.infrastructure.ratelimit import TokenBucket
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.t = 100.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.t
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.t += seconds
+
+
+def _fetcher(fake: _FakeTime, response_s: float, **kwargs) -> PoliteHttpFetcher:
+    def handler(request: httpx.Request) -> httpx.Response:
+        fake.t += response_s  # slow page
+        return httpx.Response(200, text="<html>ok</html>")
+
+    fetcher = PoliteHttpFetcher(**kwargs)
+    fetcher._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+def test_min_delay_is_measured_from_end_of_previous_response(monkeypatch) -> None:
+    fake = _FakeTime()
+    monkeypatch.setattr(fetcher_mod, "time", fake)
+
+    with _fetcher(fake, response_s=5.0, min_delay_s=2.0) as fetcher:
+        for _ in range(3):
+            fetcher.get_text("https://www.crunchbase.com/organization/a")
+
+    # Pages take longer than min_delay_s, but the polite gap is still kept.
+    assert fake.slept == [2.0, 2.0]
+
+
+def test_shared_rate_limiter_applies_on_top_of_min_delay(monkeypatch) -> None:
+    fake = _FakeTime()
+    monkeypatch.setattr(fetcher_mod, "time", fake)
+    limiter = TokenBucket(1.0, burst=1, clock=fake.monotonic)
+    acquired: list[str] = []
+    monkeypatch.setattr(limiter, "acquire", lambda key, tokens=1.0: acquired.append(key))
+
+    with _fetcher(fake, response_s=0.0, min_delay_s=1.0, rate_limiter=limiter) as fetcher:
+        fetcher.get_text("https://www.crunchbase.com/organization/a")
+        fetcher.get_text("https://www.crunchbase.com/organization/b")
+
+    assert fake.slept == [1.0]
+    assert acquired == ["www.crunchbase.com", "www.crunchbase.com"]
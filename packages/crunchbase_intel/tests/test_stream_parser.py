@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from crunchbase_intel.infrastructure.bs4_parser import PublicOrgPageParser
+from crunchbase_intel.infrastructure.stream_parser import StreamingOrgPageParser
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+CASES = [
+    (FIXTURES / "org_minimal_jsonld.html").read_text(encoding="utf-8"),
+    (FIXTURES / "blank.html").read_text(encoding="utf-8"),
+    # Non-object and invalid JSON-LD are skipped; @graph items are searched.
+    '<script type="application/ld+json">[1]</script>'
+    '<script type="application/ld+json">oops</script>'
+    '<script type="application/ld+json">{"@graph": [{"@type": "Company", "name": " G "}]}</script>'
+    '<meta property="og:description" content="D &amp; more">',
+    # Only the first og tag counts, even when empty; markup inside scripts is ignored.
+    '<script>"<meta property=\\"og:title\\" content=\\"no\\">"</script>'
+    '<meta property="og:title" content=""><meta property="og:title" content="later">',
+    '<meta property="og:title" content="Meta only">' + "<p>filler</p>" * 20000,
+]
+
+
+@pytest.mark.parametrize("html", CASES)
+def test_streaming_parser_matches_bs4(html: str) -> None:
+    url = "https://www.crunchbase.com/organization/crunchbase"
+    expected = PublicOrgPageParser().parse_company(html, url=url)
+    got = StreamingOrgPageParser().parse_company(html, url=url)
+
+    assert got[0].model_dump() == expected[0].model_dump()
+    assert [u.model_dump() for u in got[1]] == [u.model_dump() for u in expected[1]]
+    assert got[2] == expected[2]
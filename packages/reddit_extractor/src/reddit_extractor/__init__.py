@@ -1,5 +1,10 @@
 __all__ = [
+    "archive",
     "client",
+    "columnar",
+    "async_client",
     "fetcher",
     "normalizer",
+    "ratelimit",
+    "state",
 ]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+
+from .archive import ResponseArchive, request_key
+from .client import RedditApiError, RedditAuthError, _safe_detail, _to_float
+from .config import RedditAuthConfig
+from .ports import RateLimitInfo
+from .ratelimit import TokenBucket, host_key
+
+
+class AsyncRedditClient:
+    """Async Reddit OAuth client for fanning out over many subreddits/queries.
+
+    Same `get_json` contract as `RedditClient`, but awaitable. All requests share one
+    connection pool, at most `max_concurrency` are in flight, and requests are paced
+    from `X-Ratelimit-Remaining` / `X-Ratelimit-Reset` so the quota is spread over the
+    window instead of running into 429s. An optional shared `rate_limiter` adds a fixed
+    per-host ceiling on top of that. With an `archive`, listing responses are recorded,
+    or in replay mode served from it without credentials or network, as in `RedditClient`.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: RedditAuthConfig | None = None,
+        access_token: str | None = None,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        refresh_token: str | None = None,
+        user_agent: str | None = None,
+        timeout_s: float = 30.0,
+        max_retries: int = 2,
+        max_concurrency: int = 8,
+        rate_limiter: TokenBucket | None = None,
+        archive: ResponseArchive | None = None,
+    ) -> None:
+        if config is None:
+            config = RedditAuthConfig.from_env()
+
+        self._access_token = access_token or config.access_token
+        self._client_id = client_id or config.client_id
+        self._client_secret = client_secret or config.client_secret
+        self._refresh_token = refresh_token or config.refresh_token
+        self._user_agent = user_agent or config.user_agent
+        self._max_retries = max(0, int(max_retries))
+        self._rate_limiter = rate_limiter
+        self._archive = archive
+
+        if not self._user_agent:
+            raise RedditAuthError(
+                "Missing Reddit User-Agent. Set REDDIT_USER_AGENT to a unique value like "
+                "'<platform>:<app id>:<version> (by /u/<username>)'."
+            )
+
+        concurrency = max(1, int(max_concurrency))
+        self._http = httpx.AsyncClient(
+            timeout=timeout_s,
+            headers={"User-Agent": self._user_agent},
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+        self._slots = asyncio.Semaphore(concurrency)
+        self._token_lock = asyncio.Lock()
+        self._pacer = RateLimitPacer()
+
+    async def _ensure_token(self) -> str:
+        if self._access_token:
+            return self._access_token
+        async with self._token_lock:
+            if self._access_token:
+                return self._access_token
+            if self._client_id and self._client_secret and self._refresh_token:
+                self._access_token = await self.refresh_access_token()
+                return self._access_token
+        raise RedditAuthError(
+            "Missing access token. Set REDDIT_ACCESS_TOKEN or provide "
+            "REDDIT_CLIENT_ID/REDDIT_CLIENT_SECRET/REDDIT_REFRESH_TOKEN."
+        )
+
+    async def refresh_access_token(self) -> str:
+        if not (self._client_id and self._client_secret and self._refresh_token):
+            raise RedditAuthError("Refresh-token flow requires client_id, client_secret, refresh_token")
+        resp = await self._request_with_retries(
+            "POST",
+            "https://www.reddit.com/api/v1/access_token",
+            paced=False,
+            auth=(self._client_id, self._client_secret),
+            data={"grant_type": "refresh_token", "refresh_token": self._refresh_token},
+            headers={"User-Agent": self._user_agent},
+        )
+        data = resp.json()
+        token = data.get("access_token")
+        if not token:
+            raise RedditAuthError(f"Unexpected token response: {data}")
+        return token
+
+    async def get_json(
+        self, path: str, *, params: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], RateLimitInfo]:
+        url = "https://oauth.reddit.com" + path
+        key = request_key("GET", url, params=params)
+        if self._archive is not None and self._archive.replay:
+            resp = self._archive.replay_response(key, method="GET", url=url)
+        else:
+            token = await self._ensure_token()
+            resp = await self._request_with_retries(
+                "GET",
+                url,
+                params=params,
+                headers={"Authorization": f"Bearer {token}", "User-Agent": self._user_agent},
+            )
+            if self._archive is not None:
+                self._archive.record(key, resp)
+        rl = RateLimitInfo(
+            used=_to_float(resp.headers.get("X-Ratelimit-Used")),
+            remaining=_to_float(resp.headers.get("X-Ratelimit-Remaining")),
+            reset_seconds=_to_float(resp.headers.get("X-Ratelimit-Reset")),
+        )
+        return resp.json(), rl
+
+    async def _request_with_retries(
+        self, method: str, url: str, *, paced: bool = True, **kwargs: Any
+    ) -> httpx.Response:
+        last_exc: Exception | None = None
+        for attempt in range(self._max_retries + 1):
+            async with self._slots:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async(host_key(url))
+                if paced:
+                    await self._pacer.wait()
+                try:
+                    resp = await self._http.request(method, url, **kwargs)
+                except httpx.RequestError as exc:
+                    last_exc = exc
+                    resp = None
+                if resp is not None and paced:
+                    self._pacer.update(
+                        remaining=_to_float(resp.headers.get("X-Ratelimit-Remaining")),
+                        reset_seconds=_to_float(resp.headers.get("X-Ratelimit-Reset")),
+                    )
+
+            if resp is None:
+                if attempt >= self._max_retries:
+                    raise RedditApiError(f"Network error calling Reddit: {last_exc}") from last_exc
+                await asyncio.sleep(0.5 * (attempt + 1))
+                continue
+
+            if resp.status_code in (401, 403):
+                detail = _safe_detail(resp)
+                raise RedditAuthError(
+                    "Reddit authentication failed (401/403). "
+                    "Verify REDDIT_ACCESS_TOKEN (or refresh-token env vars) and REDDIT_USER_AGENT. "
+                    f"Details: {detail}"
+                )
+
+            if resp.status_code == 429 or resp.status_code >= 500:
+                if attempt < self._max_retries:
+                    retry_after = _to_float(resp.headers.get("Retry-After"))
+                    await asyncio.sleep(retry_after if retry_after is not None else 0.5 * (attempt + 1))
+                    continue
+
+            try:
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                detail = _safe_detail(resp)
+                raise RedditApiError(
+                    f"Reddit API error {resp.status_code} for {method} {url}. Details: {detail}"
+                ) from exc
+
+            return resp
+
+        assert last_exc is not None
+        raise RedditApiError(f"Reddit request failed: {last_exc}")
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncRedditClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+
+class RateLimitPacer:
+    """Spread the remaining request budget evenly over the current rate-limit window.
+
+    Fed from `X-Ratelimit-Remaining` / `X-Ratelimit-Reset`. Until the first response
+    arrives (or after the window resets) requests are not delayed. Requests started
+    locally are counted against the budget immediately, so concurrent callers do not
+    overshoot while waiting for headers.
+    """
+
+    def __init__(self, *, clock=time.monotonic) -> None:
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._remaining: float | None = None
+        self._reset_at: float | None = None
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if self._reset_at is not None and now >= self._reset_at:
+                    # Window rolled over; the next response tells us the new budget.
+                    self._remaining = None
+                    self._reset_at = None
+                if self._remaining is None or self._reset_at is None:
+                    return
+
+                if self._remaining < 1:
+                    await asyncio.sleep(self._reset_at - now)
+                    continue
+
+                if now < self._next_at:
+                    await asyncio.sleep(self._next_at - now)
+                    continue
+
+                self._next_at = now + (self._reset_at - now) / self._remaining
+                self._remaining -= 1
+                return
+
+    def update(self, *, remaining: float | None, reset_seconds: float | None) -> None:
+        if remaining is None or reset_seconds is None:
+            return
+        reset_at = self._clock() + max(0.0, reset_seconds)
+        if self._reset_at is None or reset_at > self._reset_at + 1.0:
+            # First observation, or a new window started.
+            self._remaining = remaining
+            self._reset_at = reset_at
+        else:
+            # Same window: responses can arrive out of order, so keep the tighter budget.
+            self._remaining = remaining if self._remaining is None else min(self._remaining, remaining)
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 import typer
 
+from .archive import ResponseArchive
 from .config import RedditAuthConfig, RedditConfigError
+from .async_client import AsyncRedditClient
 from .client import RedditClient
-from .fetcher import fetch_new_posts, search_posts
+from .columnar import PARTITIONS, write_parquet
+from .fetcher import (
+    ListingQuery,
+    RedditPost,
+    fetch_listings,
+    fetch_new_posts,
+    iter_new_posts,
+    iter_search_posts,
+    search_posts,
+)
+from .ports import RateLimitInfo
+from .ratelimit import TokenBucket
 from .io import emit_jsonl, emit_raw_jsonl
 from .normalizer import normalize_post
+from .state import SeenIndex
+from .types import InvestmentIntelItem
 from .oauth import build_authorize_url, exchange_code_for_tokens, generate_state
 
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
+# Proactive client-side pacing; Reddit's OAuth API allows 100 requests/min per client.
+_DEFAULT_REQUESTS_PER_MINUTE = 60.0
+
 
 def _emit_error(*, kind: str, message: str, code: int, command: str, details: dict | None = None) -> None:
     payload = {
@@ -29,6 +48,18 @@ def _emit_error(*, kind: str, message: str, code: int, command: str, details: di
     raise typer.Exit(code=code)
 
 
+def _open_archive(archive_dir: Path | None, replay: bool, *, command: str) -> ResponseArchive | None:
+    if archive_dir is None:
+        if replay:
+            _emit_error(kind="usage_error", message="--replay requires --archive-dir", code=2, command=command)
+        return None
+    return ResponseArchive(archive_dir, replay=replay)
+
+
+def _rate_limiter(requests_per_minute: float) -> TokenBucket | None:
+    return TokenBucket.per_minute(requests_per_minute) if requests_per_minute > 0 else None
+
+
 @app.callback()
 def main() -> None:
     """Reddit extractor CLI."""
@@ -125,18 +156,39 @@ def auth_cmd(
 def extract_cmd(
     subreddit: str = typer.Option(..., help="Subreddit name (no r/ prefix)"),
     query: str | None = typer.Option(None, help="Search query; if omitted uses /new"),
-    limit: int = typer.Option(25, min=1, max=100, help="Max posts"),
+    limit: int = typer.Option(25, min=1, max=1000, help="Max posts (>100 pages through the listing)"),
     sort: str = typer.Option("new", help="Search sort (relevance, hot, top, new, comments)"),
     time_filter: str = typer.Option("month", help="Search time filter (hour, day, week, month, year, all)"),
+    since_utc: float | None = typer.Option(
+        None, help="Stop at posts created before this Unix timestamp (newest-first listings)"
+    ),
     out: Path | None = typer.Option(None, help="Write normalized JSONL to this path"),
+    parquet_dir: Path | None = typer.Option(
+        None, help="Write a Parquet dataset here (requires pyarrow); JSONL then only goes to --out"
+    ),
+    parquet_partition: str | None = typer.Option(None, help="Partition Parquet by published 'month' or 'day'"),
+    state_db: Path | None = typer.Option(
+        None, help="SQLite index of already-emitted post fullnames; enables incremental runs"
+    ),
+    retention_days: float = typer.Option(90.0, min=0, help="Forget seen posts after this many days"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
     """Fetch Reddit posts and emit normalized JSONL."""
+    _check_parquet_partition(parquet_partition, command="extract")
+    archive = _open_archive(archive_dir, replay, command="extract")
     try:
         config = RedditAuthConfig.from_env()
     except RedditConfigError as exc:
         _emit_error(kind="config_error", message=str(exc), code=2, command="extract")
 
-    if not config.has_any_token_source():
+    if not replay and not config.has_any_token_source():
         _emit_error(
             kind="config_error",
             message=(
@@ -148,23 +200,35 @@ def extract_cmd(
         )
 
     try:
-        with RedditClient(config=config) as client:
-            if query:
-                posts, rl = search_posts(
-                    client,
-                    subreddit=subreddit,
-                    query=query,
-                    limit=limit,
-                    sort=sort,
-                    time_filter=time_filter,
-                )
-            else:
-                posts, rl = fetch_new_posts(client, subreddit=subreddit, limit=limit)
+        with RedditClient(
+            config=config, archive=archive, rate_limiter=_rate_limiter(requests_per_minute)
+        ) as client:
+            posts, rl = _fetch_posts(
+                client,
+                subreddit=subreddit,
+                query=query,
+                limit=limit,
+                sort=sort,
+                time_filter=time_filter,
+                since_utc=since_utc,
+            )
     except Exception as exc:
         _emit_error(kind="api_error", message=str(exc), code=1, command="extract")
 
+    seen = SeenIndex(state_db, retention_days=retention_days) if state_db is not None else None
+    if seen is not None:
+        posts = seen.filter_new(posts, key=lambda p: p.fullname)
+
     normalized = [normalize_post(p) for p in posts]
-    emit_jsonl(normalized, out)
+    _emit_items(
+        normalized,
+        out,
+        append=append,
+        parquet_dir=parquet_dir,
+        parquet_partition=parquet_partition,
+        command="extract",
+    )
+    _mark_seen(seen, posts)
 
     if rl.used is not None or rl.remaining is not None:
         typer.echo(
@@ -173,22 +237,141 @@ def extract_cmd(
         )
 
 
+@app.command("extract-many")
+def extract_many_cmd(
+    subreddit: list[str] = typer.Option(..., help="Subreddit name (no r/ prefix); repeat for several"),
+    query: str | None = typer.Option(None, help="Search query; if omitted uses /new"),
+    limit: int = typer.Option(25, min=1, max=100, help="Max posts per subreddit"),
+    sort: str = typer.Option("new", help="Search sort (relevance, hot, top, new, comments)"),
+    time_filter: str = typer.Option("month", help="Search time filter (hour, day, week, month, year, all)"),
+    max_concurrency: int = typer.Option(8, min=1, help="Max concurrent requests"),
+    out: Path | None = typer.Option(None, help="Write normalized JSONL to this path"),
+    parquet_dir: Path | None = typer.Option(
+        None, help="Write a Parquet dataset here (requires pyarrow); JSONL then only goes to --out"
+    ),
+    parquet_partition: str | None = typer.Option(None, help="Partition Parquet by published 'month' or 'day'"),
+    state_db: Path | None = typer.Option(
+        None, help="SQLite index of already-emitted post fullnames; enables incremental runs"
+    ),
+    retention_days: float = typer.Option(90.0, min=0, help="Forget seen posts after this many days"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
+) -> None:
+    """Fetch several subreddits concurrently and emit normalized JSONL.
+
+    Requests share one connection pool and are paced from Reddit's rate-limit headers.
+    A failing subreddit is reported on stderr (exit code 1) without dropping the others.
+    """
+    _check_parquet_partition(parquet_partition, command="extract-many")
+    archive = _open_archive(archive_dir, replay, command="extract-many")
+    try:
+        config = RedditAuthConfig.from_env()
+    except RedditConfigError as exc:
+        _emit_error(kind="config_error", message=str(exc), code=2, command="extract-many")
+
+    if not replay and not config.has_any_token_source():
+        _emit_error(
+            kind="config_error",
+            message=(
+                "Missing Reddit credentials. Set REDDIT_ACCESS_TOKEN or "
+                "REDDIT_CLIENT_ID/REDDIT_CLIENT_SECRET/REDDIT_REFRESH_TOKEN."
+            ),
+            code=2,
+            command="extract-many",
+        )
+
+    queries = [
+        ListingQuery(subreddit=s, query=query, limit=limit, sort=sort, time_filter=time_filter)
+        for s in dict.fromkeys(subreddit)
+    ]
+
+    async def _run() -> list:
+        async with AsyncRedditClient(
+            config=config,
+            max_concurrency=max_concurrency,
+            rate_limiter=_rate_limiter(requests_per_minute),
+            archive=archive,
+        ) as client:
+            return await fetch_listings(client, queries)
+
+    try:
+        results = asyncio.run(_run())
+    except Exception as exc:
+        _emit_error(kind="api_error", message=str(exc), code=1, command="extract-many")
+
+    posts: list[RedditPost] = []
+    failed = False
+    for q, res in zip(queries, results):
+        if isinstance(res, Exception):
+            failed = True
+            payload = {
+                "ok": False,
+                "error": {
+                    "kind": "api_error",
+                    "message": str(res),
+                    "command": "extract-many",
+                    "details": {"subreddit": q.subreddit},
+                },
+            }
+            typer.echo(json.dumps(payload, ensure_ascii=False), err=True)
+            continue
+        posts.extend(res[0])
+
+    seen = SeenIndex(state_db, retention_days=retention_days) if state_db is not None else None
+    if seen is not None:
+        posts = seen.filter_new(posts, key=lambda p: p.fullname)
+
+    _emit_items(
+        [normalize_post(p) for p in posts],
+        out,
+        append=append,
+        parquet_dir=parquet_dir,
+        parquet_partition=parquet_partition,
+        command="extract-many",
+    )
+    _mark_seen(seen, posts)
+    if failed:
+        raise typer.Exit(code=1)
+
+
 @app.command("fetch")
 def fetch_cmd(
     subreddit: str = typer.Option(..., help="Subreddit name (no r/ prefix)"),
     query: str | None = typer.Option(None, help="Search query; if omitted uses /new"),
-    limit: int = typer.Option(25, min=1, max=100, help="Max posts"),
+    limit: int = typer.Option(25, min=1, max=1000, help="Max posts (>100 pages through the listing)"),
     sort: str = typer.Option("new", help="Search sort (relevance, hot, top, new, comments)"),
     time_filter: str = typer.Option("month", help="Search time filter (hour, day, week, month, year, all)"),
+    since_utc: float | None = typer.Option(
+        None, help="Stop at posts created before this Unix timestamp (newest-first listings)"
+    ),
     out: Path | None = typer.Option(None, help="Write raw JSONL to this path"),
+    state_db: Path | None = typer.Option(
+        None, help="SQLite index of already-emitted post fullnames; enables incremental runs"
+    ),
+    retention_days: float = typer.Option(90.0, min=0, help="Forget seen posts after this many days"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
     """Fetch Reddit posts and emit raw JSONL records."""
+    archive = _open_archive(archive_dir, replay, command="fetch")
     try:
         config = RedditAuthConfig.from_env()
     except RedditConfigError as exc:
         _emit_error(kind="config_error", message=str(exc), code=2, command="fetch")
 
-    if not config.has_any_token_source():
+    if not replay and not config.has_any_token_source():
         _emit_error(
             kind="config_error",
             message=(
@@ -200,25 +383,115 @@ def fetch_cmd(
         )
 
     try:
-        with RedditClient(config=config) as client:
-            if query:
-                posts, rl = search_posts(
-                    client,
-                    subreddit=subreddit,
-                    query=query,
-                    limit=limit,
-                    sort=sort,
-                    time_filter=time_filter,
-                )
-            else:
-                posts, rl = fetch_new_posts(client, subreddit=subreddit, limit=limit)
+        with RedditClient(
+            config=config, archive=archive, rate_limiter=_rate_limiter(requests_per_minute)
+        ) as client:
+            posts, rl = _fetch_posts(
+                client,
+                subreddit=subreddit,
+                query=query,
+                limit=limit,
+                sort=sort,
+                time_filter=time_filter,
+                since_utc=since_utc,
+            )
     except Exception as exc:
         _emit_error(kind="api_error", message=str(exc), code=1, command="fetch")
 
-    emit_raw_jsonl((p.__dict__ for p in posts), out)
+    seen = SeenIndex(state_db, retention_days=retention_days) if state_db is not None else None
+    if seen is not None:
+        posts = seen.filter_new(posts, key=lambda p: p.fullname)
+
+    emit_raw_jsonl((p.to_dict() for p in posts), out, append=append)
+    _mark_seen(seen, posts)
 
     if rl.used is not None or rl.remaining is not None:
         typer.echo(
             f"rate_limit used={rl.used} remaining={rl.remaining} reset_s={rl.reset_seconds}",
             err=True,
         )
+
+
+def _fetch_posts(
+    client: RedditClient,
+    *,
+    subreddit: str,
+    query: str | None,
+    limit: int,
+    sort: str,
+    time_filter: str,
+    since_utc: float | None,
+) -> tuple[list[RedditPost], RateLimitInfo]:
+    if limit <= 100 and since_utc is None:
+        if query:
+            return search_posts(
+                client,
+                subreddit=subreddit,
+                query=query,
+                limit=limit,
+                sort=sort,
+                time_filter=time_filter,
+            )
+        return fetch_new_posts(client, subreddit=subreddit, limit=limit)
+
+    # Deeper history: follow the listing's `after` cursor page by page.
+    last_rl = [RateLimitInfo(used=None, remaining=None, reset_seconds=None)]
+    if query:
+        pages = iter_search_posts(
+            client,
+            subreddit=subreddit,
+            query=query,
+            sort=sort,
+            time_filter=time_filter,
+            max_posts=limit,
+            since_utc=since_utc,
+            on_rate_limit=last_rl.append,
+        )
+    else:
+        pages = iter_new_posts(
+            client,
+            subreddit=subreddit,
+            max_posts=limit,
+            since_utc=since_utc,
+            on_rate_limit=last_rl.append,
+        )
+    posts = list(pages)
+    return posts, last_rl[-1]
+
+
+def _mark_seen(seen: SeenIndex | None, posts: list[RedditPost]) -> None:
+    # Only after output was written, so a failed run is retried in full next time.
+    if seen is None:
+        return
+    with seen:
+        seen.mark_seen(p.fullname for p in posts)
+        seen.compact()
+
+
+def _check_parquet_partition(parquet_partition: str | None, *, command: str) -> None:
+    if parquet_partition is not None and parquet_partition not in PARTITIONS:
+        _emit_error(
+            kind="usage_error",
+            message="--parquet-partition must be 'month' or 'day'",
+            code=2,
+            command=command,
+        )
+
+
+def _emit_items(
+    items: list[InvestmentIntelItem],
+    out: Path | None,
+    *,
+    append: bool,
+    parquet_dir: Path | None,
+    parquet_partition: str | None,
+    command: str,
+) -> None:
+    if parquet_dir is not None:
+        try:
+            write_parquet(items, parquet_dir, partition_by=parquet_partition)
+        except RuntimeError as exc:
+            _emit_error(kind="export_error", message=str(exc), code=1, command=command)
+        if out is None:
+            return
+    emit_jsonl(items, out, append=append)
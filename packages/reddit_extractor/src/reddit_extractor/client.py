@@ -6,8 +6,10 @@ from typing import Any
 
 import httpx
 
+from .archive import ResponseArchive, request_key
 from .config import RedditAuthConfig
 from .ports import RateLimitInfo
+from .ratelimit import TokenBucket, host_key
 
 
 class RedditAuthError(RuntimeError):
@@ -24,6 +26,10 @@ class RedditClient:
     - Provide `REDDIT_ACCESS_TOKEN` (best for PoC)
     - Or provide `REDDIT_CLIENT_ID`, `REDDIT_CLIENT_SECRET`, `REDDIT_REFRESH_TOKEN`
       to refresh an access token.
+
+    Pass a shared `rate_limiter` to pace requests proactively (per host) instead of
+    relying on 429 retries. With an `archive`, listing responses are recorded, or in
+    replay mode served from it without credentials or network.
     """
 
     def __init__(
@@ -37,6 +43,8 @@ class RedditClient:
         user_agent: str | None = None,
         timeout_s: float = 30.0,
         max_retries: int = 2,
+        rate_limiter: TokenBucket | None = None,
+        archive: ResponseArchive | None = None,
     ) -> None:
         if config is None:
             config = RedditAuthConfig.from_env()
@@ -47,6 +55,8 @@ class RedditClient:
         self._refresh_token = refresh_token or config.refresh_token
         self._user_agent = user_agent or config.user_agent
         self._max_retries = max(0, int(max_retries))
+        self._rate_limiter = rate_limiter
+        self._archive = archive
 
         if not self._user_agent:
             raise RedditAuthError(
@@ -84,14 +94,20 @@ class RedditClient:
         return token
 
     def get_json(self, path: str, *, params: dict[str, Any] | None = None) -> tuple[dict[str, Any], RateLimitInfo]:
-        token = self._ensure_token()
         url = "https://oauth.reddit.com" + path
-        resp = self._request_with_retries(
-            "GET",
-            url,
-            params=params,
-            headers={"Authorization": f"Bearer {token}", "User-Agent": self._user_agent},
-        )
+        key = request_key("GET", url, params=params)
+        if self._archive is not None and self._archive.replay:
+            resp = self._archive.replay_response(key, method="GET", url=url)
+        else:
+            token = self._ensure_token()
+            resp = self._request_with_retries(
+                "GET",
+                url,
+                params=params,
+                headers={"Authorization": f"Bearer {token}", "User-Agent": self._user_agent},
+            )
+            if self._archive is not None:
+                self._archive.record(key, resp)
         rl = RateLimitInfo(
             used=_to_float(resp.headers.get("X-Ratelimit-Used")),
             remaining=_to_float(resp.headers.get("X-Ratelimit-Remaining")),
@@ -102,6 +118,8 @@ class RedditClient:
     def _request_with_retries(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         last_exc: Exception | None = None
         for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(host_key(url))
             try:
                 resp = self._http.request(method, url, **kwargs)
             except httpx.RequestError as exc:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+import sys
+from typing import Any, Callable, Iterator, Sequence
 
-from .ports import RateLimitInfo, RedditApi
+from .ports import AsyncRedditApi, RateLimitInfo, RedditApi
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RedditPost:
     id: str
     fullname: str
@@ -20,6 +23,21 @@ class RedditPost:
     score: int | None
     num_comments: int | None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "fullname": self.fullname,
+            "subreddit": self.subreddit,
+            "title": self.title,
+            "selftext": self.selftext,
+            "permalink": self.permalink,
+            "url": self.url,
+            "created_utc": self.created_utc,
+            "author": self.author,
+            "score": self.score,
+            "num_comments": self.num_comments,
+        }
+
 
 def search_posts(
     client: RedditApi,
@@ -32,14 +50,7 @@ def search_posts(
 ) -> tuple[list[RedditPost], RateLimitInfo]:
     data, rl = client.get_json(
         f"/r/{subreddit}/search",
-        params={
-            "q": query,
-            "restrict_sr": 1,
-            "sort": sort,
-            "t": time_filter,
-            "limit": min(limit, 100),
-            "raw_json": 1,
-        },
+        params=_search_params(query=query, limit=limit, sort=sort, time_filter=time_filter),
     )
     posts = _parse_listing_posts(data)
     return posts[:limit], rl
@@ -51,14 +62,182 @@ def fetch_new_posts(
     subreddit: str,
     limit: int = 25,
 ) -> tuple[list[RedditPost], RateLimitInfo]:
-    data, rl = client.get_json(
-        f"/r/{subreddit}/new",
-        params={"limit": min(limit, 100), "raw_json": 1},
-    )
+    data, rl = client.get_json(f"/r/{subreddit}/new", params=_new_params(limit=limit))
     posts = _parse_listing_posts(data)
     return posts[:limit], rl
 
 
+def iter_new_posts(
+    client: RedditApi,
+    *,
+    subreddit: str,
+    max_posts: int | None = None,
+    since_utc: float | None = None,
+    page_size: int = 100,
+    prefetch: bool = True,
+    on_rate_limit: Callable[[RateLimitInfo], None] | None = None,
+) -> Iterator[RedditPost]:
+    """Lazily page through `/r/{subreddit}/new` following the `after` cursor.
+
+    Stops after `max_posts`, at the end of the listing, or at the first post older than
+    `since_utc` (the listing is newest-first). With `prefetch`, the next page is fetched
+    in the background while the current one is consumed.
+    """
+    yield from _iter_listing(
+        client,
+        f"/r/{subreddit}/new",
+        _new_params(limit=page_size),
+        max_posts=max_posts,
+        since_utc=since_utc,
+        prefetch=prefetch,
+        on_rate_limit=on_rate_limit,
+    )
+
+
+def iter_search_posts(
+    client: RedditApi,
+    *,
+    subreddit: str,
+    query: str,
+    sort: str = "new",
+    time_filter: str = "month",
+    max_posts: int | None = None,
+    since_utc: float | None = None,
+    page_size: int = 100,
+    prefetch: bool = True,
+    on_rate_limit: Callable[[RateLimitInfo], None] | None = None,
+) -> Iterator[RedditPost]:
+    """Lazily page through `/r/{subreddit}/search` following the `after` cursor.
+
+    `since_utc` assumes newest-first results, i.e. `sort="new"`.
+    """
+    yield from _iter_listing(
+        client,
+        f"/r/{subreddit}/search",
+        _search_params(query=query, limit=page_size, sort=sort, time_filter=time_filter),
+        max_posts=max_posts,
+        since_utc=since_utc,
+        prefetch=prefetch,
+        on_rate_limit=on_rate_limit,
+    )
+
+
+def _iter_listing(
+    client: RedditApi,
+    path: str,
+    params: dict[str, Any],
+    *,
+    max_posts: int | None,
+    since_utc: float | None,
+    prefetch: bool,
+    on_rate_limit: Callable[[RateLimitInfo], None] | None,
+) -> Iterator[RedditPost]:
+    # With `prefetch`, the next page is requested on a background thread while the
+    # current one is being consumed. It is only requested when it will be needed.
+    if max_posts is not None and max_posts <= 0:
+        return
+
+    def _get_page(after: str | None, count: int) -> tuple[dict[str, Any], RateLimitInfo]:
+        page_params = dict(params)
+        if after:
+            page_params["after"] = after
+            page_params["count"] = count
+        return client.get_json(path, params=page_params)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    yielded = 0
+    pending: Future | None = None
+    page = _get_page(None, 0)
+    try:
+        while True:
+            data, rl = page
+            if on_rate_limit is not None:
+                on_rate_limit(rl)
+            posts = _parse_listing_posts(data)
+            after = ((data or {}).get("data") or {}).get("after")
+
+            crosses_watermark = since_utc is not None and any(p.created_utc < since_utc for p in posts)
+            more_needed = max_posts is None or yielded + len(posts) < max_posts
+            has_next = bool(after) and bool(posts) and more_needed and not crosses_watermark
+            if has_next and executor is not None:
+                pending = executor.submit(_get_page, after, yielded + len(posts))
+
+            for post in posts:
+                if since_utc is not None and post.created_utc < since_utc:
+                    return
+                yield post
+                yielded += 1
+                if max_posts is not None and yielded >= max_posts:
+                    return
+
+            if not has_next:
+                return
+            if pending is not None:
+                page, pending = pending.result(), None
+            else:
+                page = _get_page(after, yielded)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(frozen=True)
+class ListingQuery:
+    """One subreddit listing to fetch: `/search` when `query` is set, else `/new`."""
+
+    subreddit: str
+    query: str | None = None
+    limit: int = 25
+    sort: str = "new"
+    time_filter: str = "month"
+
+
+async def fetch_listing_async(
+    client: AsyncRedditApi, q: ListingQuery
+) -> tuple[list[RedditPost], RateLimitInfo]:
+    if q.query:
+        path = f"/r/{q.subreddit}/search"
+        params = _search_params(query=q.query, limit=q.limit, sort=q.sort, time_filter=q.time_filter)
+    else:
+        path = f"/r/{q.subreddit}/new"
+        params = _new_params(limit=q.limit)
+    data, rl = await client.get_json(path, params=params)
+    return _parse_listing_posts(data)[: q.limit], rl
+
+
+async def fetch_listings(
+    client: AsyncRedditApi, queries: Sequence[ListingQuery]
+) -> list[tuple[list[RedditPost], RateLimitInfo] | Exception]:
+    """Fetch many listings concurrently; results are in `queries` order.
+
+    A failing query yields its exception in place instead of cancelling the others.
+    """
+    results = await asyncio.gather(
+        *(fetch_listing_async(client, q) for q in queries), return_exceptions=True
+    )
+    out: list[tuple[list[RedditPost], RateLimitInfo] | Exception] = []
+    for r in results:
+        if isinstance(r, BaseException) and not isinstance(r, Exception):
+            raise r
+        out.append(r)
+    return out
+
+
+def _search_params(*, query: str, limit: int, sort: str, time_filter: str) -> dict[str, Any]:
+    return {
+        "q": query,
+        "restrict_sr": 1,
+        "sort": sort,
+        "t": time_filter,
+        "limit": min(limit, 100),
+        "raw_json": 1,
+    }
+
+
+def _new_params(*, limit: int) -> dict[str, Any]:
+    return {"limit": min(limit, 100), "raw_json": 1}
+
+
 def _parse_listing_posts(data: dict[str, Any]) -> list[RedditPost]:
     children = (((data or {}).get("data") or {}).get("children") or [])
     posts: list[RedditPost] = []
@@ -74,7 +253,8 @@ def _parse_listing_posts(data: dict[str, Any]) -> list[RedditPost]:
             RedditPost(
                 id=post_id,
                 fullname=fullname,
-                subreddit=str(d.get("subreddit") or ""),
+                # A listing holds few distinct subreddits; share one string object each.
+                subreddit=sys.intern(str(d.get("subreddit") or "")),
                 title=str(d.get("title") or ""),
                 selftext=str(d.get("selftext") or ""),
                 permalink=str(d.get("permalink") or ""),
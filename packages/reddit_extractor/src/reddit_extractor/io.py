@@ -1,26 +1,80 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import json
+import os
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, TextIO
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # optional fast path for plain dicts
+    orjson = None
 
-def emit_jsonl(models: Iterable[BaseModel], out: Path | None) -> None:
-    lines = [json.dumps(m.model_dump(mode="json"), ensure_ascii=False) for m in models]
-    _emit_lines(lines, out)
 
+def emit_jsonl(models: Iterable[BaseModel], out: Path | None, *, append: bool = False) -> None:
+    # One pass per model, straight to JSON (no intermediate dict).
+    lines = (m.model_dump_json() for m in models)
+    _emit_lines(lines, out, append=append)
 
-def emit_raw_jsonl(records: Iterable[object], out: Path | None) -> None:
-    lines = [json.dumps(r, ensure_ascii=False) for r in records]
-    _emit_lines(lines, out)
 
+def emit_raw_jsonl(records: Iterable[object], out: Path | None, *, append: bool = False) -> None:
+    lines = (dumps(r) for r in records)
+    _emit_lines(lines, out, append=append)
 
-def _emit_lines(lines: list[str], out: Path | None) -> None:
+
+def dumps(obj: object) -> str:
+    """Compact JSON text for plain data, via orjson when it is installed.
+
+    Both backends write UTF-8 with no whitespace, and finite values read back as the
+    same data, but the text is not byte-identical:
+    - float exponents: orjson writes `1e16` / `1e-7`, the stdlib `1e+16` / `1e-07`;
+    - NaN and infinities: orjson writes `null`, the stdlib `NaN` / `Infinity`;
+    - orjson also encodes `datetime`, `UUID` and dataclass values, which the stdlib
+      rejects with `TypeError`.
+    Values orjson cannot encode (e.g. integers beyond 64 bits) fall back to the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _emit_lines(lines: Iterable[str], out: Path | None, *, append: bool = False) -> None:
+    """Write lines one at a time, so memory stays flat for any number of records."""
     if out is None:
         for line in lines:
             print(line)
         return
+    with open_jsonl_writer(out, append=append) as fh:
+        for line in lines:
+            fh.write(line)
+            fh.write("\n")
+
+
+@contextmanager
+def open_jsonl_writer(out: Path, *, append: bool = False) -> Iterator[TextIO]:
+    """Open `out` for streaming JSONL output.
+
+    - `append=False`: write to a sibling temp file and atomically rename it over
+      `out` on success; on error the temp file is removed and `out` is untouched.
+    - `append=True`: append to `out` in place.
+    """
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    if append:
+        with out.open("a", encoding="utf-8") as fh:
+            yield fh
+        return
+
+    tmp = out.with_name(f".{out.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            yield fh
+        os.replace(tmp, out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
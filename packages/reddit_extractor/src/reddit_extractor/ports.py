@@ -16,3 +16,10 @@ class RedditApi(Protocol):
         self, path: str, *, params: dict[str, Any] | None = None
     ) -> tuple[dict[str, Any], RateLimitInfo]:
         """Fetch JSON from an OAuth-authenticated Reddit endpoint."""
+
+
+class AsyncRedditApi(Protocol):
+    async def get_json(
+        self, path: str, *, params: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], RateLimitInfo]:
+        """Fetch JSON from an OAuth-authenticated Reddit endpoint (async)."""
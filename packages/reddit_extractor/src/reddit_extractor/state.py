@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+import time
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+_SQLITE_MAX_PARAMS = 500
+# `compact()` only rewrites the file (VACUUM) once at least this share of its pages,
+# and this many pages, are free; otherwise freed pages are simply reused.
+_VACUUM_MIN_FREE_RATIO = 0.25
+_VACUUM_MIN_FREE_PAGES = 256
+
+
+class SeenIndex:
+    """Persistent index of item keys processed by earlier runs (SQLite).
+
+    Typical incremental run:
+    1) `filter_new(items, key=...)` drops items seen before (and de-dups the batch).
+    2) Process/export the remaining items.
+    3) `mark_seen(keys)` for the items that were processed successfully. Code that
+       processes items on the caller's behalf can `stage(keys)` instead; the caller then
+       calls `commit()` once the output is written.
+
+    Keys seen again are refreshed, so `compact()` only forgets keys that have not
+    shown up for `retention_days`.
+    """
+
+    def __init__(self, path: Path, *, retention_days: float | None = 90.0) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, seen_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._retention_s = None if retention_days is None else max(0.0, float(retention_days)) * 86400.0
+        self._staged: dict[str, None] = {}
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        row = self._conn.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0])
+
+    def filter_new(self, items: Iterable[T], *, key: Callable[[T], str | None]) -> list[T]:
+        """Return items whose key is not in the index, preserving order.
+
+        Items without a key are always kept (they cannot be de-duplicated).
+        """
+        items = list(items)
+        keys = [key(i) for i in items]
+        seen = self._lookup({k for k in keys if k})
+        if seen:
+            self._touch(seen)
+
+        out: list[T] = []
+        batch: set[str] = set()
+        for item, k in zip(items, keys):
+            if k:
+                if k in seen or k in batch:
+                    continue
+                batch.add(k)
+            out.append(item)
+        return out
+
+    def mark_seen(self, keys: Iterable[str | None]) -> None:
+        now = time.time()
+        rows = [(k, now) for k in dict.fromkeys(k for k in keys if k)]
+        if not rows:
+            return
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)", rows)
+
+    def stage(self, keys: Iterable[str | None]) -> None:
+        """Remember keys to mark seen on the next `commit()`."""
+        self._staged.update(dict.fromkeys(k for k in keys if k))
+
+    def commit(self) -> None:
+        """Mark all staged keys seen."""
+        keys, self._staged = list(self._staged), {}
+        self.mark_seen(keys)
+
+    @property
+    def staged(self) -> list[str]:
+        return list(self._staged)
+
+    def compact(self) -> int:
+        """Forget keys older than the retention window.
+
+        The file is only rewritten (VACUUM) once a large share of it is free space, so
+        calling this on every run is cheap. Returns the number of keys removed.
+        """
+        removed = 0
+        if self._retention_s is not None:
+            cutoff = time.time() - self._retention_s
+            with self._conn:
+                removed = self._conn.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,)).rowcount
+        if removed:
+            free = int(self._conn.execute("PRAGMA freelist_count").fetchone()[0])
+            total = int(self._conn.execute("PRAGMA page_count").fetchone()[0])
+            if free >= _VACUUM_MIN_FREE_PAGES and free >= total * _VACUUM_MIN_FREE_RATIO:
+                self._conn.execute("VACUUM")
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def _lookup(self, keys: set[str]) -> set[str]:
+        found: set[str] = set()
+        ordered = list(keys)
+        for i in range(0, len(ordered), _SQLITE_MAX_PARAMS):
+            chunk = ordered[i : i + _SQLITE_MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            rows = self._conn.execute(f"SELECT key FROM seen WHERE key IN ({marks})", chunk)
+            found.update(r[0] for r in rows)
+        return found
+
+    def _touch(self, keys: set[str]) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.executemany("UPDATE seen SET seen_at = ? WHERE key = ?", [(now, k) for k in keys])
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SeenIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
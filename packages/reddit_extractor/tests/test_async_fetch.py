@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from reddit_extractor.archive import ResponseArchive
+from reddit_extractor.async_client import AsyncRedditClient, RateLimitPacer
+from reddit_extractor.config import RedditAuthConfig
+from reddit_extractor.fetcher import ListingQuery, fetch_listings
+from reddit_extractor.ports import RateLimitInfo
+
+
+def _listing(subreddit: str) -> dict:
+    child = {
+        "kind": "t3",
+        "data": {"id": "abc", "name": "t3_abc", "subreddit": subreddit, "title": "Seed round", "created_utc": 1.0},
+    }
+    return {"data": {"children": [child]}}
+
+
+class _FakeAsyncClient:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    async def get_json(self, path: str, *, params=None):
+        self.paths.append(path)
+        await asyncio.sleep(0)
+        if path.startswith("/r/broken/"):
+            raise RuntimeError("boom")
+        return _listing(path.split("/")[2]), RateLimitInfo(used=1, remaining=99, reset_seconds=60)
+
+
+def test_fetch_listings_keeps_order_and_isolates_failures() -> None:
+    client = _FakeAsyncClient()
+    queries = [ListingQuery(subreddit="startups"), ListingQuery(subreddit="broken"), ListingQuery(subreddit="vc", query="seed")]
+
+    results = asyncio.run(fetch_listings(client, queries))
+
+    assert results[0][0][0].subreddit == "startups"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2][0][0].subreddit == "vc"
+    assert "/r/vc/search" in client.paths
+
+
+def test_rate_limit_pacer_spreads_budget_over_window(monkeypatch) -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        now[0] += delay
+
+    async def _run() -> None:
+        pacer = RateLimitPacer(clock=lambda: now[0])
+        await pacer.wait()  # no headers yet: not delayed
+        pacer.update(remaining=4, reset_seconds=8)
+        for _ in range(5):
+            await pacer.wait()
+
+    monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+    asyncio.run(_run())
+
+    # 4 requests spread over 8s, then the 5th waits for the window to reset.
+    assert sleeps == [2.0, 2.0, 2.0, 2.0]
+    assert now[0] == 8.0
+
+
+def test_async_client_records_then_replays_without_network(tmp_path) -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=_listing(request.url.path.split("/")[2]))
+
+    queries = [ListingQuery(subreddit="startups"), ListingQuery(subreddit="vc", query="seed")]
+
+    async def _run(config: RedditAuthConfig, archive: ResponseArchive, transport=None) -> list:
+        async with AsyncRedditClient(config=config, archive=archive) as client:
+            if transport is not None:
+                client._http = httpx.AsyncClient(transport=transport)
+            return await fetch_listings(client, queries)
+
+    with ResponseArchive(tmp_path / "archive") as archive:
+        recorded = asyncio.run(
+            _run(RedditAuthConfig(user_agent="test", access_token="t"), archive, httpx.MockTransport(handler))
+        )
+    assert len(calls) == 2
+
+    # Replay: no token and no transport; any network call would fail.
+    with ResponseArchive(tmp_path / "archive", replay=True) as archive:
+        replayed = asyncio.run(_run(RedditAuthConfig(user_agent="test"), archive))
+    assert len(calls) == 2
+    assert [r[0] for r in replayed] == [r[0] for r in recorded]
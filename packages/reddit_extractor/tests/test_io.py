@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+
+import pytest
+
+from reddit_extractor import io as io_mod
+from reddit_extractor.fetcher import RedditPost
+from reddit_extractor.normalizer import normalize_post
+
+
+def _post() -> RedditPost:
+    return RedditPost(
+        id="abc",
+        fullname="t3_abc",
+        subreddit="startups",
+        title="Zürich startup raises €5M seed — $NVDA",
+        selftext="Détails \"quoted\" and a\nnewline",
+        permalink="/r/startups/comments/abc/x/",
+        url="https://example.com/x",
+        created_utc=datetime(2026, 2, 1, 12, 0, 0, 250000, tzinfo=timezone.utc).timestamp(),
+        author=None,
+        score=3,
+        num_comments=0,
+    )
+
+
+def _strip_ws(text: str) -> str:
+    # Whitespace outside string values; the values here contain no ", " / ": " sequences.
+    return text.replace(", ", ",").replace(": ", ":")
+
+
+def test_emit_jsonl_matches_previous_encoding_modulo_whitespace(tmp_path) -> None:
+    item = normalize_post(_post())
+    out = tmp_path / "out.jsonl"
+
+    io_mod.emit_jsonl([item, item], out)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    previous = json.dumps(item.model_dump(mode="json"), ensure_ascii=False)
+    assert lines == [_strip_ws(previous)] * 2
+
+
+def test_raw_dumps_backends_agree(monkeypatch) -> None:
+    record = dict(_post().to_dict(), nested={"k": [1.5, -0.25, None, True]}, n=2**60)
+
+    fast = io_mod.dumps(record)
+    monkeypatch.setattr(io_mod, "orjson", None)
+    stdlib = io_mod.dumps(record)
+
+    assert fast == stdlib
+    assert json.loads(stdlib) == record
+
+
+def test_raw_dumps_falls_back_to_stdlib_for_big_ints() -> None:
+    record = {"big": 2**70, "k": "é"}
+    assert io_mod.dumps(record) == '{"big":1180591620717411303424,"k":"é"}'
+
+
+def test_raw_dumps_documented_backend_differences(monkeypatch) -> None:
+    pytest.importorskip("orjson")
+    record = {"a": 1e16, "b": 1e-7, "c": float("nan")}
+
+    fast = io_mod.dumps(record)
+    monkeypatch.setattr(io_mod, "orjson", None)
+    stdlib = io_mod.dumps(record)
+
+    assert fast == '{"a":1e16,"b":1e-7,"c":null}'
+    assert stdlib == '{"a":1e+16,"b":1e-07,"c":NaN}'
+    assert json.loads(fast)["a"] == json.loads(stdlib)["a"]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from reddit_extractor.fetcher import iter_new_posts
+from reddit_extractor.ports import RateLimitInfo
+
+
+def _page(start: int, size: int, after: str | None) -> dict:
+    children = [
+        {
+            "kind": "t3",
+            "data": {"id": f"p{i}", "name": f"t3_p{i}", "subreddit": "startups", "title": f"Post {i}", "created_utc": 1000.0 - i},
+        }
+        for i in range(start, start + size)
+    ]
+    return {"data": {"children": children, "after": after}}
+
+
+class _PagedClient:
+    """Three pages of 3 posts each, newest first (created_utc 1000, 999, ...)."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def get_json(self, path: str, *, params=None):
+        self.calls.append(dict(params or {}))
+        after = (params or {}).get("after")
+        start = {None: 0, "t3_p2": 3, "t3_p5": 6}[after]
+        next_after = {0: "t3_p2", 3: "t3_p5", 6: None}[start]
+        return _page(start, 3, next_after), RateLimitInfo(used=None, remaining=None, reset_seconds=None)
+
+
+def test_iter_new_posts_follows_after_cursor() -> None:
+    client = _PagedClient()
+    posts = list(iter_new_posts(client, subreddit="startups", page_size=3))
+
+    assert [p.id for p in posts] == [f"p{i}" for i in range(9)]
+    assert [c.get("after") for c in client.calls] == [None, "t3_p2", "t3_p5"]
+    assert client.calls[1]["count"] == 3
+
+
+def test_iter_new_posts_stops_at_limit_and_watermark_without_extra_requests() -> None:
+    client = _PagedClient()
+    assert len(list(iter_new_posts(client, subreddit="startups", page_size=3, max_posts=3))) == 3
+    assert len(client.calls) == 1
+
+    client = _PagedClient()
+    posts = list(iter_new_posts(client, subreddit="startups", page_size=3, since_utc=996.0))
+    assert [p.created_utc for p in posts] == [1000.0, 999.0, 998.0, 997.0, 996.0]
+    assert len(client.calls) == 2
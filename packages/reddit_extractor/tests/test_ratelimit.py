@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from reddit_extractor.ratelimit import TokenBucket, host_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.t = 100.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_token_bucket_burst_then_paces_per_key() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(2.0, burst=3, clock=clock)
+
+    assert [bucket.reserve("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Out of burst: callers queue behind each other at 1/rate spacing.
+    assert bucket.reserve("a") == pytest.approx(0.5)
+    assert bucket.reserve("a") == pytest.approx(1.0)
+    # Other hosts have their own bucket.
+    assert bucket.reserve("b") == 0.0
+
+    clock.t += 10.0
+    assert bucket.reserve("a") == 0.0  # refilled (capped at burst)
+    assert host_key("https://OAuth.Reddit.com/r/x/new") == "oauth.reddit.com"
+
+
+def test_token_bucket_acquire_async_sleeps_for_reservation(monkeypatch) -> None:
+    slept: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        slept.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(4.0, burst=1, clock=_Clock())
+
+    async def run() -> None:
+        await bucket.acquire_async("h")
+        await bucket.acquire_async("h")
+
+    asyncio.run(run())
+    assert slept == [pytest.approx(0.25)]
@@ -1,5 +1,11 @@
 __all__ = [
+    "archive",
     "client",
+    "columnar",
     "fetcher",
     "normalizer",
+    "ratelimit",
+    "io",
+    "cache",
+    "state",
 ]
@@ -5,13 +5,24 @@ from pathlib import Path
 
 import typer
 
+from .archive import ResponseArchive
+from .cache import HttpCache
 from .client import TechCrunchClient
-from .fetcher import fetch_rss_items
+from .columnar import PARTITIONS, write_parquet
+from .fetcher import FeedResult, TechCrunchRssItem, fetch_feeds, merge_feed_items, rss_item_key
+from .io import emit_jsonl, emit_raw_jsonl
 from .normalizer import normalize_rss_item
+from .state import SeenIndex
+from .ratelimit import TokenBucket
+from .types import InvestmentIntelItem
 
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
+# Client-side pacing is off by default: a run polls each feed once, so a per-host limit
+# would only serialise the `--max-concurrency` fetches without protecting anything.
+_DEFAULT_REQUESTS_PER_MINUTE = 0.0
+
 
 def _emit_error(*, kind: str, message: str, code: int, command: str, details: dict | None = None) -> None:
     payload = {
@@ -27,6 +38,28 @@ def _emit_error(*, kind: str, message: str, code: int, command: str, details: di
     raise typer.Exit(code=code)
 
 
+def _empty_warning(cache_dir: Path | None, state_db: Path | None = None) -> str:
+    if state_db is not None:
+        return "Warning: 0 new RSS items (feed may be unchanged, or all items were seen in earlier runs)."
+    if cache_dir is not None:
+        return "Warning: fetched 0 RSS items (feed may be unchanged since the last poll)."
+    return "Warning: fetched 0 RSS items."
+
+
+def _open_archive(archive_dir: Path | None, replay: bool, *, command: str) -> ResponseArchive | None:
+    if archive_dir is None:
+        if replay:
+            _emit_error(kind="usage_error", message="--replay requires --archive-dir", code=2, command=command)
+        return None
+    return ResponseArchive(archive_dir, replay=replay)
+
+
+def _rate_limiter(requests_per_minute: float, *, burst: int = 1) -> TokenBucket | None:
+    if requests_per_minute <= 0:
+        return None
+    return TokenBucket.per_minute(requests_per_minute, burst=float(burst))
+
+
 @app.callback()
 def main() -> None:
     """TechCrunch extractor CLI."""
@@ -35,51 +68,188 @@ def main() -> None:
 
 @app.command()
 def extract(
-    rss_url: str = typer.Option("https://techcrunch.com/feed/", help="RSS feed URL"),
-    limit: int = typer.Option(25, min=1, max=200, help="Max items to fetch"),
+    rss_url: list[str] = typer.Option(
+        ["https://techcrunch.com/feed/"], help="RSS feed URL; repeat to merge several feeds"
+    ),
+    limit: int = typer.Option(25, min=1, max=200, help="Max items to fetch per feed"),
     out: Path | None = typer.Option(None, help="Write normalized JSONL to this path"),
+    parquet_dir: Path | None = typer.Option(
+        None, help="Write a Parquet dataset here (requires pyarrow); JSONL then only goes to --out"
+    ),
+    parquet_partition: str | None = typer.Option(None, help="Partition Parquet by published 'month' or 'day'"),
     user_agent: str | None = typer.Option(None, help="Optional User-Agent"),
+    cache_dir: Path | None = typer.Option(
+        None, help="Directory for ETag/Last-Modified validators; enables conditional GETs"
+    ),
+    state_db: Path | None = typer.Option(
+        None, help="SQLite index of already-emitted GUIDs; enables incremental runs"
+    ),
+    retention_days: float = typer.Option(90.0, min=0, help="Forget seen GUIDs after this many days"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network"),
+    max_concurrency: int = typer.Option(8, min=1, help="Feeds fetched in parallel"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
     """Fetch TechCrunch RSS and emit normalized JSONL."""
+    _check_parquet_partition(parquet_partition, command="extract")
+    archive = _open_archive(archive_dir, replay, command="extract")
+    cache = HttpCache(cache_dir) if cache_dir is not None else None
     try:
-        with TechCrunchClient(user_agent=user_agent) as client:
-            raw_items = fetch_rss_items(client, rss_url=rss_url, limit=limit)
+        with TechCrunchClient(
+            user_agent=user_agent,
+            archive=archive,
+            rate_limiter=_rate_limiter(requests_per_minute, burst=max_concurrency),
+        ) as client:
+            results = fetch_feeds(
+                client,
+                rss_url,
+                limit=limit,
+                cache=cache,
+                max_workers=max_concurrency,
+            )
+        failed = [r for r in results if r.error is not None]
+        if len(failed) == len(results):
+            raise failed[0].error  # type: ignore[misc]
+        raw_items = merge_feed_items(results)
+        seen = SeenIndex(state_db, retention_days=retention_days) if state_db is not None else None
+        if seen is not None:
+            raw_items = seen.filter_new(raw_items, key=rss_item_key)
         normalized = [normalize_rss_item(i) for i in raw_items]
     except Exception as exc:
         _emit_error(kind="extract_failed", message=str(exc), code=1, command="extract")
 
     if not normalized:
-        typer.echo("Warning: fetched 0 RSS items.", err=True)
+        typer.echo(_empty_warning(cache_dir, state_db), err=True)
 
-    lines = [json.dumps(obj.model_dump(mode="json"), ensure_ascii=False) for obj in normalized]
-    if out is None:
-        for line in lines:
-            typer.echo(line)
-        return
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    _emit_items(
+        normalized,
+        out,
+        append=append,
+        parquet_dir=parquet_dir,
+        parquet_partition=parquet_partition,
+        command="extract",
+    )
+    _mark_seen(seen, raw_items)
+    _commit_validators(cache)
+    _report_failed_feeds(failed, command="extract")
 
 
 @app.command()
 def fetch(
-    rss_url: str = typer.Option("https://techcrunch.com/feed/", help="RSS feed URL"),
-    limit: int = typer.Option(25, min=1, max=200, help="Max items to fetch"),
+    rss_url: list[str] = typer.Option(
+        ["https://techcrunch.com/feed/"], help="RSS feed URL; repeat to merge several feeds"
+    ),
+    limit: int = typer.Option(25, min=1, max=200, help="Max items to fetch per feed"),
     out: Path | None = typer.Option(None, help="Write raw RSS-derived JSONL to this path"),
     user_agent: str | None = typer.Option(None, help="Optional User-Agent"),
+    cache_dir: Path | None = typer.Option(
+        None, help="Directory for ETag/Last-Modified validators; enables conditional GETs"
+    ),
+    state_db: Path | None = typer.Option(
+        None, help="SQLite index of already-emitted GUIDs; enables incremental runs"
+    ),
+    retention_days: float = typer.Option(90.0, min=0, help="Forget seen GUIDs after this many days"),
+    append: bool = typer.Option(False, help="Append to --out instead of atomically replacing it"),
+    archive_dir: Path | None = typer.Option(
+        None, help="Record raw responses to this content-addressed archive"
+    ),
+    replay: bool = typer.Option(False, help="Serve responses from --archive-dir; no network"),
+    max_concurrency: int = typer.Option(8, min=1, help="Feeds fetched in parallel"),
+    requests_per_minute: float = typer.Option(
+        _DEFAULT_REQUESTS_PER_MINUTE, min=0, help="Client-side request limit per host (0 disables)"
+    ),
 ) -> None:
     """Fetch TechCrunch RSS and emit raw-ish JSONL records."""
+    archive = _open_archive(archive_dir, replay, command="fetch")
+    cache = HttpCache(cache_dir) if cache_dir is not None else None
     try:
-        with TechCrunchClient(user_agent=user_agent) as client:
-            raw_items = fetch_rss_items(client, rss_url=rss_url, limit=limit)
+        with TechCrunchClient(
+            user_agent=user_agent,
+            archive=archive,
+            rate_limiter=_rate_limiter(requests_per_minute, burst=max_concurrency),
+        ) as client:
+            results = fetch_feeds(
+                client,
+                rss_url,
+                limit=limit,
+                cache=cache,
+                max_workers=max_concurrency,
+            )
+        failed = [r for r in results if r.error is not None]
+        if len(failed) == len(results):
+            raise failed[0].error  # type: ignore[misc]
+        raw_items = merge_feed_items(results)
+        seen = SeenIndex(state_db, retention_days=retention_days) if state_db is not None else None
+        if seen is not None:
+            raw_items = seen.filter_new(raw_items, key=rss_item_key)
     except Exception as exc:
         _emit_error(kind="fetch_failed", message=str(exc), code=1, command="fetch")
 
     if not raw_items:
-        typer.echo("Warning: fetched 0 RSS items.", err=True)
-    lines = [json.dumps(i.__dict__, ensure_ascii=False) for i in raw_items]
-    if out is None:
-        for line in lines:
-            typer.echo(line)
+        typer.echo(_empty_warning(cache_dir, state_db), err=True)
+    emit_raw_jsonl((i.to_dict() for i in raw_items), out, append=append)
+    _mark_seen(seen, raw_items)
+    _commit_validators(cache)
+    _report_failed_feeds(failed, command="fetch")
+
+
+def _mark_seen(seen: SeenIndex | None, items: list[TechCrunchRssItem]) -> None:
+    # Only after output was written, so a failed run is retried in full next time.
+    if seen is None:
+        return
+    with seen:
+        seen.mark_seen(rss_item_key(i) for i in items)
+        seen.compact()
+
+
+def _commit_validators(cache: HttpCache | None) -> None:
+    # Likewise: a feed whose items never reached the output must not come back as a 304.
+    if cache is not None:
+        cache.commit()
+
+
+def _report_failed_feeds(failed: list[FeedResult], *, command: str) -> None:
+    # Items from the feeds that worked are already written; name the ones that did not.
+    if not failed:
         return
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    _emit_error(
+        kind="feeds_failed",
+        message=f"{len(failed)} feed(s) failed",
+        code=1,
+        command=command,
+        details={"feeds": [{"rss_url": r.rss_url, "message": str(r.error)} for r in failed]},
+    )
+
+
+def _check_parquet_partition(parquet_partition: str | None, *, command: str) -> None:
+    if parquet_partition is not None and parquet_partition not in PARTITIONS:
+        _emit_error(
+            kind="usage_error",
+            message="--parquet-partition must be 'month' or 'day'",
+            code=2,
+            command=command,
+        )
+
+
+def _emit_items(
+    items: list[InvestmentIntelItem],
+    out: Path | None,
+    *,
+    append: bool,
+    parquet_dir: Path | None,
+    parquet_partition: str | None,
+    command: str,
+) -> None:
+    if parquet_dir is not None:
+        try:
+            write_parquet(items, parquet_dir, partition_by=parquet_partition)
+        except RuntimeError as exc:
+            _emit_error(kind="export_error", message=str(exc), code=1, command=command)
+        if out is None:
+            return
+    emit_jsonl(items, out, append=append)
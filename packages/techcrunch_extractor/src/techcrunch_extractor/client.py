@@ -1,21 +1,136 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
 import httpx
 
+from .archive import ResponseArchive, request_key
+from .ratelimit import TokenBucket, host_key
+
 
 DEFAULT_USER_AGENT = "techcrunch-extractor/0.1.0"
 
 
+@dataclass(frozen=True)
+class ConditionalText:
+    """Result of a conditional GET; `text` is None when the server answered 304."""
+
+    text: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.text is None
+
+
+@dataclass(frozen=True)
+class StreamedBody:
+    """Streamed response body; `chunks` is None when the server answered 304."""
+
+    chunks: Iterator[bytes] | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.chunks is None
+
+
 class TechCrunchClient:
-    def __init__(self, *, timeout_s: float = 30.0, user_agent: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        timeout_s: float = 30.0,
+        user_agent: str | None = None,
+        rate_limiter: TokenBucket | None = None,
+        archive: ResponseArchive | None = None,
+    ) -> None:
         headers = {"User-Agent": (user_agent or DEFAULT_USER_AGENT)}
         self._client = httpx.Client(timeout=timeout_s, headers=headers)
+        self._rate_limiter = rate_limiter
+        self._archive = archive
 
     def get_text(self, url: str, *, params: dict[str, str] | None = None) -> str:
-        resp = self._client.get(url, params=params)
+        key = request_key("GET", url, params=params)
+        if self._archive is not None and self._archive.replay:
+            resp = self._archive.replay_response(key, method="GET", url=url)
+        else:
+            self._throttle(url)
+            resp = self._client.get(url, params=params)
         resp.raise_for_status()
+        if self._archive is not None and not self._archive.replay:
+            self._archive.record(key, resp)
         return resp.text
 
+    def get_text_conditional(self, url: str, *, headers: dict[str, str] | None = None) -> ConditionalText:
+        """GET `url` with optional `If-None-Match` / `If-Modified-Since` headers.
+
+        In replay mode the validators are ignored and the archived body is returned.
+        """
+        key = request_key("GET", url)
+        if self._archive is not None and self._archive.replay:
+            resp = self._archive.replay_response(key, method="GET", url=url)
+        else:
+            self._throttle(url)
+            resp = self._client.get(url, headers=headers)
+        if resp.status_code == 304:
+            return ConditionalText(text=None)
+        resp.raise_for_status()
+        if self._archive is not None and not self._archive.replay:
+            self._archive.record(key, resp)
+        return ConditionalText(
+            text=resp.text,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+    @contextmanager
+    def stream(self, url: str, *, headers: dict[str, str] | None = None) -> Iterator[StreamedBody]:
+        """GET `url` and expose the body as raw byte chunks while the context is open.
+
+        Leaving the context closes the connection, so a reader that stops early does not
+        download the rest of the body. With an archive the full body is read (to record
+        it) or replayed, and handed over as a single chunk.
+        """
+        if self._archive is not None:
+            key = request_key("GET", url)
+            if self._archive.replay:
+                resp = self._archive.replay_response(key, method="GET", url=url)
+            else:
+                self._throttle(url)
+                resp = self._client.get(url, headers=headers)
+            if resp.status_code == 304:
+                yield StreamedBody(chunks=None)
+                return
+            resp.raise_for_status()
+            if not self._archive.replay:
+                self._archive.record(key, resp)
+            yield StreamedBody(
+                chunks=iter([resp.content]),
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+            return
+
+        self._throttle(url)
+        with self._client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304:
+                yield StreamedBody(chunks=None)
+                return
+            resp.raise_for_status()
+            yield StreamedBody(
+                chunks=resp.iter_bytes(),
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+
+    def _throttle(self, url: str) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(host_key(url))
+
     def close(self) -> None:
         self._client.close()
 
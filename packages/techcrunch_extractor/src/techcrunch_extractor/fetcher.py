@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable
+import sys
+from typing import Any, Iterable, Iterator, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import xml.etree.ElementTree as ET
 
-from .client import TechCrunchClient
+from .cache import HttpCache
+from .client import StreamedBody, TechCrunchClient
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TechCrunchRssItem:
     guid: str | None
     title: str | None
@@ -18,69 +23,253 @@ class TechCrunchRssItem:
     categories: list[str]
     author: str | None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "guid": self.guid,
+            "title": self.title,
+            "link": self.link,
+            "description": self.description,
+            "pub_date": self.pub_date,
+            "categories": list(self.categories),
+            "author": self.author,
+        }
+
+
+@dataclass(frozen=True)
+class FeedResult:
+    """One feed's items from `fetch_feeds`, or the error that stopped it."""
+
+    rss_url: str
+    items: list[TechCrunchRssItem] = field(default_factory=list)
+    error: Exception | None = None
+
 
 def fetch_rss_items(
     client: TechCrunchClient,
     *,
     rss_url: str = "https://techcrunch.com/feed/",
     limit: int = 25,
+    cache: HttpCache | None = None,
 ) -> list[TechCrunchRssItem]:
-    xml_text = client.get_text(rss_url)
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as exc:
-        snippet = (xml_text or "").strip().replace("\n", " ")[:200]
-        raise RuntimeError(
-            f"Failed to parse RSS XML from {rss_url}. Response may not be RSS. "
-            f"Details: {exc}. First chars: {snippet!r}"
-        ) from exc
+    """Fetch and parse an RSS feed.
+
+    With `cache`, the request is a conditional GET; if the feed is unchanged since
+    the last successful fetch (HTTP 304), returns `[]` without parsing anything. The
+    response's validators are staged on `cache`; `cache.commit()` them once the items
+    are written.
+    """
+    return list(iter_rss_items(client, rss_url=rss_url, limit=limit, cache=cache))
+
+
+def iter_rss_items(
+    client: TechCrunchClient,
+    *,
+    rss_url: str = "https://techcrunch.com/feed/",
+    limit: int | None = None,
+    cache: HttpCache | None = None,
+) -> Iterator[TechCrunchRssItem]:
+    """Yield RSS items as they are parsed from the streamed response body.
+
+    Memory stays flat for any feed size: finished `<item>` elements are dropped once
+    yielded, and the connection is closed as soon as `limit` items were produced (or
+    the caller stops iterating). Clients without `stream()` (only `get_text` /
+    `get_text_conditional`) are parsed the same way from the full text.
+    """
+    if limit is not None and limit <= 0:
+        return
+    with _open_body(client, rss_url, cache) as body:
+        if body.not_modified:
+            return
+        assert body.chunks is not None
+        count = 0
+        for item in parse_rss_stream(body.chunks, source=rss_url):
+            yield item
+            count += 1
+            if limit is not None and count >= limit:
+                break
+
+        if cache is not None:
+            # Only stage validators once the body parsed successfully; the caller commits
+            # them after the items are written.
+            cache.stage(rss_url, etag=body.etag, last_modified=body.last_modified)
+
+
+def parse_rss_stream(
+    chunks: Iterable[bytes | str], *, source: str = "<stream>"
+) -> Iterator[TechCrunchRssItem]:
+    """Incrementally parse RSS 2.0 from byte (or text) chunks.
+
+    Only `<item>`s of the first `<channel>` under the root are yielded, matching
+    `root.find("channel").findall("item")`.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    head = ""
+    depth = 0
+    channel: ET.Element | None = None
+    in_channel = False
+
+    def events() -> Iterator[tuple[str, ET.Element]]:
+        nonlocal head
+        try:
+            for chunk in chunks:
+                if len(head) < 200:
+                    head += chunk if isinstance(chunk, str) else chunk[:200].decode("utf-8", "replace")
+                parser.feed(chunk)
+                yield from parser.read_events()
+            parser.close()
+            yield from parser.read_events()
+        except ET.ParseError as exc:
+            snippet = head.strip().replace("\n", " ")[:200]
+            raise RuntimeError(
+                f"Failed to parse RSS XML from {source}. Response may not be RSS. "
+                f"Details: {exc}. First chars: {snippet!r}"
+            ) from exc
+
+    for event, el in events():
+        if event == "start":
+            depth += 1
+            if depth == 2 and el.tag == "channel" and channel is None:
+                channel = el
+                in_channel = True
+            continue
+
+        depth -= 1
+        if in_channel and depth == 2 and el.tag == "item":
+            yield _item_from_element(el)
+            channel.remove(el)  # type: ignore[union-attr]
+        elif depth == 1 and el is channel:
+            in_channel = False
+        elif depth == 1:
+            el.clear()
 
-    channel = root.find("channel")
     if channel is None:
         raise RuntimeError(
-            f"RSS channel element not found for {rss_url}. Response may not be an RSS feed."
+            f"RSS channel element not found for {source}. Response may not be an RSS feed."
         )
 
-    items: list[TechCrunchRssItem] = []
-    for item_el in channel.findall("item"):
-        if len(items) >= limit:
-            break
-
-        title = _text(item_el, "title")
-        link = _text(item_el, "link")
-        guid = _text(item_el, "guid")
-        description = _text(item_el, "description")
-        pub_date = _text(item_el, "pubDate")
-
-        categories = [
-            (c.text or "").strip()
-            for c in item_el.findall("category")
-            if (c.text or "").strip()
-        ]
-
-        author = None
-        for child in item_el:
-            if child.tag.endswith("creator") and (child.text or "").strip():
-                author = (child.text or "").strip()
-                break
 
-        items.append(
-            TechCrunchRssItem(
-                guid=guid,
-                title=title,
-                link=link,
-                description=description,
-                pub_date=pub_date,
-                categories=categories,
-                author=author,
-            )
-        )
-    return items
+def fetch_feeds(
+    client: TechCrunchClient,
+    rss_urls: Sequence[str],
+    *,
+    limit: int = 25,
+    cache: HttpCache | None = None,
+    max_workers: int = 8,
+) -> list[FeedResult]:
+    """Fetch several RSS feeds (e.g. category and tag feeds) concurrently.
+
+    All feeds share `client` and so one connection pool; at most `max_workers` are in
+    flight at once. `limit` applies per feed. Results come back in the order of
+    `rss_urls` (repeated URLs are fetched once), and a failing feed yields a
+    `FeedResult` with `error` set instead of aborting the others. Use
+    `merge_feed_items` to combine them.
+    """
+    urls = list(dict.fromkeys(rss_urls))
+    if not urls:
+        return []
+
+    def _one(url: str) -> FeedResult:
+        try:
+            return FeedResult(rss_url=url, items=fetch_rss_items(client, rss_url=url, limit=limit, cache=cache))
+        except Exception as exc:
+            return FeedResult(rss_url=url, error=exc)
+
+    workers = max(1, min(int(max_workers), len(urls)))
+    if workers == 1:
+        return [_one(u) for u in urls]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_one, urls))
+
+
+def merge_feed_items(results: Iterable[FeedResult]) -> list[TechCrunchRssItem]:
+    """Merge feed results in order, keeping the first copy of each article.
+
+    An item is a duplicate if its GUID or its canonical link (see `canonical_link`)
+    was already seen in an earlier feed or earlier in the same feed.
+    """
+    seen_guids: set[str] = set()
+    seen_links: set[str] = set()
+    out: list[TechCrunchRssItem] = []
+    for result in results:
+        for item in result.items:
+            link = canonical_link(item.link) if item.link else None
+            if (item.guid and item.guid in seen_guids) or (link and link in seen_links):
+                continue
+            if item.guid:
+                seen_guids.add(item.guid)
+            if link:
+                seen_links.add(link)
+            out.append(item)
+    return out
 
 
-def _text(parent: ET.Element, tag: str) -> str | None:
-    el = parent.find(tag)
+def canonical_link(url: str) -> str:
+    """Normalize an article link for comparison across feeds.
+
+    Lowercases scheme and host, drops the fragment, `utm_*` tracking parameters and a
+    trailing slash on the path.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(
+        [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.lower().startswith("utm_")]
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def rss_item_key(item: TechCrunchRssItem) -> str | None:
+    """Stable de-duplication key for an RSS item: its GUID, else its link."""
+    return item.guid or item.link
+
+
+def _item_from_element(item_el: ET.Element) -> TechCrunchRssItem:
+    # One pass over the children instead of a find() per field. Like find(), the
+    # first child with a given tag wins, even if it is empty; the author is the first
+    # non-empty `*creator`.
+    first: dict[str, ET.Element] = {}
+    categories: list[str] = []
+    author = None
+    for child in item_el:
+        tag = child.tag
+        first.setdefault(tag, child)
+        if tag == "category":
+            val = (child.text or "").strip()
+            if val:
+                # Category names repeat across items; share one string object per name.
+                categories.append(sys.intern(val))
+        elif author is None and tag.endswith("creator"):
+            author = (child.text or "").strip() or None
+
+    return TechCrunchRssItem(
+        guid=_text(first.get("guid")),
+        title=_text(first.get("title")),
+        link=_text(first.get("link")),
+        description=_text(first.get("description")),
+        pub_date=_text(first.get("pubDate")),
+        categories=categories,
+        author=author,
+    )
+
+
+def _text(el: ET.Element | None) -> str | None:
     if el is None:
         return None
     val = (el.text or "").strip()
     return val or None
+
+
+@contextmanager
+def _open_body(client, url: str, cache: HttpCache | None) -> Iterator[StreamedBody]:
+    headers = cache.conditional_headers(url) if cache is not None else None
+    if hasattr(client, "stream"):
+        with client.stream(url, headers=headers) as body:
+            yield body
+        return
+    if cache is None:
+        yield StreamedBody(chunks=iter([client.get_text(url)]))
+        return
+    resp = client.get_text_conditional(url, headers=headers)
+    if resp.not_modified:
+        yield StreamedBody(chunks=None)
+        return
+    yield StreamedBody(chunks=iter([resp.text or ""]), etag=resp.etag, last_modified=resp.last_modified)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from techcrunch_extractor.archive import ArchiveMissError, ResponseArchive
+from techcrunch_extractor.client import TechCrunchClient
+from techcrunch_extractor.fetcher import fetch_rss_items
+
+FEED = "https://techcrunch.com/feed/"
+
+
+def _client(archive: ResponseArchive, handler) -> TechCrunchClient:
+    client = TechCrunchClient(archive=archive)
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_archive_records_then_replays_without_network(tmp_path) -> None:
+    xml = (Path(__file__).parent / "fixtures" / "sample_rss.xml").read_bytes()
+    calls: list[str] = []
+
+    def live(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, content=xml, headers={"Content-Type": "application/rss+xml", "ETag": '"v1"'})
+
+    with ResponseArchive(tmp_path) as archive, _client(archive, live) as client:
+        recorded = fetch_rss_items(client, rss_url=FEED, limit=10)
+        fetch_rss_items(client, rss_url=FEED, limit=10)
+        history = archive.history(FEED)
+
+    assert len(calls) == 2
+    assert [e.headers.get("etag") for e in history] == ['"v1"', '"v1"']
+    # Identical bodies are stored once.
+    assert len(list((tmp_path / "objects").rglob("*.gz"))) == 1
+
+    def offline(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("replay must not touch the network")
+
+    with ResponseArchive(tmp_path, replay=True) as archive, _client(archive, offline) as client:
+        assert fetch_rss_items(client, rss_url=FEED, limit=10) == recorded
+        with pytest.raises(ArchiveMissError):
+            client.get_text("https://techcrunch.com/other-feed/")
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
 
-from techcrunch_extractor.fetcher import fetch_rss_items
+import pytest
+
+from techcrunch_extractor.cache import HttpCache
+from techcrunch_extractor.client import ConditionalText, StreamedBody
+from techcrunch_extractor.fetcher import fetch_feeds, fetch_rss_items, iter_rss_items, merge_feed_items
 from techcrunch_extractor.normalizer import normalize_rss_item
 
 
@@ -39,3 +44,124 @@ def test_normalize_rss_item_emits_model() -> None:
     assert normalized.url == "https://techcrunch.com/2026/02/01/example/"
     assert normalized.published_at is not None
     assert "$OPENAI" in normalized.entities
+
+
+class _ConditionalClient:
+    def __init__(self, xml_text: str):
+        self._xml_text = xml_text
+        self.seen_headers: list[dict[str, str]] = []
+
+    def get_text_conditional(self, url: str, *, headers: dict[str, str] | None = None) -> ConditionalText:
+        self.seen_headers.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return ConditionalText(text=None)
+        return ConditionalText(text=self._xml_text, etag='"v1"', last_modified="Mon, 02 Feb 2026 12:34:56 GMT")
+
+
+def test_fetch_rss_items_conditional_get_short_circuits_on_304(tmp_path) -> None:
+    xml_text = (Path(__file__).parent / "fixtures" / "sample_rss.xml").read_text(encoding="utf-8")
+    client = _ConditionalClient(xml_text)
+    cache = HttpCache(tmp_path)
+
+    first = fetch_rss_items(client, rss_url="https://example.invalid/feed", limit=10, cache=cache)
+    assert cache.staged == ["https://example.invalid/feed"]
+    # Validators are staged until the caller commits (after writing the output).
+    retried = fetch_rss_items(client, rss_url="https://example.invalid/feed", limit=10, cache=cache)
+    cache.commit()
+    second = fetch_rss_items(client, rss_url="https://example.invalid/feed", limit=10, cache=cache)
+
+    assert len(first) == len(retried) == 1
+    assert second == []
+    assert client.seen_headers[0] == client.seen_headers[1] == {}
+    assert client.seen_headers[2] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 02 Feb 2026 12:34:56 GMT",
+    }
+
+
+class _StreamingClient:
+    def __init__(self, xml_bytes: bytes, chunk_size: int):
+        self._xml = xml_bytes
+        self._chunk_size = chunk_size
+        self.chunks_read = 0
+
+    @contextmanager
+    def stream(self, url: str, *, headers: dict[str, str] | None = None):
+        def chunks():
+            for i in range(0, len(self._xml), self._chunk_size):
+                self.chunks_read += 1
+                yield self._xml[i : i + self._chunk_size]
+
+        yield StreamedBody(chunks=chunks())
+
+
+def test_streaming_parse_is_chunking_invariant_and_stops_reading_at_limit() -> None:
+    fixture = (Path(__file__).parent / "fixtures" / "sample_rss.xml").read_bytes()
+    expected = fetch_rss_items(_DummyClient(fixture.decode("utf-8")), rss_url="https://example.invalid/feed")
+
+    assert fetch_rss_items(_StreamingClient(fixture, 7), rss_url="https://example.invalid/feed") == expected
+
+    item = b"<item><guid>g</guid><title>t</title></item>"
+    big = b"<rss><channel>" + item * 50_000 + b"</channel></rss>"
+    client = _StreamingClient(big, 4096)
+    items = list(iter_rss_items(client, rss_url="https://example.invalid/feed", limit=3))
+
+    assert [i.guid for i in items] == ["g", "g", "g"]
+    assert client.chunks_read == 1
+
+
+def _rss(*items: tuple[str | None, str]) -> str:
+    body = "".join(
+        "<item>"
+        + (f"<guid>{guid}</guid>" if guid else "")
+        + f"<title>{link}</title><link>{link}</link></item>"
+        for guid, link in items
+    )
+    return f"<rss><channel>{body}</channel></rss>"
+
+
+class _FeedsClient:
+    def __init__(self, feeds: dict[str, str]):
+        self._feeds = feeds
+
+    def get_text(self, url: str) -> str:
+        if url not in self._feeds:
+            raise RuntimeError(f"404 for {url}")
+        return self._feeds[url]
+
+
+def test_fetch_feeds_merges_in_order_and_dedupes_across_feeds() -> None:
+    client = _FeedsClient(
+        {
+            "https://tc.invalid/feed/": _rss(("g1", "https://techcrunch.com/a/"), ("g2", "https://techcrunch.com/b/")),
+            "https://tc.invalid/category/ai/feed/": _rss(
+                ("g2", "https://techcrunch.com/b/"),
+                (None, "https://TechCrunch.com/a?utm_source=rss#comments"),
+                ("g3", "https://techcrunch.com/c/"),
+            ),
+        }
+    )
+    urls = ["https://tc.invalid/feed/", "https://tc.invalid/missing/", "https://tc.invalid/category/ai/feed/"]
+
+    results = fetch_feeds(client, urls + urls[:1], limit=10, max_workers=3)
+
+    assert [r.rss_url for r in results] == urls
+    assert results[1].error is not None and results[1].items == []
+    assert [i.guid for i in merge_feed_items(results)] == ["g1", "g2", "g3"]
+
+
+def test_write_parquet_keeps_raw_in_its_own_column(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    from techcrunch_extractor.columnar import write_parquet
+
+    xml_text = (Path(__file__).parent / "fixtures" / "sample_rss.xml").read_text(encoding="utf-8")
+    item = normalize_rss_item(fetch_rss_items(_DummyClient(xml_text), rss_url="https://example.invalid/feed")[0])
+
+    (path,) = write_parquet([item], tmp_path / "pq")
+
+    table = pq.read_table(path, columns=["source_record_id", "published_at", "tags"])
+    assert table.column_names == ["source_record_id", "published_at", "tags"]
+    assert table.to_pylist()[0]["tags"] == ["Startups", "Funding"]
+    assert "tc-fixture-guid-1" in pq.read_table(path, columns=["raw_json"]).column("raw_json")[0].as_py()
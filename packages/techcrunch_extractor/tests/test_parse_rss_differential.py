@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import random
+from xml.sax.saxutils import escape
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from techcrunch_extractor.fetcher import TechCrunchRssItem, parse_rss_stream
+
+# Reference: the ElementTree implementation that `parse_rss_stream` replaced, inlined
+# verbatim (apart from returning all items) so the streaming parser is checked against
+# it rather than against itself.
+
+
+def _reference_items(xml_text: str, rss_url: str) -> list[TechCrunchRssItem]:
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError as exc:
+        snippet = (xml_text or "").strip().replace("\n", " ")[:200]
+        raise RuntimeError(
+            f"Failed to parse RSS XML from {rss_url}. Response may not be RSS. "
+            f"Details: {exc}. First chars: {snippet!r}"
+        ) from exc
+
+    channel = root.find("channel")
+    if channel is None:
+        raise RuntimeError(
+            f"RSS channel element not found for {rss_url}. Response may not be an RSS feed."
+        )
+
+    items: list[TechCrunchRssItem] = []
+    for item_el in channel.findall("item"):
+        title = _reference_text(item_el, "title")
+        link = _reference_text(item_el, "link")
+        guid = _reference_text(item_el, "guid")
+        description = _reference_text(item_el, "description")
+        pub_date = _reference_text(item_el, "pubDate")
+
+        categories = [
+            (c.text or "").strip()
+            for c in item_el.findall("category")
+            if (c.text or "").strip()
+        ]
+
+        author = None
+        for child in item_el:
+            if child.tag.endswith("creator") and (child.text or "").strip():
+                author = (child.text or "").strip()
+                break
+
+        items.append(
+            TechCrunchRssItem(
+                guid=guid,
+                title=title,
+                link=link,
+                description=description,
+                pub_date=pub_date,
+                categories=categories,
+                author=author,
+            )
+        )
+    return items
+
+
+def _reference_text(parent: ET.Element, tag: str) -> str | None:
+    el = parent.find(tag)
+    if el is None:
+        return None
+    val = (el.text or "").strip()
+    return val or None
+
+
+_WORDS = ["AI", "seed", "Series A", "raises", "$25M", "café", "機械学習", "a & b", "<x>", "  ", "\n"]
+_FIELDS = ["title", "link", "guid", "description", "pubDate", "category", "category"]
+_CREATORS = ["dc:creator", "creator", "xcreator", "author"]
+
+
+def _text(rng: random.Random) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 4)))
+    if rng.random() < 0.15 and "]]>" not in text:
+        return f"<![CDATA[{text}]]>"
+    return escape(text)
+
+
+def _item(rng: random.Random) -> str:
+    children = []
+    for _ in range(rng.randint(0, 8)):
+        tag = rng.choice(_FIELDS + _CREATORS + ["media:content"])
+        if tag == "media:content" or rng.random() < 0.05:
+            children.append(f"<{tag}/>")
+        else:
+            children.append(f"<{tag}>{_text(rng)}</{tag}>")
+    if rng.random() < 0.1:
+        # An item nested below an item is not a channel item.
+        children.append("<item><guid>nested</guid></item>")
+    return "<item>" + "".join(children) + "</item>"
+
+
+def _channel(rng: random.Random) -> str:
+    parts = ["<title>feed</title>"]
+    for _ in range(rng.randint(0, 6)):
+        roll = rng.random()
+        if roll < 0.8:
+            parts.append(_item(rng))
+        elif roll < 0.9:
+            parts.append(f"<group>{_item(rng)}</group>")
+        else:
+            parts.append("<image><url>https://x/y.png</url></image>")
+    return "<channel>" + "".join(parts) + "</channel>"
+
+
+def _document(rng: random.Random) -> str:
+    parts = []
+    roll = rng.random()
+    if roll < 0.1:
+        parts.append("<meta><channel>" + _item(rng) + "</channel></meta>")
+    if roll < 0.9:
+        parts.append(_channel(rng))
+    if rng.random() < 0.2:
+        parts.append(_channel(rng))  # a second channel is ignored
+    root = rng.choice(["rss", "rss", "feed"])
+    ns = ' xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:media="http://search.yahoo.com/mrss/"'
+    prolog = '<?xml version="1.0" encoding="UTF-8"?>\n' if rng.random() < 0.5 else ""
+    return f"{prolog}<{root}{ns}>{''.join(parts)}</{root}>"
+
+
+def _chunks(data: bytes, rng: random.Random) -> list[bytes]:
+    # Random cut points, including inside multi-byte UTF-8 sequences.
+    cuts = sorted(rng.sample(range(1, len(data)), min(len(data) - 1, rng.randint(0, 12))))
+    return [data[a:b] for a, b in zip([0, *cuts], [*cuts, len(data)])]
+
+
+def _outcome(fn):
+    try:
+        return fn()
+    except RuntimeError as exc:
+        # ElementTree reports positions differently for whole-text and pull parsing.
+        return ("error", str(exc).split(" Details:")[0])
+
+
+def test_parse_rss_stream_matches_elementtree_reference_on_random_feeds() -> None:
+    rng = random.Random(20260218)
+    url = "https://example.invalid/feed"
+    for _ in range(3000):
+        doc = _document(rng)
+        expected = _outcome(lambda: _reference_items(doc, url))
+        got = _outcome(lambda: list(parse_rss_stream(_chunks(doc.encode("utf-8"), rng), source=url)))
+        assert got == expected, doc
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        "",
+        "   ",
+        "not xml at all",
+        "<html><body>Blocked</body></html>",
+        "<rss><channel><item><title>cut off",
+        "<rss><channel><item><title>x</title></item></channel>",
+        "<rss><channel><item><title>a &bogus; b</title></item></channel></rss>",
+        "<rss></rss><rss></rss>",
+        "<rss><item><title>no channel</title></item></rss>",
+        "<rss><meta><channel><item/></channel></meta></rss>",
+    ],
+)
+def test_parse_rss_stream_matches_reference_on_errors(doc: str) -> None:
+    url = "https://example.invalid/feed"
+    expected = _outcome(lambda: _reference_items(doc, url))
+    assert expected[0] == "error"
+    assert _outcome(lambda: list(parse_rss_stream([doc.encode("utf-8")], source=url))) == expected
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from techcrunch_extractor.ratelimit import TokenBucket, host_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.t = 100.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_token_bucket_burst_then_paces_per_key() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(2.0, burst=2, clock=clock)
+
+    assert [bucket.reserve("a") for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve("a") == pytest.approx(0.5)
+    assert bucket.reserve("b") == 0.0
+
+    clock.t += 10.0
+    assert bucket.reserve("a") == 0.0
+    per_minute = TokenBucket.per_minute(120)
+    assert per_minute.reserve() == 0.0
+    assert per_minute.reserve() == pytest.approx(0.5, abs=0.05)
+    assert host_key("https://API.example.com/v4/x") == "api.example.com"
+
+
+def test_cli_rate_limit_is_off_by_default_and_bursts_to_concurrency() -> None:
+    from techcrunch_extractor.cli import _DEFAULT_REQUESTS_PER_MINUTE, _rate_limiter
+
+    assert _rate_limiter(_DEFAULT_REQUESTS_PER_MINUTE, burst=8) is None
+    bucket = _rate_limiter(30, burst=8)
+    assert bucket is not None
+    assert [bucket.reserve("techcrunch.com") for _ in range(8)] == [0.0] * 8
+    assert bucket.reserve("techcrunch.com") > 0.0
@@ -9,6 +9,12 @@ __all__ = [
     "export",
     "pipeline",
     "kg",
+    "cache",
+    "archive",
+    "state",
+    "store",
+    "columnar",
+    "cluster",
 ]
 
 __version__ = "0.1.0"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: str
+
+
+class HttpCache:
+    """Persistent, URL-keyed store of HTTP validators for conditional GETs.
+
+    One small JSON file per URL (named by the SHA-256 of the URL) keeps the
+    `ETag` / `Last-Modified` of the last successfully processed response.
+
+    Fetchers `stage()` validators rather than `put()` them; the caller `commit()`s
+    once the response's items are written, so a failed export does not turn the next
+    run into a 304 that skips them.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._dir = Path(directory)
+        self._staged: dict[str, tuple[str | None, str | None]] = {}
+
+    def get(self, url: str) -> CacheEntry | None:
+        path = self._path(url)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("url") != url:
+            return None
+        return CacheEntry(
+            url=url,
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            fetched_at=str(data.get("fetched_at") or ""),
+        )
+
+    def put(self, url: str, *, etag: str | None, last_modified: str | None) -> None:
+        if not etag and not last_modified:
+            # Nothing to revalidate with; drop any stale entry.
+            self.delete(url)
+            return
+        entry = CacheEntry(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+        )
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(entry), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def stage(self, url: str, *, etag: str | None, last_modified: str | None) -> None:
+        """Remember validators to `put()` on the next `commit()`."""
+        self._staged[url] = (etag, last_modified)
+
+    def commit(self) -> None:
+        """Store all staged validators."""
+        staged, self._staged = self._staged, {}
+        for url, (etag, last_modified) in staged.items():
+            self.put(url, etag=etag, last_modified=last_modified)
+
+    @property
+    def staged(self) -> list[str]:
+        return list(self._staged)
+
+    def delete(self, url: str) -> None:
+        self._path(url).unlink(missing_ok=True)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        entry = self.get(url)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _path(self, url: str) -> Path:
+        return self._dir / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
+import json
+import operator
+from pathlib import Path
+import re
+import sys
+from typing import Any, Iterable, Sequence
+
+from .store import IntelStore, StoredItem, record_dict, record_row
+
+# Members kept per LSH bucket. Caps the work for buckets shared by many items (e.g. one
+# story syndicated everywhere) so clustering stays linear; later members would only
+# lead to the same clusters.
+_MAX_BUCKET_MEMBERS = 8
+# Lowest probability that a pair at exactly `threshold` similarity shares a band.
+_MIN_RECALL = 0.9
+
+# Matched against lowercased text.
+_AMOUNT_RE = re.compile(
+    r"(?:\$|\busd\s?)\s?(?P<value>\d+(?:,\d{3})*(?:\.\d+)?)\s?(?P<unit>k|mn|m|bn|b|thousand|million|billion)?\b"
+    r"|\b(?P<plain>\d{4,})(?:\.\d+)?\s?(?:usd|dollars)\b"
+)
+_UNITS = {
+    "k": 1e3,
+    "thousand": 1e3,
+    "m": 1e6,
+    "mn": 1e6,
+    "million": 1e6,
+    "b": 1e9,
+    "bn": 1e9,
+    "billion": 1e9,
+}
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Function words, plus words nearly every AI funding story shares ("ai", "raises", ...).
+_STOPWORDS = frozenset(
+    """
+    a about after all also an and are as at be been but by can for from has have how in into is it its
+    just new not of on or our over says said than that the their this to up was we were what when which
+    who will with you your
+    ai announced announces funding funds money raise raised raises raising round rounds led startup
+    company companies million billion usd
+    """.split()
+)
+
+
+@dataclass(frozen=True)
+class ClusterItem:
+    """The fields clustering reads from a record, whatever its source."""
+
+    uid: str
+    source: str
+    title: str | None
+    summary: str | None
+    published_ts: float | None
+    entities: list[str]
+
+
+def cluster_records(
+    records: Iterable[Any],
+    *,
+    window: timedelta = timedelta(days=3),
+    threshold: float = 0.4,
+    num_perm: int = 64,
+    summary_tokens: int = 20,
+    seed: int = 1,
+) -> list[str]:
+    """Group near-duplicate stories across sources; returns one cluster ID per record.
+
+    Accepts everything `IntelStore.add` does (`IntelRecord`s, `InvestmentIntelItem`s
+    from any extractor, their JSON dicts) and `StoredItem`s. Each record becomes a set
+    of tokens: the title, the first `summary_tokens` words of the summary, money amounts
+    normalized to whole dollars (`$25M` and `25000000 USD` match) and its entities.
+
+    Two records are near-duplicates when they share at least two tokens and the overlap
+    coefficient of their sets (shared tokens / size of the smaller set) is at least
+    `threshold`. Plain Jaccard similarity would keep a Crunchbase round (company name,
+    amount, `ORG:` entity) apart from a long article about it. Records whose `ORG:`
+    entities are all different are never near-duplicates, even with the same amount.
+    Candidates come from MinHash LSH and from records sharing an amount or `ORG:`
+    entity; each one is checked on the exact token sets.
+
+    Clusters are built in publication order. A record joins the most similar cluster
+    whose first record is a near-duplicate of it, published at most `window` earlier.
+    Otherwise it starts a new cluster. Comparing against the first record rather than
+    any member keeps chains of slightly different stories from merging.
+
+    Runs in roughly linear time. Records are sorted by publication time and blocked
+    into `window`-wide slots. LSH band buckets are only shared within a slot and the one
+    before it, and each bucket keeps only its first few members. Memory for signatures
+    and token sets is bounded by two slots. Undated records (e.g. Crunchbase
+    organizations) only cluster with each other.
+
+    IDs are derived from the earliest record of each cluster, so they do not depend on
+    the input order. Singletons get an ID too.
+    """
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError("threshold must be in (0, 1]")
+    if window.total_seconds() <= 0:
+        raise ValueError("window must be positive")
+    items = [cluster_item(r) for r in records]
+    hasher = MinHasher(num_perm=num_perm, seed=seed)
+    rows = _lsh_rows(num_perm, threshold)
+    bands = num_perm // rows
+    window_s = window.total_seconds()
+
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (items[i].published_ts is None, items[i].published_ts or 0.0, items[i].uid),
+    )
+    # Position in `order` of each record's cluster leader: its first (earliest) record.
+    leader = list(range(len(order)))
+    slots: dict[Any, list[dict[tuple[int, ...], list[int]]]] = {}
+    signatures: dict[int, tuple[int, ...]] = {}
+    token_sets: dict[int, frozenset[str]] = {}
+    # Per slot: positions of the records holding each amount or `ORG:` token.
+    anchors: dict[Any, dict[str, list[int]]] = {}
+    slot_members: dict[Any, list[int]] = {}
+    for pos, i in enumerate(order):
+        ts = items[i].published_ts
+        slot = None if ts is None else int(ts // window_s)
+        if slot not in slots:
+            # Time only moves forward: slots older than the previous one are done.
+            for old in [s for s in slots if s is None or slot is None or s < slot - 1]:
+                for p in slot_members.pop(old):
+                    signatures.pop(p, None)
+                    token_sets.pop(p, None)
+                del slots[old]
+                del anchors[old]
+            slots[slot] = [{} for _ in range(bands)]
+            anchors[slot] = {}
+            slot_members[slot] = []
+
+        tokens = frozenset(item_tokens(items[i], summary_tokens=summary_tokens))
+        sig = hasher.signature(tokens)
+        if sig is None:
+            continue
+        signatures[pos] = sig
+        token_sets[pos] = tokens
+        slot_members[slot].append(pos)
+        neighbours = [slots[slot]]
+        if slot is not None and slot - 1 in slots:
+            neighbours.append(slots[slot - 1])
+
+        candidates: set[int] = set()
+        for band in range(bands):
+            # Strided, not contiguous: densification copies values into neighbouring
+            # bins, so adjacent positions are correlated.
+            key = sig[band : bands * rows : bands]
+            for buckets in neighbours:
+                for other in buckets[band].get(key, ()):
+                    candidates.add(leader[other])
+            members = slots[slot][band].setdefault(key, [])
+            if len(members) < _MAX_BUCKET_MEMBERS:
+                members.append(pos)
+        for token in tokens:
+            if not (token.startswith("$") or token.startswith("org:")):
+                continue
+            for s in (slot, slot - 1) if slot is not None else (slot,):
+                for other in anchors.get(s, {}).get(token, ()):
+                    candidates.add(leader[other])
+            members = anchors[slot].setdefault(token, [])
+            if len(members) < _MAX_BUCKET_MEMBERS:
+                members.append(pos)
+
+        best, best_score = pos, threshold
+        for candidate in sorted(candidates):
+            candidate_tokens = token_sets.get(candidate)
+            if candidate_tokens is None:
+                continue
+            candidate_ts = items[order[candidate]].published_ts
+            if ts is not None and candidate_ts is not None and ts - candidate_ts > window_s:
+                continue
+            score = _overlap(tokens, candidate_tokens)
+            if score >= best_score and (best == pos or score > best_score):
+                best, best_score = candidate, score
+        leader[pos] = best
+
+    ids: dict[int, str] = {}
+    out = [""] * len(items)
+    for pos, i in enumerate(order):
+        first = leader[pos]
+        if first not in ids:
+            digest = hashlib.blake2b(items[order[first]].uid.encode("utf-8"), digest_size=8).hexdigest()
+            ids[first] = f"cluster:{digest}"
+        out[i] = ids[first]
+    return out
+
+
+class MinHasher:
+    """MinHash signatures of `num_perm` values over token sets.
+
+    Uses one-permutation hashing: each token is hashed once and kept as the minimum of
+    one of `num_perm` bins, so a signature costs O(tokens) instead of O(tokens x
+    num_perm). Bins no token fell into are filled by rotation densification (Shrivastava
+    & Li, 2014). That keeps signatures comparable, but for sets much smaller than
+    `num_perm` most bins are copies, and the estimate can be far above the true Jaccard
+    similarity. Use the estimate to find candidates, not to accept them. Tokens are
+    hashed with BLAKE2b keyed by `seed`, not `hash()`, so signatures and the cluster IDs
+    built on them are the same in every process.
+    """
+
+    def __init__(self, *, num_perm: int = 64, seed: int = 1) -> None:
+        if num_perm < 1:
+            raise ValueError("num_perm must be >= 1")
+        self.num_perm = num_perm
+        self._key = str(seed).encode("ascii")
+        # Larger than any bin value (`hash // num_perm`); offsets borrowed values.
+        self._offset = (1 << 64) // num_perm + 1
+
+    def signature(self, tokens: Iterable[str]) -> tuple[int, ...] | None:
+        """The signature of a token set, or None if it is empty."""
+        k = self.num_perm
+        sig: list[int | None] = [None] * k
+        for token in set(tokens):
+            value, bin_ = divmod(_token_hash(self._key, token), k)
+            current = sig[bin_]
+            if current is None or value < current:
+                sig[bin_] = value
+        filled = [j for j, v in enumerate(sig) if v is not None]
+        if not filled:
+            return None
+        if len(filled) < k:
+            # An empty bin takes the value of the next filled bin to its right
+            # (wrapping around), offset by the distance to it.
+            source = filled[0] + k
+            for j in range(k - 1, -1, -1):
+                if sig[j] is None:
+                    sig[j] = sig[source % k] + (source - j) * self._offset  # type: ignore[operator]
+                else:
+                    source = j
+        return tuple(sig)  # type: ignore[arg-type]
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the token sets behind two signatures."""
+    return sum(map(operator.eq, a, b)) / len(a)
+
+
+def cluster_item(record: Any) -> ClusterItem:
+    if isinstance(record, ClusterItem):
+        return record
+    if isinstance(record, StoredItem):
+        ts = record.published_at.timestamp() if record.published_at is not None else None
+        return ClusterItem(record.uid, record.source, record.title, record.summary, ts, list(record.entities))
+    row = record_row(record_dict(record))
+    return ClusterItem(row["uid"], row["source"], row["title"], row["summary"], row["published_ts"], row["entities"])
+
+
+def item_tokens(item: ClusterItem, *, summary_tokens: int = 20) -> list[str]:
+    tokens = text_tokens(item.title or "")
+    if item.summary and summary_tokens > 0:
+        tokens += text_tokens(" ".join(item.summary.split(None, summary_tokens)[:summary_tokens]))
+    tokens += [e.lower() for e in item.entities]
+    return tokens
+
+
+def text_tokens(text: str) -> list[str]:
+    """Lowercase words minus stopwords; money amounts become one `$<dollars>` token each."""
+    tokens: list[str] = []
+
+    def amount(m: re.Match[str]) -> str:
+        if m.group("plain"):
+            value = float(m.group("plain"))
+        else:
+            value = float(m.group("value").replace(",", "")) * _UNITS.get(m.group("unit") or "", 1)
+        tokens.append(f"${int(round(value))}")
+        return " "
+
+    text = text.lower()
+    if "$" in text or "usd" in text or "dollars" in text:
+        text = _AMOUNT_RE.sub(amount, text)
+    tokens.extend(w for w in _WORD_RE.findall(text) if w not in _STOPWORDS and len(w) > 1)
+    return tokens
+
+
+def _overlap(a: frozenset[str], b: frozenset[str]) -> float:
+    # Overlap coefficient, requiring two shared tokens (one shared amount or word is not
+    # a story) and no conflicting companies.
+    orgs_a = {t for t in a if t.startswith("org:")}
+    orgs_b = {t for t in b if t.startswith("org:")}
+    if orgs_a and orgs_b and not orgs_a & orgs_b:
+        return 0.0
+    shared = len(a & b)
+    if shared < 2 and a != b:
+        return 0.0
+    return shared / min(len(a), len(b))
+
+
+def _lsh_rows(num_perm: int, threshold: float) -> int:
+    # The most rows per band (fewest false candidates) that still makes a pair at
+    # `threshold` share at least one band with probability `_MIN_RECALL`.
+    best = 1
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold**rows) ** bands >= _MIN_RECALL:
+            best = rows
+    return best
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(key: bytes, token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8, key=key).digest(), "big")
+
+
+def _read_jsonl(paths: Sequence[Path]) -> Iterable[dict[str, Any]]:
+    for path in paths:
+        with Path(path).open("r", encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as exc:
+                    raise ValueError(f"{path}:{lineno}: invalid JSON: {exc}") from exc
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """`python -m techcrunch_intel.cluster (FILE... | --db PATH) ...`"""
+    parser = argparse.ArgumentParser(
+        prog="python -m techcrunch_intel.cluster",
+        description="Assign near-duplicate cluster IDs to intel items from every source.",
+    )
+    parser.add_argument("files", type=Path, nargs="*", help="JSONL from any extractor or techcrunch_intel")
+    parser.add_argument("--db", type=Path, help="Read items from an intel store instead of files")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="With --db: ISO date/time, inclusive")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="With --db: ISO date/time, exclusive")
+    parser.add_argument("--window-days", type=float, default=3.0)
+    parser.add_argument("--threshold", type=float, default=0.4)
+    args = parser.parse_args(argv)
+    if bool(args.files) == (args.db is not None):
+        parser.error("give either JSONL files or --db")
+
+    try:
+        if args.db is not None:
+            with IntelStore(args.db) as store:
+                items = [cluster_item(i) for i in store.query(since=args.since, until=args.until)]
+        else:
+            items = [cluster_item(r) for r in _read_jsonl(args.files)]
+        ids = cluster_records(items, window=timedelta(days=args.window_days), threshold=args.threshold)
+    except (OSError, ValueError) as exc:
+        print(json.dumps({"ok": False, "error": {"message": str(exc)}}), file=sys.stderr)
+        return 1
+
+    for item, cluster_id in zip(items, ids):
+        print(
+            json.dumps(
+                {"uid": item.uid, "cluster_id": cluster_id, "source": item.source, "title": item.title},
+                ensure_ascii=False,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+import gzip
+import io
 import json
+import os
 from pathlib import Path
-from typing import Iterable, Any
+import re
+from typing import Iterable, Iterator, Any, TextIO
 
+from .columnar import ParquetDatasetWriter, intel_record_row, intel_record_schema, require_pyarrow
+from .kg import KGBuilder
 from .models import IntelRecord
 
+_COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
 
 def export_kg_json(bundle: dict[str, Any], path: Path) -> None:
         """Write a KG-ready bundle to a single JSON file.
@@ -20,13 +29,180 @@ def export_kg_json(bundle: dict[str, Any], path: Path) -> None:
         path.write_text(json.dumps(bundle, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
+def export_kg_ndjson(
+    kg: dict[str, Any] | KGBuilder,
+    out_dir: Path,
+    *,
+    chunk_size: int | None = None,
+    compression: str | None = None,
+) -> list[Path]:
+    """Write entities and relationships as separate, compact NDJSON streams.
+
+    - Files: `entities.ndjson` and `relationships.ndjson`; with `chunk_size`, numbered
+      chunks (`entities-00000.ndjson`, ...) of at most `chunk_size` items each.
+    - `compression`: None, `"gzip"` (`.gz`) or `"zstd"` (`.zst`, requires `zstandard`).
+    - Items are streamed straight from a `KGBuilder` (or bundle dict); no pretty-printing.
+    - All files are written to temp files first and only renamed into place once both
+      streams are complete, so an error leaves the previous export untouched. Files
+      of an earlier export that are not part of the new one (e.g. surplus chunks from
+      a larger run) are then removed.
+
+    Returns the written paths in order.
+    """
+    if compression not in _COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression!r} (expected None, 'gzip' or 'zstd')")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    if isinstance(kg, KGBuilder):
+        streams = {"entities": kg.iter_entities(), "relationships": kg.iter_relationships()}
+    else:
+        streams = {"entities": iter(kg.get("entities") or []), "relationships": iter(kg.get("relationships") or [])}
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for name, items in streams.items():
+            _write_ndjson_chunks(
+                items, out_dir, name, chunk_size=chunk_size, compression=compression, staged=staged
+            )
+    except BaseException:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+    for tmp, path in staged:
+        os.replace(tmp, path)
+    written = [path for _, path in staged]
+    keep = set(written)
+    for name in streams:
+        pattern = re.compile(rf"{re.escape(name)}(-\d+)?\.ndjson(\.gz|\.zst)?")
+        for stale in out_dir.glob(f"{name}*.ndjson*"):
+            if stale not in keep and pattern.fullmatch(stale.name):
+                stale.unlink(missing_ok=True)
+    return written
+
+
+def _write_ndjson_chunks(
+    items: Iterator[dict[str, Any]],
+    out_dir: Path,
+    name: str,
+    *,
+    chunk_size: int | None,
+    compression: str | None,
+    staged: list[tuple[Path, Path]],
+) -> None:
+    # Appends `(temp file, final path)` per chunk to `staged`; the caller renames them.
+    suffix = ".ndjson" + _COMPRESSION_SUFFIXES[compression]
+    chunk_idx = 0
+    pending = next(items, None)
+    while True:
+        path = out_dir / (f"{name}-{chunk_idx:05d}{suffix}" if chunk_size else f"{name}{suffix}")
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        staged.append((tmp, path))
+        count = 0
+        with _open_compressed_writer(tmp, compression) as fh:
+            while pending is not None and (chunk_size is None or count < chunk_size):
+                fh.write(json.dumps(pending, ensure_ascii=False, separators=(",", ":")))
+                fh.write("\n")
+                count += 1
+                pending = next(items, None)
+        chunk_idx += 1
+        if pending is None:
+            return
+
+
+@contextmanager
+def _open_compressed_writer(path: Path, compression: str | None) -> Iterator[TextIO]:
+    if compression == "gzip":
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            yield fh
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError("zstd compression requires the 'zstandard' package") from exc
+        with path.open("wb") as raw:
+            with zstandard.ZstdCompressor().stream_writer(raw) as zfh:
+                with io.TextIOWrapper(zfh, encoding="utf-8") as fh:
+                    yield fh
+    else:
+        with path.open("w", encoding="utf-8") as fh:
+            yield fh
+
+
+def export_parquet(
+    records: Iterable[IntelRecord],
+    out_dir: Path,
+    *,
+    partition_by: str | None = None,
+    row_group_size: int = 50_000,
+    max_buffered_rows: int = 200_000,
+    include_raw: bool = True,
+    compression: str = "zstd",
+) -> list[Path]:
+    """Write records as a columnar Parquet dataset under `out_dir` (requires `pyarrow`).
+
+    - One flat, typed column per article and investment field; `raw` goes to its own
+      `raw_json` column (dropped with `include_raw=False`).
+    - Rows are written in row groups of `row_group_size`, with at most
+      `max_buffered_rows` held in memory across all partitions.
+    - `partition_by="month"` / `"day"` writes Hive-style `published_month=YYYY-MM/`
+      (or `published_day=...`) directories.
+
+    Returns the written files.
+    """
+    pa, _ = require_pyarrow()
+    schema = intel_record_schema(pa, include_raw=include_raw)
+    with ParquetDatasetWriter(
+        out_dir,
+        schema,
+        partition_by=partition_by,
+        row_group_size=row_group_size,
+        max_buffered_rows=max_buffered_rows,
+        compression=compression,
+    ) as writer:
+        for r in records:
+            writer.write(intel_record_row(r, include_raw=include_raw))
+    return writer.paths
+
+
 def export_json(records: Iterable[IntelRecord]) -> str:
     payload = [r.to_dict() for r in records]
     return json.dumps(payload, ensure_ascii=False, indent=2)
 
 
-def export_jsonl(records: Iterable[IntelRecord], path: Path) -> None:
-    lines = [json.dumps(r.to_dict(), ensure_ascii=False) for r in records]
+def export_jsonl(records: Iterable[IntelRecord], path: Path, *, append: bool = False) -> None:
+    """Stream records to JSONL one at a time; memory stays flat for any number of records.
+
+    Without `append`, the file is replaced atomically once all records are written.
+    """
+    with open_jsonl_writer(path, append=append) as fh:
+        for r in records:
+            fh.write(json.dumps(r.to_dict(), ensure_ascii=False))
+            fh.write("\n")
+
+
+@contextmanager
+def open_jsonl_writer(path: Path, *, append: bool = False) -> Iterator[TextIO]:
+    """Open `path` for streaming JSONL output.
+
+    - `append=False`: write to a sibling temp file and atomically rename it over
+      `path` on success; on error the temp file is removed and `path` is untouched.
+    - `append=True`: append to `path` in place.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    if append:
+        with path.open("a", encoding="utf-8") as fh:
+            yield fh
+        return
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            yield fh
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 import re
+from typing import Sequence
 
 from .models import Article, InvestmentSignal
 from .keywords import is_ai_related_text
@@ -28,20 +30,24 @@ _ACQUIRES_TITLE_RE = re.compile(
 
 _FUNDLIKE_RE = re.compile(r"\b(fund|funds)\b", re.IGNORECASE)
 
+_TITLE_PREFIX_RE = re.compile(r"^(exclusive:|report:)\s*", re.IGNORECASE)
+
+_LIST_FILLER_RE = re.compile(r"^(including|such as)\s+", re.IGNORECASE)
+
+_INVESTOR_MARKER_RES = tuple(
+    re.compile(re.escape(marker), re.IGNORECASE)
+    for marker in ("led by", "participation from", "backed by")
+)
+
 
 def extract_investment_signal(article: Article, *, full_text: str | None = None) -> InvestmentSignal:
     """Best-effort extraction from RSS title/summary (and optionally fetched full text)."""
 
-    text = "\n".join([article.title or "", article.summary or "", full_text or ""]).strip()
-    ai_context = "\n".join(
-        [
-            article.title or "",
-            article.summary or "",
-            " ".join(article.categories or []),
-            full_text or "",
-        ]
-    )
-    ai_relevant = is_ai_related_text(ai_context)
+    title = article.title or ""
+    text = "\n".join([title, article.summary or "", full_text or ""]).strip()
+    # Same result as matching the joined title/summary/categories/full text: no AI
+    # term contains a newline, so none can straddle the pieces.
+    ai_relevant = is_ai_related_text(text) or is_ai_related_text(" ".join(article.categories or []))
 
     company = _extract_company(article.title)
     amount_text = _extract_amount(text)
@@ -49,7 +55,8 @@ def extract_investment_signal(article: Article, *, full_text: str | None = None)
     investors = _extract_investors(text)
 
     notes = None
-    if _FUNDLIKE_RE.search(text) is not None and ("raises" in (article.title or "").lower() or "raised" in (article.title or "").lower()):
+    title_lower = title.lower()
+    if _FUNDLIKE_RE.search(text) is not None and ("raises" in title_lower or "raised" in title_lower):
         # Transparent annotation for stories about fund managers raising funds.
         notes = "fund_raise_story"
 
@@ -63,6 +70,35 @@ def extract_investment_signal(article: Article, *, full_text: str | None = None)
     )
 
 
+def extract_investment_signals(
+    articles: Sequence[Article],
+    *,
+    full_texts: Sequence[str | None] | None = None,
+    processes: int | None = None,
+    chunksize: int = 256,
+) -> list[InvestmentSignal]:
+    """Batch version of `extract_investment_signal`; results match it item for item.
+
+    - `full_texts`, if given, is aligned with `articles`.
+    - With `processes` > 1, work is spread over a process pool in chunks of
+      `chunksize` articles (worth it for large archives; small batches run inline).
+    """
+    if full_texts is None:
+        full_texts = [None] * len(articles)
+    elif len(full_texts) != len(articles):
+        raise ValueError("full_texts must be aligned with articles")
+
+    if not processes or processes <= 1 or len(articles) <= chunksize:
+        return [extract_investment_signal(a, full_text=t) for a, t in zip(articles, full_texts)]
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_extract_pair, articles, full_texts, chunksize=max(1, chunksize)))
+
+
+def _extract_pair(article: Article, full_text: str | None) -> InvestmentSignal:
+    return extract_investment_signal(article, full_text=full_text)
+
+
 def _extract_amount(text: str) -> str | None:
     m = _AMOUNT_RE.search(text)
     if not m:
@@ -96,7 +132,7 @@ def _extract_company(title: str) -> str | None:
         company = m2.group("company").strip()
 
     # Avoid grabbing prefixes like "Exclusive:" etc.
-    company = re.sub(r"^(exclusive:|report:)\s*", "", company, flags=re.IGNORECASE).strip()
+    company = _TITLE_PREFIX_RE.sub("", company).strip()
     return company or None
 
 
@@ -105,8 +141,8 @@ def _extract_investors(text: str) -> list[str]:
 
     # Very lightweight patterns.
     # Example: "... led by Sequoia Capital with participation from ..."
-    for marker in ("led by", "participation from", "backed by"):
-        frag = _slice_after_ci(text, marker)
+    for marker_re in _INVESTOR_MARKER_RES:
+        frag = _slice_after_re(text, marker_re)
         if frag:
             investors.extend(_split_org_list(frag))
 
@@ -138,9 +174,8 @@ def _slice_after(text: str, marker: str) -> str | None:
     return frag.strip() or None
 
 
-def _slice_after_ci(text: str, marker: str) -> str | None:
-    """Case-insensitive slice-after that preserves the original text casing."""
-    m = re.search(re.escape(marker), text, flags=re.IGNORECASE)
+def _slice_after_re(text: str, marker_re: re.Pattern[str]) -> str | None:
+    m = marker_re.search(text)
     if not m:
         return None
     frag = text[m.end() :]
@@ -160,7 +195,7 @@ def _split_org_list(fragment: str) -> list[str]:
     # Remove leading filler words
     cleaned: list[str] = []
     for p in parts:
-        p2 = re.sub(r"^(including|such as)\s+", "", p.strip(), flags=re.IGNORECASE)
+        p2 = _LIST_FILLER_RE.sub("", p.strip())
         if p2:
             cleaned.append(p2)
     return cleaned
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import sys
+import threading
 import time
-from typing import Any
+from typing import Any, Iterable, Sequence
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 
 import feedparser
 import httpx
 
-from .models import Article
+from .archive import ResponseArchive, request_key
+from .cache import HttpCache
+from .models import Article, FeedResult, FullTextResult
 
 
 def fetch_rss_entries(
@@ -16,42 +22,232 @@ def fetch_rss_entries(
     limit: int = 50,
     user_agent: str = "techcrunch-intel/0.1 (educational)",
     timeout_s: float = 30.0,
+    cache: HttpCache | None = None,
+    client: httpx.Client | None = None,
+    archive: ResponseArchive | None = None,
 ) -> list[Article]:
     """Fetch and parse a TechCrunch RSS feed into `Article` objects.
 
     Notes:
     - RSS is the intended access path.
     - Keep `limit` modest and cache in real usage.
+    - With `cache`, the request is a conditional GET (`If-None-Match` /
+      `If-Modified-Since`). An unchanged feed (HTTP 304) returns `[]` without parsing.
+      The new validators are only staged: call `cache.commit()` once the articles are
+      written, so a failed export does not hide them behind a 304 on the next run.
+    - With `client`, the request goes through that (pooled) client.
+    - With `archive`, the feed body is recorded; in replay mode it is served from the
+      archive with no network (and `cache` is ignored).
     """
 
-    resp = httpx.get(rss_url, headers={"User-Agent": user_agent}, timeout=timeout_s)
+    if archive is not None and archive.replay:
+        cache = None
+    headers = {"User-Agent": user_agent}
+    if cache is not None:
+        headers.update(cache.conditional_headers(rss_url))
+    resp = _get(rss_url, headers=headers, timeout_s=timeout_s, client=client, archive=archive)
+    if cache is not None and resp.status_code == 304:
+        return []
     resp.raise_for_status()
     parsed = feedparser.parse(resp.content)
     entries = list(parsed.entries or [])
     out: list[Article] = []
     for e in entries[: max(0, int(limit))]:
         out.append(_entry_to_article(e))
+    if cache is not None:
+        cache.stage(
+            rss_url,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
     return out
 
 
+def fetch_rss_feeds(
+    rss_urls: Sequence[str],
+    *,
+    limit: int = 50,
+    max_workers: int = 8,
+    user_agent: str = "techcrunch-intel/0.1 (educational)",
+    timeout_s: float = 30.0,
+    cache: HttpCache | None = None,
+    client: httpx.Client | None = None,
+    archive: ResponseArchive | None = None,
+) -> list[FeedResult]:
+    """Fetch several RSS feeds (e.g. category and tag feeds) concurrently over one pooled client.
+
+    - `limit` applies per feed.
+    - Results are returned in the order of `rss_urls`; repeated URLs are fetched once.
+    - A failing feed yields a `FeedResult` with `error` set; it never aborts the batch.
+    - `archive` records (or replays) every feed, as in `fetch_rss_entries`.
+    - Combine the results with `merge_feed_articles`.
+    """
+    urls = list(dict.fromkeys(rss_urls))
+    if not urls:
+        return []
+
+    workers = max(1, min(int(max_workers), len(urls)))
+    own_client = client is None
+    if client is None:
+        client = httpx.Client(
+            timeout=timeout_s,
+            limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers),
+        )
+
+    def _one(url: str) -> FeedResult:
+        try:
+            articles = fetch_rss_entries(
+                url,
+                limit=limit,
+                user_agent=user_agent,
+                timeout_s=timeout_s,
+                cache=cache,
+                client=client,
+                archive=archive,
+            )
+            return FeedResult(rss_url=url, articles=articles)
+        except Exception as exc:
+            return FeedResult(rss_url=url, error=f"{type(exc).__name__}: {exc}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_one, urls))
+    finally:
+        if own_client:
+            client.close()
+
+
+def merge_feed_articles(results: Iterable[FeedResult]) -> list[Article]:
+    """Merge feed results in order, keeping the first copy of each article.
+
+    An article is a duplicate if its GUID or its canonical link (see `canonical_link`)
+    was already seen in an earlier feed or earlier in the same feed.
+    """
+    seen_guids: set[str] = set()
+    seen_links: set[str] = set()
+    out: list[Article] = []
+    for result in results:
+        for article in result.articles:
+            link = canonical_link(article.url) if article.url else None
+            if (article.guid and article.guid in seen_guids) or (link and link in seen_links):
+                continue
+            if article.guid:
+                seen_guids.add(article.guid)
+            if link:
+                seen_links.add(link)
+            out.append(article)
+    return out
+
+
+def canonical_link(url: str) -> str:
+    """Normalize an article link for comparison across feeds.
+
+    Lowercases scheme and host, drops the fragment, `utm_*` tracking parameters and a
+    trailing slash on the path.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(
+        [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.lower().startswith("utm_")]
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
 def fetch_article_text(
     url: str,
     *,
     enabled: bool = False,
     user_agent: str = "techcrunch-intel/0.1 (educational)",
     timeout_s: float = 30.0,
+    archive: ResponseArchive | None = None,
 ) -> str | None:
     """Optional HTML fetch for additional extraction.
 
-    Disabled by default; RSS metadata is the primary ingestion method.
+    Disabled by default; RSS metadata is the primary ingestion method. With `archive`,
+    the page is recorded, or served from it in replay mode.
     """
     if not enabled:
         return None
 
-    resp = httpx.get(url, headers={"User-Agent": user_agent}, timeout=timeout_s)
+    resp = _get(url, headers={"User-Agent": user_agent}, timeout_s=timeout_s, client=None, archive=archive)
     resp.raise_for_status()
-    html = resp.text
+    return _article_text_from_html(resp.text)
+
+
+def fetch_article_texts(
+    urls: Sequence[str],
+    *,
+    max_workers: int = 8,
+    per_host_limit: int = 4,
+    user_agent: str = "techcrunch-intel/0.1 (educational)",
+    timeout_s: float = 30.0,
+    client: httpx.Client | None = None,
+    archive: ResponseArchive | None = None,
+) -> list[FullTextResult]:
+    """Fetch article HTML for many URLs concurrently over one pooled client.
+
+    - At most `max_workers` requests are in flight overall, and at most
+      `per_host_limit` per host.
+    - Results are returned in the same order as `urls`.
+    - A failing URL yields a `FullTextResult` with `error` set; it never aborts the batch.
+    - `archive` records (or replays) every page, as in `fetch_article_text`.
+    """
+    if not urls:
+        return []
+
+    workers = max(1, min(int(max_workers), len(urls)))
+    host_slots = {
+        host: threading.BoundedSemaphore(max(1, int(per_host_limit)))
+        for host in {urlparse(u).netloc.lower() for u in urls}
+    }
+
+    own_client = client is None
+    if client is None:
+        client = httpx.Client(
+            timeout=timeout_s,
+            limits=httpx.Limits(max_connections=workers, max_keepalive_connections=workers),
+        )
+    # Per request, so a caller-supplied `client` sends `user_agent` too.
+    headers = {"User-Agent": user_agent}
+
+    def _one(url: str) -> FullTextResult:
+        with host_slots[urlparse(url).netloc.lower()]:
+            try:
+                resp = _get(url, headers=headers, timeout_s=timeout_s, client=client, archive=archive)
+                resp.raise_for_status()
+                return FullTextResult(url=url, text=_article_text_from_html(resp.text))
+            except Exception as exc:
+                return FullTextResult(url=url, text=None, error=f"{type(exc).__name__}: {exc}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_one, urls))
+    finally:
+        if own_client:
+            client.close()
+
+
+def _get(
+    url: str,
+    *,
+    headers: dict[str, str] | None,
+    timeout_s: float,
+    client: httpx.Client | None,
+    archive: ResponseArchive | None,
+) -> httpx.Response:
+    key = request_key("GET", url)
+    if archive is not None and archive.replay:
+        return archive.replay_response(key, method="GET", url=url)
+    if client is None:
+        resp = httpx.get(url, headers=headers, timeout=timeout_s)
+    else:
+        resp = client.get(url, headers=headers, timeout=timeout_s)
+    if archive is not None and resp.is_success:
+        archive.record(key, resp)
+    return resp
+
 
+def _article_text_from_html(html: str) -> str | None:
     try:
         from bs4 import BeautifulSoup
     except Exception:
@@ -82,7 +278,8 @@ def _entry_to_article(entry: Any) -> Article:
     for t in (getattr(entry, "tags", None) or []):
         term = (t or {}).get("term") if isinstance(t, dict) else getattr(t, "term", None)
         if term:
-            categories.append(str(term))
+            # Category names repeat across articles; share one string object per name.
+            categories.append(sys.intern(str(term)))
 
     published_at = _parse_published_at(entry)
 
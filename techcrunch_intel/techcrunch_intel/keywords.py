@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from functools import cached_property
+from typing import Sequence
 
 
 DEFAULT_AI_PHRASES: tuple[str, ...] = (
@@ -30,6 +31,10 @@ class KeywordMatcher:
 
     - `phrases` are matched as case-insensitive substrings.
     - `tokens` are matched as case-insensitive whole tokens using word boundaries.
+
+    Terms are prepared once per matcher. `matches()` lowercases the text once, checks
+    phrases with `in` and all tokens with one `\b(?:...)\b` regex; `term_counts()` scans
+    with a single alternation of every term.
     """
 
     phrases: tuple[str, ...] = DEFAULT_AI_PHRASES
@@ -38,26 +43,101 @@ class KeywordMatcher:
     def matches(self, text: str) -> bool:
         if not text:
             return False
+        compiled = self._compiled
         haystack = text.lower()
-        for p in self.phrases:
-            if p and p.lower() in haystack:
+        for p in compiled.phrases:
+            if p in haystack:
                 return True
+        return compiled.tokens is not None and compiled.tokens.search(text) is not None
+
+    def term_counts(self, text: str) -> dict[str, int]:
+        """Count every phrase/token occurrence (overlaps included), in order of first hit.
+
+        Keys are the lowercased terms.
+        """
+        if not text:
+            return {}
+        compiled = self._compiled
+        counts: dict[str, int] = {}
+        for m in compiled.pattern.finditer(text):
+            idx = int(m.lastgroup[1:])  # type: ignore[index]
+            term = compiled.terms[idx]
+            counts[term] = counts.get(term, 0) + 1
+            # The alternation reports only the longest term at a position; shorter
+            # terms that are prefixes of it may match at the same position too.
+            pos = m.start()
+            for j in compiled.shadowed[idx]:
+                if compiled.singles[j].match(text, pos) is not None:
+                    t = compiled.terms[j]
+                    counts[t] = counts.get(t, 0) + 1
+        return counts
+
+    def matched_terms(self, text: str) -> list[str]:
+        """Return the distinct lowercased terms found in `text`."""
+        return list(self.term_counts(text))
+
+    @cached_property
+    def _compiled(self) -> _CompiledTerms:
+        return _compile_terms(self.phrases, self.tokens)
 
-        for t in self.tokens:
-            t2 = (t or "").strip()
-            if not t2:
-                continue
-            # Whole-token match for short tokens like "ai" to avoid false positives
-            # such as "laid", "chair", etc.
-            pat = re.compile(rf"\b{re.escape(t2.lower())}\b", re.IGNORECASE)
-            if pat.search(text) is not None:
-                return True
 
-        return False
+@dataclass(frozen=True)
+class _CompiledTerms:
+    # `matches()`: lowercased phrases for substring checks, one regex for all tokens.
+    phrases: tuple[str, ...]
+    tokens: re.Pattern[str] | None
+    # `term_counts()`: one alternation over every term.
+    pattern: re.Pattern[str]
+    terms: tuple[str, ...]
+    singles: tuple[re.Pattern[str], ...]
+    shadowed: tuple[tuple[int, ...], ...]
+
+
+def _compile_terms(phrases: Sequence[str], tokens: Sequence[str]) -> _CompiledTerms:
+    # (lowercased term, regex source); first definition of a term wins.
+    entries: dict[str, str] = {}
+    phrase_terms = tuple(dict.fromkeys(p.lower() for p in phrases if p))
+    token_terms = tuple(dict.fromkeys(t2 for t2 in ((t or "").strip().lower() for t in tokens) if t2))
+    for p in phrase_terms:
+        entries.setdefault(p, re.escape(p))
+    for t2 in token_terms:
+        # Whole-token match for short tokens like "ai" to avoid false positives
+        # such as "laid", "chair", etc.
+        entries.setdefault(t2, rf"\b{re.escape(t2)}\b")
+    token_pattern = (
+        re.compile(rf"\b(?:{'|'.join(map(re.escape, token_terms))})\b", re.IGNORECASE) if token_terms else None
+    )
+
+    # Longest first, so the alternation prefers the longest term at each position.
+    ordered = sorted(entries.items(), key=lambda kv: -len(kv[0]))
+    terms = tuple(term for term, _ in ordered)
+    if not ordered:
+        never = re.compile(r"(?!)")
+        return _CompiledTerms(phrases=(), tokens=None, pattern=never, terms=(), singles=(), shadowed=())
+
+    alternation = "|".join(f"(?P<t{i}>{src})" for i, (_, src) in enumerate(ordered))
+    # Zero-width lookahead so `finditer` reports matches at every start position.
+    pattern = re.compile(f"(?=(?:{alternation}))", re.IGNORECASE)
+    singles = tuple(re.compile(src, re.IGNORECASE) for _, src in ordered)
+    shadowed = tuple(
+        tuple(j for j in range(len(terms)) if j != i and terms[i].startswith(terms[j]))
+        for i in range(len(terms))
+    )
+    return _CompiledTerms(
+        phrases=phrase_terms,
+        tokens=token_pattern,
+        pattern=pattern,
+        terms=terms,
+        singles=singles,
+        shadowed=shadowed,
+    )
+
+
+_DEFAULT_AI_MATCHER = KeywordMatcher()
 
 
 def default_ai_matcher() -> KeywordMatcher:
-    return KeywordMatcher()
+    return _DEFAULT_AI_MATCHER
 
 
 def is_ai_related_text(
@@ -67,5 +147,5 @@ def is_ai_related_text(
 ) -> bool:
     """Rule-based AI relevance check for arbitrary text."""
 
-    m = matcher or default_ai_matcher()
+    m = matcher or _DEFAULT_AI_MATCHER
     return m.matches(text)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import json
 import re
 import uuid
-from dataclasses import asdict
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
 
 from .models import IntelRecord
 
@@ -16,23 +17,56 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
     - relationships: each item is an edge with an `id`, `relationship_type`, `from_id`, `to_id`.
     """
 
-    entities_by_id: dict[str, dict[str, Any]] = {}
-    relationships_by_id: dict[str, dict[str, Any]] = {}
+    builder = KGBuilder()
+    builder.add_records(records)
+    # The builder is discarded, so its items can be handed out without copying.
+    return {"entities": list(builder.iter_entities()), "relationships": list(builder.iter_relationships())}
 
-    source_id = _id("source", "techcrunch")
-    _upsert_entity(
-        entities_by_id,
-        {
-            "id": source_id,
-            "entity_type": "Source",
-            "properties": {"name": "TechCrunch"},
-        },
-    )
 
-    for r in records:
+class KGBuilder:
+    """Stateful, incremental builder for the KG bundle.
+
+    Records can be added over time; `take_delta()` returns only the entities and
+    relationships created or changed since the previous call, so a loader can upsert
+    today's records without reprocessing the full history. Seed the builder from a
+    previously exported bundle with `KGBuilder.from_bundle(...)`.
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[str, dict[str, Any]] = {}
+        self._relationships: dict[str, dict[str, Any]] = {}
+        # Insertion-ordered sets of ids touched since the last `take_delta()`.
+        self._dirty_entities: dict[str, None] = {}
+        self._dirty_relationships: dict[str, None] = {}
+
+        self._source_id = _id("source", "techcrunch")
+        self._upsert_entity(
+            {
+                "id": self._source_id,
+                "entity_type": "Source",
+                "properties": {"name": "TechCrunch"},
+            }
+        )
+
+    @classmethod
+    def from_bundle(cls, bundle: dict[str, Any]) -> "KGBuilder":
+        """Seed a builder with an existing bundle; seeded items are not part of the next delta."""
+        builder = cls()
+        for e in bundle.get("entities") or []:
+            builder._upsert_entity(dict(e, properties=dict(e.get("properties") or {})))
+        for rel in bundle.get("relationships") or []:
+            builder._upsert_relationship(dict(rel))
+        builder._dirty_entities.clear()
+        builder._dirty_relationships.clear()
+        return builder
+
+    def add_records(self, records: Iterable[IntelRecord]) -> None:
+        for r in records:
+            self.add_record(r)
+
+    def add_record(self, r: IntelRecord) -> None:
         article_id = _id("article", r.article.url)
-        _upsert_entity(
-            entities_by_id,
+        self._upsert_entity(
             {
                 "id": article_id,
                 "entity_type": "Article",
@@ -50,11 +84,10 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
 
         company_name = (r.investment.company or "").strip() or None
         if not company_name:
-            continue
+            return
 
         company_id = _id("company", _norm_name(company_name))
-        _upsert_entity(
-            entities_by_id,
+        self._upsert_entity(
             {
                 "id": company_id,
                 "entity_type": "Company",
@@ -63,8 +96,7 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
         )
 
         # Company -> mentioned_in -> Article
-        _upsert_relationship(
-            relationships_by_id,
+        self._upsert_relationship(
             {
                 "id": _id("rel", f"mentioned_in:{company_id}:{article_id}"),
                 "relationship_type": "mentioned_in",
@@ -77,8 +109,7 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
         # Investment entity + required relationship Investment -> reported_by -> Source(TechCrunch)
         investment_key = f"{company_id}:{article_id}:{r.investment.amount_text or ''}:{r.investment.stage or ''}"
         investment_id = _id("investment", investment_key)
-        _upsert_entity(
-            entities_by_id,
+        self._upsert_entity(
             {
                 "id": investment_id,
                 "entity_type": "Investment",
@@ -93,13 +124,12 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
             },
         )
 
-        _upsert_relationship(
-            relationships_by_id,
+        self._upsert_relationship(
             {
-                "id": _id("rel", f"reported_by:{investment_id}:{source_id}"),
+                "id": _id("rel", f"reported_by:{investment_id}:{self._source_id}"),
                 "relationship_type": "reported_by",
                 "from_id": investment_id,
-                "to_id": source_id,
+                "to_id": self._source_id,
                 "properties": {},
             },
         )
@@ -110,8 +140,7 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
             if not inv_name2:
                 continue
             investor_id = _id("investor", _norm_name(inv_name2))
-            _upsert_entity(
-                entities_by_id,
+            self._upsert_entity(
                 {
                     "id": investor_id,
                     "entity_type": "Investor",
@@ -119,8 +148,7 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
                 },
             )
 
-            _upsert_relationship(
-                relationships_by_id,
+            self._upsert_relationship(
                 {
                     "id": _id("rel", f"received_investment_from:{company_id}:{investor_id}:{article_id}"),
                     "relationship_type": "received_investment_from",
@@ -130,34 +158,89 @@ def build_kg_bundle(records: list[IntelRecord]) -> dict[str, Any]:
                 },
             )
 
-    return {
-        "entities": list(entities_by_id.values()),
-        "relationships": list(relationships_by_id.values()),
-    }
+    def bundle(self) -> dict[str, Any]:
+        """Full snapshot of everything added so far (same shape as `build_kg_bundle`).
+
+        Items are copies; changing them does not affect the builder.
+        """
+        return {
+            "entities": [_copy_item(e) for e in self._entities.values()],
+            "relationships": [_copy_item(r) for r in self._relationships.values()],
+        }
+
+    def iter_entities(self) -> Iterator[dict[str, Any]]:
+        """Stream the builder's own entity dicts, without copying; treat them as read-only."""
+        return iter(self._entities.values())
 
+    def iter_relationships(self) -> Iterator[dict[str, Any]]:
+        """Stream the builder's own relationship dicts, without copying; treat them as read-only."""
+        return iter(self._relationships.values())
 
-def _upsert_entity(store: dict[str, dict[str, Any]], entity: dict[str, Any]) -> None:
+    def take_delta(self) -> dict[str, Any]:
+        """Return entities/relationships created or changed since the last call, then reset.
+
+        Entities are returned whole (merged properties), so applying the delta is a plain upsert.
+        """
+        delta = {
+            "entities": [_copy_item(self._entities[i]) for i in self._dirty_entities],
+            "relationships": [_copy_item(self._relationships[i]) for i in self._dirty_relationships],
+        }
+        self._dirty_entities.clear()
+        self._dirty_relationships.clear()
+        return delta
+
+    def _upsert_entity(self, entity: dict[str, Any]) -> None:
+        if _upsert_entity(self._entities, entity):
+            self._dirty_entities[str(entity["id"])] = None
+
+    def _upsert_relationship(self, rel: dict[str, Any]) -> None:
+        if _upsert_relationship(self._relationships, rel):
+            self._dirty_relationships[str(rel["id"])] = None
+
+
+def delta_to_ndjson(delta: dict[str, Any]) -> Iterator[str]:
+    """Encode a `take_delta()` result as NDJSON upsert operations (one JSON object per line)."""
+    for e in delta.get("entities") or []:
+        yield json.dumps({"op": "upsert", "kind": "entity", "item": e}, ensure_ascii=False)
+    for rel in delta.get("relationships") or []:
+        yield json.dumps({"op": "upsert", "kind": "relationship", "item": rel}, ensure_ascii=False)
+
+
+def _copy_item(item: dict[str, Any]) -> dict[str, Any]:
+    return dict(item, properties=dict(item.get("properties") or {}))
+
+
+def _upsert_entity(store: dict[str, dict[str, Any]], entity: dict[str, Any]) -> bool:
+    """Insert or merge an entity; returns True if the store changed."""
     entity_id = str(entity["id"])
     if entity_id in store:
         # Merge properties shallowly (first writer wins for non-null values)
         existing = store[entity_id]
         existing_props = dict(existing.get("properties") or {})
         new_props = dict(entity.get("properties") or {})
+        changed = False
         for k, v in new_props.items():
-            if k not in existing_props or existing_props[k] is None:
+            if (k not in existing_props or existing_props[k] is None) and existing_props.get(k, _MISSING) != v:
                 existing_props[k] = v
+                changed = True
         existing["properties"] = existing_props
-        return
+        return changed
     store[entity_id] = entity
+    return True
 
 
-def _upsert_relationship(store: dict[str, dict[str, Any]], rel: dict[str, Any]) -> None:
+def _upsert_relationship(store: dict[str, dict[str, Any]], rel: dict[str, Any]) -> bool:
     rel_id = str(rel["id"])
     if rel_id in store:
-        return
+        return False
     store[rel_id] = rel
+    return True
+
+
+_MISSING = object()
 
 
+@lru_cache(maxsize=65536)
 def _id(prefix: str, key: str) -> str:
     # Stable UUID derived from a key; good for later KG merges.
     u = uuid.uuid5(uuid.NAMESPACE_URL, f"techcrunch-intel:{prefix}:{key}")
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import copy
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Article:
+    """One feed entry (slotted: no per-instance `__dict__`, so large batches stay small)."""
+
     title: str
     url: str
     published_at: datetime | None
@@ -27,6 +30,20 @@ class InvestmentSignal:
     notes: str | None = None
 
 
+@dataclass(frozen=True)
+class FullTextResult:
+    url: str
+    text: str | None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class FeedResult:
+    rss_url: str
+    articles: list[Article] = field(default_factory=list)
+    error: str | None = None
+
+
 @dataclass(frozen=True)
 class IntelRecord:
     article: Article
@@ -35,9 +52,28 @@ class IntelRecord:
     raw: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        # dataclasses -> JSON-friendly
-        if self.article.published_at is not None:
-            d["article"]["published_at"] = self.article.published_at.isoformat()
-        d["extracted_at"] = self.extracted_at.isoformat()
-        return d
+        # Built by hand rather than via `dataclasses.asdict`, which recurses and deep-copies
+        # every field; same keys and order. Lists are copied so callers can mutate them.
+        a, inv = self.article, self.investment
+        return {
+            "article": {
+                "title": a.title,
+                "url": a.url,
+                "published_at": a.published_at.isoformat() if a.published_at is not None else None,
+                "summary": a.summary,
+                "author": a.author,
+                "categories": list(a.categories),
+                "guid": a.guid,
+                "source": a.source,
+            },
+            "investment": {
+                "ai_relevant": inv.ai_relevant,
+                "company": inv.company,
+                "amount_text": inv.amount_text,
+                "stage": inv.stage,
+                "investors": list(inv.investors),
+                "notes": inv.notes,
+            },
+            "extracted_at": self.extracted_at.isoformat(),
+            "raw": copy.deepcopy(self.raw) if self.raw is not None else None,
+        }
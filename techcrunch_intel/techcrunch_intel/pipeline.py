@@ -2,26 +2,72 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from .extract import extract_investment_signal
+from .archive import ResponseArchive
+from .extract import extract_investment_signals
 from .filter import is_relevant
-from .ingest import fetch_article_text
+from .ingest import fetch_article_texts
 from .models import Article, IntelRecord
+from .state import SeenIndex
 
 
 def build_intel_records(
     articles: list[Article],
     *,
     fetch_full_text: bool = False,
+    max_workers: int = 8,
+    per_host_limit: int = 4,
+    seen: SeenIndex | None = None,
+    archive: ResponseArchive | None = None,
 ) -> list[IntelRecord]:
+    """Filter, (optionally) fetch full text, and extract intel records.
+
+    With `fetch_full_text=True`, article pages are fetched concurrently (bounded by
+    `max_workers` overall and `per_host_limit` per host). A failed fetch does not abort
+    the batch: extraction falls back to RSS metadata and the error is recorded in
+    `IntelRecord.raw["full_text_error"]`. Pass `archive` to record the pages, or to
+    replay them with no network.
+
+    With `seen`, articles processed by earlier runs (keyed by GUID, else URL) are
+    dropped before any other work, and this run's articles are staged on it. Call
+    `seen.commit()` once the records are written, so a failed export leaves them to be
+    processed again. Articles whose full-text fetch failed are not staged, so a later
+    run retries them.
+    """
     out: list[IntelRecord] = []
     extracted_at = datetime.now(timezone.utc)
-    for a in articles:
-        if not is_relevant(a):
-            continue
-        full_text = fetch_article_text(a.url, enabled=fetch_full_text)
-        signal = extract_investment_signal(a, full_text=full_text)
+    if seen is not None:
+        articles = seen.filter_new(articles, key=article_key)
+    relevant = [a for a in articles if is_relevant(a)]
+
+    texts = None
+    failed: set[str] = set()
+    if fetch_full_text:
+        texts = fetch_article_texts(
+            [a.url for a in relevant],
+            max_workers=max_workers,
+            per_host_limit=per_host_limit,
+            archive=archive,
+        )
+
+    signals = extract_investment_signals(
+        relevant,
+        full_texts=[t.text for t in texts] if texts is not None else None,
+    )
+    for i, (a, signal) in enumerate(zip(relevant, signals)):
+        raw = None
+        if texts is not None and texts[i].error:
+            raw = {"full_text_error": texts[i].error}
+            failed.add(article_key(a))
         # For KG output, we need at least a Company entity.
         if not (signal.company and signal.company.strip()):
             continue
-        out.append(IntelRecord(article=a, investment=signal, extracted_at=extracted_at))
+        out.append(IntelRecord(article=a, investment=signal, extracted_at=extracted_at, raw=raw))
+
+    if seen is not None:
+        seen.stage(k for k in map(article_key, articles) if k not in failed)
     return out
+
+
+def article_key(article: Article) -> str:
+    """Stable de-duplication key for an article: its GUID, else its URL."""
+    return article.guid or article.url
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any, Iterable, Iterator, Sequence
+
+from .models import IntelRecord
+
+_BATCH = 1000
+_SQLITE_MAX_PARAMS = 500
+
+# `InvestmentIntelItem` (techcrunch_extractor, reddit_extractor, crunchbase_extractor)
+# and `IntelRecord` (this package), as produced by their `model_dump(mode="json")` /
+# `to_dict()`.
+SHAPE_ITEM = "investment_intel_item"
+SHAPE_RECORD = "intel_record"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS items ("
+    "id INTEGER PRIMARY KEY, uid TEXT NOT NULL UNIQUE, shape TEXT NOT NULL, source TEXT NOT NULL, "
+    "record_type TEXT, record_id TEXT, url TEXT, title TEXT, summary TEXT, "
+    "published_ts REAL, collected_ts REAL, entities TEXT NOT NULL, tags TEXT NOT NULL, "
+    "payload TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS items_published ON items (published_ts)",
+    "CREATE INDEX IF NOT EXISTS items_source_published ON items (source, published_ts)",
+    "CREATE TABLE IF NOT EXISTS item_entities ("
+    "entity TEXT NOT NULL, item_id INTEGER NOT NULL, PRIMARY KEY (entity, item_id)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS item_tags ("
+    "tag TEXT NOT NULL, item_id INTEGER NOT NULL, PRIMARY KEY (tag, item_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS item_entities_item ON item_entities (item_id)",
+    "CREATE INDEX IF NOT EXISTS item_tags_item ON item_tags (item_id)",
+)
+
+_COLUMNS = (
+    "uid, shape, source, record_type, record_id, url, title, summary, "
+    "published_ts, collected_ts, entities, tags, payload"
+)
+
+
+@dataclass(frozen=True)
+class StoredItem:
+    """One row of the intel store, in a shape common to all sources.
+
+    `payload` is the record exactly as ingested.
+    """
+
+    uid: str
+    shape: str
+    source: str
+    record_type: str | None
+    record_id: str | None
+    url: str | None
+    title: str | None
+    summary: str | None
+    published_at: datetime | None
+    collected_at: datetime | None
+    entities: list[str]
+    tags: list[str]
+    payload: dict[str, Any]
+
+
+class IntelStore:
+    """Local SQLite (WAL) store for normalized intel from every source.
+
+    Ingests `InvestmentIntelItem` records (from any of the extractors) and `IntelRecord`s,
+    as objects or as the dicts found in their JSONL output. Items are keyed by source,
+    record type and record id (else URL), so re-ingesting a file updates rows in place.
+    Indexed by publication time (overall and per source), entity and tag.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+
+    def add(self, records: Iterable[Any]) -> int:
+        """Insert or update records; returns how many were written.
+
+        Accepts `IntelRecord`s, pydantic `InvestmentIntelItem`s and their JSON dicts.
+        Raises `ValueError` for anything else.
+        """
+        count = 0
+        batch: list[dict[str, Any]] = []
+        for record in records:
+            batch.append(record_row(record_dict(record)))
+            if len(batch) >= _BATCH:
+                count += self._write(batch)
+                batch = []
+        if batch:
+            count += self._write(batch)
+        return count
+
+    def ingest_jsonl(self, path: Path) -> int:
+        """Add every record of a JSONL file (blank lines are skipped).
+
+        Records are committed in batches; re-ingesting a file after an error is safe.
+        """
+        path = Path(path)
+
+        def records() -> Iterator[dict[str, Any]]:
+            with path.open("r", encoding="utf-8") as fh:
+                for lineno, line in enumerate(fh, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError as exc:
+                        raise ValueError(f"{path}:{lineno}: invalid JSON: {exc}") from exc
+
+        return self.add(records())
+
+    def query(
+        self,
+        *,
+        source: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        entity: str | None = None,
+        tag: str | None = None,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> Iterator[StoredItem]:
+        """Items matching every given filter, ordered by publication time.
+
+        `since` is inclusive and `until` exclusive; naive datetimes are taken as UTC.
+        Items without a publication time only match when no time bound is given.
+        """
+        sql = f"SELECT {_COLUMNS} FROM items i"
+        where: list[str] = []
+        args: list[Any] = []
+        if entity is not None:
+            sql += " JOIN item_entities e ON e.item_id = i.id AND e.entity = ?"
+            args.append(entity)
+        if tag is not None:
+            sql += " JOIN item_tags t ON t.item_id = i.id AND t.tag = ?"
+            args.append(tag)
+        if source is not None:
+            where.append("i.source = ?")
+            args.append(source)
+        if since is not None:
+            where.append("i.published_ts >= ?")
+            args.append(_ts(since))
+        if until is not None:
+            where.append("i.published_ts < ?")
+            args.append(_ts(until))
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        order = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY i.published_ts {order}, i.id {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        for row in self._conn.execute(sql, args):
+            yield _from_row(row)
+
+    def get(self, uid: str) -> StoredItem | None:
+        row = self._conn.execute(f"SELECT {_COLUMNS} FROM items WHERE uid = ?", (uid,)).fetchone()
+        return _from_row(row) if row else None
+
+    def _write(self, rows: list[dict[str, Any]]) -> int:
+        # Later copies of a uid in the same batch win, as they would one at a time.
+        by_uid = {row["uid"]: row for row in rows}
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO items ({_COLUMNS}) VALUES ({', '.join('?' * 13)}) "
+                "ON CONFLICT (uid) DO UPDATE SET shape = excluded.shape, source = excluded.source, "
+                "record_type = excluded.record_type, record_id = excluded.record_id, url = excluded.url, "
+                "title = excluded.title, summary = excluded.summary, published_ts = excluded.published_ts, "
+                "collected_ts = excluded.collected_ts, entities = excluded.entities, tags = excluded.tags, "
+                "payload = excluded.payload",
+                [
+                    (
+                        row["uid"],
+                        row["shape"],
+                        row["source"],
+                        row["record_type"],
+                        row["record_id"],
+                        row["url"],
+                        row["title"],
+                        row["summary"],
+                        row["published_ts"],
+                        row["collected_ts"],
+                        json.dumps(row["entities"], ensure_ascii=False),
+                        json.dumps(row["tags"], ensure_ascii=False),
+                        json.dumps(row["payload"], ensure_ascii=False, default=str),
+                    )
+                    for row in by_uid.values()
+                ],
+            )
+            ids = self._ids(list(by_uid))
+            for table in ("item_entities", "item_tags"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE item_id = ?", [(i,) for i in ids.values()])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO item_entities (entity, item_id) VALUES (?, ?)",
+                [(e, ids[uid]) for uid, row in by_uid.items() for e in row["entities"]],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO item_tags (tag, item_id) VALUES (?, ?)",
+                [(t, ids[uid]) for uid, row in by_uid.items() for t in row["tags"]],
+            )
+        return len(rows)
+
+    def _ids(self, uids: list[str]) -> dict[str, int]:
+        ids: dict[str, int] = {}
+        for i in range(0, len(uids), _SQLITE_MAX_PARAMS):
+            chunk = uids[i : i + _SQLITE_MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            ids.update(self._conn.execute(f"SELECT uid, id FROM items WHERE uid IN ({marks})", chunk))
+        return ids
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "IntelStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def record_dict(record: Any) -> dict[str, Any]:
+    """JSON-shaped dict of anything `IntelStore.add` accepts; `ValueError` otherwise."""
+    if isinstance(record, IntelRecord):
+        return record.to_dict()
+    if hasattr(record, "model_dump"):
+        return record.model_dump(mode="json")
+    if isinstance(record, dict):
+        return record
+    raise ValueError(f"Unsupported record type: {type(record).__name__}")
+
+
+def record_row(d: dict[str, Any]) -> dict[str, Any]:
+    """Store row (`uid`, `source`, `title`, `published_ts`, `entities`, ...) for a `record_dict`."""
+    if isinstance(d.get("article"), dict) and isinstance(d.get("investment"), dict):
+        article, inv = d["article"], d["investment"]
+        categories = [str(c) for c in article.get("categories") or []]
+        tags = list(dict.fromkeys(categories))
+        if inv.get("ai_relevant"):
+            tags.append("ai_relevant")
+        if inv.get("amount_text") or inv.get("stage"):
+            tags.append("funding_round")
+        entities = [f"ORG:{inv['company']}"] if inv.get("company") else []
+        entities += [f"INVESTOR:{name}" for name in inv.get("investors") or []]
+        return _row(
+            d,
+            shape=SHAPE_RECORD,
+            source=str(article.get("source") or "techcrunch"),
+            record_type="intel_record",
+            record_id=article.get("guid") or article.get("url"),
+            url=article.get("url"),
+            title=article.get("title"),
+            summary=article.get("summary"),
+            published_at=article.get("published_at"),
+            collected_at=d.get("extracted_at"),
+            entities=entities,
+            tags=tags,
+        )
+    if isinstance(d.get("source"), str):
+        return _row(
+            d,
+            shape=SHAPE_ITEM,
+            source=d["source"],
+            record_type=d.get("source_record_type"),
+            record_id=d.get("source_record_id") or d.get("url"),
+            url=d.get("url"),
+            title=d.get("title"),
+            summary=d.get("summary"),
+            published_at=d.get("published_at"),
+            collected_at=d.get("collected_at"),
+            entities=[str(e) for e in d.get("entities") or []],
+            tags=[str(t) for t in d.get("tags") or []],
+        )
+    raise ValueError("Unrecognized record: expected an InvestmentIntelItem or IntelRecord")
+
+
+def _row(
+    payload: dict[str, Any],
+    *,
+    shape: str,
+    source: str,
+    record_type: str | None,
+    record_id: str | None,
+    url: str | None,
+    title: str | None,
+    summary: str | None,
+    published_at: Any,
+    collected_at: Any,
+    entities: list[str],
+    tags: list[str],
+) -> dict[str, Any]:
+    key = record_id
+    if not key:
+        # Nothing stable to key on: the content itself is the identity.
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        key = "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return {
+        "uid": f"{source}:{record_type or shape}:{key}",
+        "shape": shape,
+        "source": source,
+        "record_type": record_type,
+        "record_id": record_id,
+        "url": url,
+        "title": title,
+        "summary": summary,
+        "published_ts": _ts(published_at),
+        "collected_ts": _ts(collected_at),
+        "entities": list(dict.fromkeys(entities)),
+        "tags": list(dict.fromkeys(tags)),
+        "payload": payload,
+    }
+
+
+def _ts(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _dt(ts: float | None) -> datetime | None:
+    return None if ts is None else datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def _from_row(row: tuple) -> StoredItem:
+    (uid, shape, source, record_type, record_id, url, title, summary) = row[:8]
+    published_ts, collected_ts, entities, tags, payload = row[8:]
+    return StoredItem(
+        uid=uid,
+        shape=shape,
+        source=source,
+        record_type=record_type,
+        record_id=record_id,
+        url=url,
+        title=title,
+        summary=summary,
+        published_at=_dt(published_ts),
+        collected_at=_dt(collected_ts),
+        entities=json.loads(entities),
+        tags=json.loads(tags),
+        payload=json.loads(payload),
+    )
+
+
+def _item_json(item: StoredItem) -> str:
+    return json.dumps(
+        {
+            "uid": item.uid,
+            "source": item.source,
+            "record_type": item.record_type,
+            "url": item.url,
+            "title": item.title,
+            "published_at": item.published_at.isoformat() if item.published_at else None,
+            "entities": item.entities,
+            "tags": item.tags,
+            "payload": item.payload,
+        },
+        ensure_ascii=False,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """`python -m techcrunch_intel.store {ingest,query} ...`"""
+    parser = argparse.ArgumentParser(
+        prog="python -m techcrunch_intel.store", description="Local cross-source intel store."
+    )
+    parser.add_argument("--db", type=Path, required=True, help="SQLite store path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Add JSONL files from any extractor or techcrunch_intel")
+    ingest.add_argument("files", type=Path, nargs="+")
+
+    query = sub.add_parser("query", help="Print matching items as JSONL")
+    query.add_argument("--source")
+    query.add_argument("--since", type=datetime.fromisoformat, help="ISO date/time, inclusive (UTC if naive)")
+    query.add_argument("--until", type=datetime.fromisoformat, help="ISO date/time, exclusive (UTC if naive)")
+    query.add_argument("--entity", help='Exact entity, e.g. "ORG:Anthropic"')
+    query.add_argument("--tag")
+    query.add_argument("--limit", type=int)
+    query.add_argument("--newest-first", action="store_true")
+
+    args = parser.parse_args(argv)
+    with IntelStore(args.db) as store:
+        if args.command == "ingest":
+            for path in args.files:
+                try:
+                    n = store.ingest_jsonl(path)
+                except (OSError, ValueError) as exc:
+                    print(json.dumps({"ok": False, "error": {"file": str(path), "message": str(exc)}}), file=sys.stderr)
+                    return 1
+                print(json.dumps({"ok": True, "file": str(path), "ingested": n}))
+            return 0
+
+        for item in store.query(
+            source=args.source,
+            since=args.since,
+            until=args.until,
+            entity=args.entity,
+            tag=args.tag,
+            limit=args.limit,
+            newest_first=args.newest_first,
+        ):
+            print(_item_json(item))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
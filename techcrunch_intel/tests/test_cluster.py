@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+import random
+
+from techcrunch_intel.cluster import (
+    ClusterItem,
+    MinHasher,
+    cluster_records,
+    item_tokens,
+    main,
+    similarity,
+    text_tokens,
+)
+from techcrunch_intel.models import Article, IntelRecord, InvestmentSignal
+from techcrunch_intel.store import IntelStore
+
+
+def _item(source: str, record_id: str, title: str, summary: str | None, published_at: str | None) -> dict:
+    return {
+        "source": source,
+        "source_record_type": "post" if source == "reddit" else "rss_item",
+        "source_record_id": record_id,
+        "url": f"https://example.com/{record_id}",
+        "title": title,
+        "summary": summary,
+        "published_at": published_at,
+        "collected_at": "2026-02-10T00:00:00Z",
+        "entities": [],
+        "tags": [],
+        "raw": None,
+    }
+
+
+def _record(title: str, summary: str, published_at: datetime) -> IntelRecord:
+    article = Article(
+        title=title, url="https://techcrunch.com/acme/", published_at=published_at, summary=summary, guid="tc-1"
+    )
+    signal = InvestmentSignal(ai_relevant=True, company="Acme Robotics", amount_text="$25M", stage="Series A")
+    return IntelRecord(article=article, investment=signal, extracted_at=published_at)
+
+
+def test_text_tokens_normalize_amounts_and_drop_stopwords() -> None:
+    assert text_tokens("Acme raises $25M; money raised: 25000000 USD and $1.5 billion") == [
+        "$25000000",
+        "$25000000",
+        "$1500000000",
+        "acme",
+    ]
+
+
+def test_minhash_estimates_jaccard() -> None:
+    hasher = MinHasher(num_perm=256)
+    a = [f"t{i}" for i in range(100)]
+    b = [f"t{i}" for i in range(50, 150)]  # Jaccard 50 / 150
+    assert hasher.signature(a) == MinHasher(num_perm=256).signature(reversed(a))
+    assert abs(similarity(hasher.signature(a), hasher.signature(b)) - 1 / 3) < 0.1
+    assert similarity(hasher.signature(a), hasher.signature([f"u{i}" for i in range(100)])) < 0.05
+    assert hasher.signature([]) is None
+
+
+def test_cluster_links_sources_within_window() -> None:
+    t0 = datetime(2026, 2, 2, 10, tzinfo=timezone.utc)
+    tc = _record(
+        "Acme Robotics raises $25M Series A to build warehouse robot arms",
+        "Acme Robotics, which builds robot arms for warehouses, raised $25 million in a Series A led by Sequoia.",
+        t0,
+    )
+    post = "Acme Robotics just raised $25M Series A for warehouse robot arms"
+    records = [
+        _item("reddit", "p1", post, None, "2026-02-03T08:00:00Z"),
+        tc,
+        _item("reddit", "p2", "Ask: best laptop for data science?", "Budget is $1500.", "2026-02-03T09:00:00Z"),
+        # Same headline, but a month later: not the same story.
+        _item("reddit", "p3", post, None, "2026-03-05T08:00:00Z"),
+        # Undated records only cluster with each other.
+        _item("techcrunch", "x1", tc.article.title, None, None),
+    ]
+    ids = cluster_records(records, window=timedelta(days=3))
+
+    assert len(ids) == len(records)
+    assert ids[0] == ids[1]
+    assert len({ids[1], ids[2], ids[3], ids[4]}) == 4
+    assert all(i.startswith("cluster:") for i in ids)
+    # IDs do not depend on input order.
+    assert cluster_records(list(reversed(records)), window=timedelta(days=3)) == list(reversed(ids))
+
+
+# `normalize_funding_round_entity` output (crunchbase_extractor) for a Series A round,
+# minus `raw`. `announced_on` has no time, so it is dated at midnight and sorts first.
+_CRUNCHBASE_ROUND = {
+    "source": "crunchbase",
+    "source_record_type": "funding_round",
+    "source_record_id": "fr-acme-a",
+    "url": "https://www.crunchbase.com/organization/acme-robotics",
+    "title": "Acme Robotics",
+    "summary": "Money raised: 25000000 USD",
+    "published_at": "2026-02-02T00:00:00Z",
+    "collected_at": "2026-02-10T00:00:00Z",
+    "entities": ["ORG:Acme Robotics"],
+    "tags": ["funding_round"],
+    "raw": None,
+}
+
+
+def test_cluster_links_crunchbase_round_with_articles_about_it() -> None:
+    tc = _record(
+        "Acme Robotics raises $25M Series A to build warehouse robot arms",
+        "Acme Robotics, which builds robot arms for warehouses, raised $25 million in a Series A led by Sequoia.",
+        datetime(2026, 2, 2, 10, tzinfo=timezone.utc),
+    )
+    post = _item(
+        "reddit", "p1", "Acme Robotics just raised $25M Series A for warehouse robot arms", None, "2026-02-03T08:00:00Z"
+    )
+    other = _item("reddit", "p2", "Nimbus Health lands $25M for nurse scheduling", None, "2026-02-02T12:00:00Z")
+    unrelated_round = dict(
+        _CRUNCHBASE_ROUND, source_record_id="fr-other", title="Beta Robotics", entities=["ORG:Beta Robotics"]
+    )
+
+    ids = cluster_records([tc, post, _CRUNCHBASE_ROUND, other, unrelated_round])
+
+    assert ids[0] == ids[1] == ids[2]
+    assert len({ids[0], ids[3], ids[4]}) == 3
+
+
+def test_cluster_members_meet_threshold_against_leader_on_short_titles() -> None:
+    # Few tokens per title: MinHash estimates are loose here (densified bins), so every
+    # join must be confirmed on the exact token sets.
+    rng = random.Random(5)
+    vocab = [f"w{i}" for i in range(300)]
+    items: list[ClusterItem] = []
+    for n in range(2000):
+        if items and rng.random() < 0.3:
+            words = rng.choice(items[-40:]).title.split()[: rng.randint(2, 5)] + [rng.choice(vocab)]
+        else:
+            words = [rng.choice(vocab) for _ in range(rng.randint(1, 6))]
+        items.append(ClusterItem(f"u{n}", "reddit", " ".join(words), None, 1.77e9 + n * 60, []))
+
+    ids = cluster_records(items, threshold=0.4)
+
+    leaders: dict[str, ClusterItem] = {}
+    for item, cluster_id in zip(items, ids):  # already in publication order
+        leader = leaders.setdefault(cluster_id, item)
+        a, b = set(item_tokens(item)), set(item_tokens(leader))
+        assert a == b or (len(a & b) >= 2 and len(a & b) / min(len(a), len(b)) >= 0.4)
+    assert len(leaders) < len(items)
+
+
+def test_cluster_cli_reads_store(tmp_path, capsys) -> None:
+    db = tmp_path / "intel.sqlite"
+    with IntelStore(db) as store:
+        store.add(
+            [
+                _item("techcrunch", "a", "Nimbus Health lands $40M for its nurse scheduling app", None, "2026-02-02"),
+                _item("reddit", "b", "Nimbus Health lands $40M for nurse scheduling app", None, "2026-02-02T06:00:00"),
+            ]
+        )
+
+    assert main(["--db", str(db), "--since", "2026-02-01"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["source"] for r in rows] == ["techcrunch", "reddit"]
+    assert rows[0]["cluster_id"] == rows[1]["cluster_id"]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from techcrunch_intel.columnar import ParquetDatasetWriter, intel_record_row
+from techcrunch_intel.export import export_parquet
+from techcrunch_intel.models import Article, IntelRecord, InvestmentSignal
+
+
+def _record(i: int, published_at: datetime | None) -> IntelRecord:
+    return IntelRecord(
+        article=Article(
+            title=f"Co{i} raises $10M",
+            url=f"https://techcrunch.com/{i}/",
+            published_at=published_at,
+            categories=["AI"],
+            guid=f"g{i}",
+        ),
+        investment=InvestmentSignal(ai_relevant=True, company=f"Co{i}", amount_text="$10M", investors=["Accel"]),
+        extracted_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        raw={"full_text_error": "boom"} if i == 0 else None,
+    )
+
+
+def test_intel_record_row_is_flat_and_keeps_raw_as_json() -> None:
+    row = intel_record_row(_record(0, None))
+
+    assert row["company"] == "Co0" and row["investors"] == ["Accel"] and row["categories"] == ["AI"]
+    assert row["raw_json"] == '{"full_text_error": "boom"}'
+    assert "raw_json" not in intel_record_row(_record(0, None), include_raw=False)
+
+
+def test_export_parquet_partitions_by_month_in_row_groups(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    records = [_record(i, datetime(2026, 1 + i % 2, 10, tzinfo=timezone.utc)) for i in range(10)]
+    records.append(_record(99, None))
+
+    paths = export_parquet(records, tmp_path / "out", partition_by="month", row_group_size=2)
+
+    dirs = sorted(p.parent.name for p in paths)
+    assert dirs == ["published_month=2026-01", "published_month=2026-02", "published_month=__HIVE_DEFAULT_PARTITION__"]
+    assert pq.ParquetFile(paths[0]).metadata.num_row_groups == 3
+
+    table = ds.dataset(tmp_path / "out", format="parquet", partitioning="hive").to_table(
+        columns=["company", "published_month"], filter=ds.field("published_month") == "2026-02"
+    )
+    assert sorted(table.column("company").to_pylist()) == [f"Co{i}" for i in (1, 3, 5, 7, 9)]
+    assert not list((tmp_path / "out").rglob(".*.tmp"))
+
+
+def test_parquet_writer_caps_buffered_rows_and_open_files(tmp_path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+
+    schema = pa.schema([("n", pa.int64()), ("published_at", pa.timestamp("us", tz="UTC"))])
+    days = [datetime(2026, 2, 1 + d, tzinfo=timezone.utc) for d in range(6)]
+    with ParquetDatasetWriter(
+        tmp_path / "out", schema, partition_by="day", row_group_size=100, max_buffered_rows=4, max_open_files=2
+    ) as writer:
+        for n in range(60):
+            writer.write({"n": n, "published_at": days[n % len(days)]})
+            assert sum(len(b) for b in writer._buffers.values()) < 4
+            assert len(writer._open) <= 2
+
+    # Partitions that were closed early get another part file; no rows are lost.
+    assert len(writer.paths) > len(days)
+    table = ds.dataset(tmp_path / "out", format="parquet", partitioning="hive").to_table(columns=["n"])
+    assert sorted(table.column("n").to_pylist()) == list(range(60))
+    assert not list((tmp_path / "out").rglob(".*.tmp"))
@@ -79,3 +79,129 @@ def test_kg_bundle_contains_required_relationship_types() -> None:
     assert "mentioned_in" in rel_types
     assert "received_investment_from" in rel_types
     assert "reported_by" in rel_types
+
+
+def test_keyword_matcher_term_counts_single_pass() -> None:
+    from techcrunch_intel.keywords import KeywordMatcher
+
+    m = KeywordMatcher()
+    counts = m.term_counts("Large Language Models power every LLM; AI, not laid-off llm teams.")
+    assert counts == {"large language models": 1, "large language model": 1, "llm": 2, "ai": 1}
+    assert m.matched_terms("We were laid off yesterday") == []
+    assert KeywordMatcher(phrases=(), tokens=()).matches("ai") is False
+
+
+def test_export_jsonl_streams_and_appends(tmp_path) -> None:
+    import json
+
+    from techcrunch_intel.export import export_jsonl
+    from techcrunch_intel.models import IntelRecord, InvestmentSignal
+
+    def records(n: int):
+        for i in range(n):
+            a = Article(title=f"T{i}", url=f"https://example.com/{i}", published_at=None)
+            yield IntelRecord(article=a, investment=InvestmentSignal(ai_relevant=True), extracted_at=datetime.now(timezone.utc))
+
+    out = tmp_path / "out" / "records.jsonl"
+    export_jsonl(records(3), out)
+    export_jsonl(records(2), out, append=True)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(ln)["article"]["title"] for ln in lines] == ["T0", "T1", "T2", "T0", "T1"]
+    assert [p.name for p in out.parent.iterdir()] == ["records.jsonl"]
+
+
+def test_extract_investment_signals_matches_per_article() -> None:
+    from techcrunch_intel.extract import extract_investment_signals
+
+    articles = [
+        Article(
+            title=f"Acme {i} raises ${i + 1}M in Series A",
+            url=f"https://example.com/{i}",
+            published_at=None,
+            summary="Funding led by Sequoia and Accel, with participation from a16z.",
+            categories=["AI"] if i % 2 else [],
+        )
+        for i in range(20)
+    ]
+    full_texts = [None if i % 3 else "The generative AI startup was backed by Y Combinator." for i in range(20)]
+
+    expected = [extract_investment_signal(a, full_text=t) for a, t in zip(articles, full_texts)]
+    assert extract_investment_signals(articles, full_texts=full_texts) == expected
+    assert extract_investment_signals(articles, full_texts=full_texts, processes=2, chunksize=5) == expected
+
+
+def test_intel_record_to_dict_matches_asdict() -> None:
+    import dataclasses
+    import pickle
+
+    from techcrunch_intel.models import IntelRecord
+
+    a = Article(
+        title="Acme AI raises $25M in Series A",
+        url="https://example.com",
+        published_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        categories=["AI"],
+    )
+    rec = IntelRecord(
+        article=a,
+        investment=extract_investment_signal(a),
+        extracted_at=datetime(2026, 2, 2, tzinfo=timezone.utc),
+        raw={"k": [1, {"x": 2}]},
+    )
+    expected = dataclasses.asdict(rec)
+    expected["article"]["published_at"] = a.published_at.isoformat()
+    expected["extracted_at"] = rec.extracted_at.isoformat()
+
+    d = rec.to_dict()
+    assert d == expected
+    assert list(d["article"]) == list(expected["article"])
+    assert d["article"]["categories"] is not a.categories
+    assert d["raw"] is not rec.raw and d["raw"]["k"] is not rec.raw["k"]
+
+    assert not hasattr(a, "__dict__")
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def _reference_matches(text: str, phrases, tokens) -> bool:
+    # The original per-term implementation.
+    import re
+
+    if not text:
+        return False
+    haystack = text.lower()
+    if any(p and p.lower() in haystack for p in phrases):
+        return True
+    for t in tokens:
+        t2 = (t or "").strip()
+        if t2 and re.search(rf"\b{re.escape(t2.lower())}\b", text, re.IGNORECASE) is not None:
+            return True
+    return False
+
+
+def test_keyword_matcher_matches_reference_on_random_text() -> None:
+    import random
+    import re
+
+    from techcrunch_intel.keywords import DEFAULT_AI_PHRASES, DEFAULT_AI_TOKENS, KeywordMatcher
+
+    pieces = [
+        "ai", "AI", "Ai", "laid", "chair", "said", "machine", "learning", "Machine Learning", "genai", "GenAI",
+        "llm", "LLMs", "large", "language", "models", "foundation model", "neural", "network", "deep",
+        "ml", "_ai", "ai2", "é", " ", " ", " ", "-", ".", ",", "\n",
+    ]
+    rng = random.Random(1234)
+    matchers = [KeywordMatcher(), KeywordMatcher(phrases=("learning", "ai model"), tokens=("ai", "ml", " LLM "))]
+    for _ in range(3000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        for m in matchers:
+            assert m.matches(text) is _reference_matches(text, m.phrases, m.tokens), text
+        # term_counts: every term counted at every position where it matches on its own.
+        m = matchers[0]
+        expected = {}
+        for term, is_token in [(p, False) for p in DEFAULT_AI_PHRASES] + [(t, True) for t in DEFAULT_AI_TOKENS]:
+            src = rf"\b{re.escape(term)}\b" if is_token else re.escape(term)
+            n = len(re.findall(f"(?=({src}))", text, re.IGNORECASE))
+            if n:
+                expected[term] = n
+        assert m.term_counts(text) == expected, text
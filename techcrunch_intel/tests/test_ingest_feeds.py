@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import httpx
+
+from techcrunch_intel.archive import ResponseArchive
+from techcrunch_intel.cache import HttpCache
+from techcrunch_intel.ingest import canonical_link, fetch_rss_entries, fetch_rss_feeds, merge_feed_articles
+
+
+def _rss(*items: tuple[str | None, str]) -> str:
+    body = "".join(
+        "<item>"
+        + (f'<guid isPermaLink="false">{guid}</guid>' if guid else "")
+        + f"<title>{link}</title><link>{link}</link>"
+        + "<pubDate>Mon, 02 Feb 2026 12:00:00 +0000</pubDate></item>"
+        for guid, link in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{body}</channel></rss>'
+
+
+_FEEDS = {
+    "/feed/": _rss(("g1", "https://techcrunch.com/2026/02/02/a/"), ("g2", "https://techcrunch.com/2026/02/02/b/")),
+    "/category/venture/feed/": _rss(
+        ("g2", "https://techcrunch.com/2026/02/02/b/"),
+        (None, "https://TechCrunch.com/2026/02/02/a?utm_source=rss&utm_medium=feed"),
+        ("g3", "https://techcrunch.com/2026/02/02/c/"),
+    ),
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    body = _FEEDS.get(request.url.path)
+    if body is None:
+        return httpx.Response(500, text="boom")
+    return httpx.Response(200, text=body, headers={"Content-Type": "application/rss+xml"})
+
+
+def test_fetch_rss_feeds_merges_and_dedupes_across_feeds() -> None:
+    urls = [
+        "https://tc.example/feed/",
+        "https://tc.example/broken/feed/",
+        "https://tc.example/category/venture/feed/",
+    ]
+
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as client:
+        results = fetch_rss_feeds(urls + urls[:1], max_workers=3, client=client)
+
+    assert [r.rss_url for r in results] == urls
+    assert [len(r.articles) for r in results] == [2, 0, 3]
+    assert results[1].error is not None and "500" in results[1].error
+
+    merged = merge_feed_articles(results)
+    assert [a.url for a in merged] == [
+        "https://techcrunch.com/2026/02/02/a/",
+        "https://techcrunch.com/2026/02/02/b/",
+        "https://techcrunch.com/2026/02/02/c/",
+    ]
+
+
+def test_canonical_link_ignores_tracking_and_cosmetic_differences() -> None:
+    assert canonical_link("https://TechCrunch.com/x/?utm_campaign=a#top") == canonical_link(
+        "https://techcrunch.com/x"
+    )
+    assert canonical_link("https://techcrunch.com/?p=1") != canonical_link("https://techcrunch.com/?p=2")
+
+
+def _no_network(request: httpx.Request) -> httpx.Response:
+    raise AssertionError(f"unexpected request to {request.url}")
+
+
+def test_fetch_rss_feeds_replays_from_archive_without_network(tmp_path) -> None:
+    urls = ["https://tc.example/feed/", "https://tc.example/category/venture/feed/"]
+    with ResponseArchive(tmp_path / "archive") as archive:
+        with httpx.Client(transport=httpx.MockTransport(_handler)) as client:
+            recorded = fetch_rss_feeds(urls, client=client, archive=archive)
+
+    with ResponseArchive(tmp_path / "archive", replay=True) as archive:
+        with httpx.Client(transport=httpx.MockTransport(_no_network)) as client:
+            replayed = fetch_rss_feeds(urls + ["https://tc.example/new/feed/"], client=client, archive=archive)
+
+    assert [r.articles for r in replayed[:2]] == [r.articles for r in recorded]
+    assert replayed[2].error is not None and "ArchiveMissError" in replayed[2].error
+
+
+def test_rss_validators_only_take_effect_after_commit(tmp_path) -> None:
+    url = "https://tc.example/feed/"
+    sent: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=_FEEDS["/feed/"], headers={"ETag": '"v1"'})
+
+    cache = HttpCache(tmp_path)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        first = fetch_rss_entries(url, cache=cache, client=client)
+        # The export failed: nothing committed, so the next run fetches the items again.
+        retried = fetch_rss_entries(url, cache=HttpCache(tmp_path), client=client)
+        cache.commit()
+        unchanged = fetch_rss_entries(url, cache=HttpCache(tmp_path), client=client)
+
+    assert len(first) == len(retried) == 2
+    assert unchanged == []
+    assert sent == [None, None, '"v1"']
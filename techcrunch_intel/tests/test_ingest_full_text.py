@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import httpx
+
+from techcrunch_intel.archive import ResponseArchive
+from techcrunch_intel.ingest import fetch_article_texts
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/broken":
+        return httpx.Response(500, text="boom")
+    body = f"<html><body><article><p>Body of {request.url.path}</p></article></body></html>"
+    return httpx.Response(200, text=body)
+
+
+def test_fetch_article_texts_keeps_order_and_reports_failures() -> None:
+    urls = [f"https://example.com/a{i}" for i in range(6)]
+    urls.insert(3, "https://example.com/broken")
+
+    with httpx.Client(transport=httpx.MockTransport(_handler)) as client:
+        results = fetch_article_texts(urls, max_workers=4, per_host_limit=2, client=client)
+
+    assert [r.url for r in results] == urls
+    assert results[0].text == "Body of /a0"
+    assert results[3].text is None
+    assert results[3].error is not None and "500" in results[3].error
+    assert all(r.error is None for i, r in enumerate(results) if i != 3)
+
+
+def test_fetch_article_texts_records_and_replays_archive(tmp_path) -> None:
+    urls = ["https://example.com/a0", "https://example.com/broken"]
+    with ResponseArchive(tmp_path / "archive") as archive:
+        with httpx.Client(transport=httpx.MockTransport(_handler)) as client:
+            fetch_article_texts(urls, client=client, archive=archive)
+
+    def _no_network(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(f"unexpected request to {request.url}")
+
+    with ResponseArchive(tmp_path / "archive", replay=True) as archive:
+        with httpx.Client(transport=httpx.MockTransport(_no_network)) as client:
+            results = fetch_article_texts(urls, client=client, archive=archive)
+
+    assert results[0].text == "Body of /a0"
+    # Failed responses are not archived, so they miss on replay.
+    assert results[1].error is not None and "ArchiveMissError" in results[1].error
+
+
+def test_fetch_article_texts_sends_user_agent_through_a_given_client() -> None:
+    agents: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        agents.append(request.headers.get("User-Agent", ""))
+        return _handler(request)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        fetch_article_texts(["https://example.com/a", "https://example.com/b"], user_agent="bot/1.0", client=client)
+
+    assert agents == ["bot/1.0", "bot/1.0"]
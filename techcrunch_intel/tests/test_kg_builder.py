@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from techcrunch_intel.kg import KGBuilder, build_kg_bundle, delta_to_ndjson
+from techcrunch_intel.models import Article, IntelRecord, InvestmentSignal
+
+
+def _record(n: int, company: str, investors: list[str]) -> IntelRecord:
+    return IntelRecord(
+        article=Article(title=f"{company} raises $5M", url=f"https://example.com/{n}", published_at=None),
+        investment=InvestmentSignal(ai_relevant=True, company=company, amount_text="$5M", investors=investors),
+        extracted_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_kg_builder_emits_only_new_items_in_delta() -> None:
+    day1 = [_record(1, "Acme AI", ["Sequoia"]), _record(2, "Beta", ["Sequoia"])]
+    day2 = [_record(3, "Acme AI", ["Sequoia", "Accel"])]
+
+    builder = KGBuilder()
+    builder.add_records(day1)
+    first = builder.take_delta()
+    assert first == build_kg_bundle(day1)
+
+    builder.add_records(day2)
+    delta = builder.take_delta()
+    types = sorted(e["entity_type"] for e in delta["entities"])
+    # Acme AI and Sequoia already exist; only the new article, investment and investor are emitted.
+    assert types == ["Article", "Investment", "Investor"]
+    assert len(delta["relationships"]) == 4
+    assert builder.take_delta() == {"entities": [], "relationships": []}
+    assert builder.bundle() == build_kg_bundle(day1 + day2)
+
+    lines = list(delta_to_ndjson(delta))
+    assert all(json.loads(ln)["op"] == "upsert" for ln in lines)
+    assert len(lines) == 7
+
+
+def test_kg_builder_from_bundle_resumes_without_replaying_history() -> None:
+    history = [_record(1, "Acme AI", ["Sequoia"])]
+    builder = KGBuilder.from_bundle(json.loads(json.dumps(build_kg_bundle(history))))
+    assert builder.take_delta() == {"entities": [], "relationships": []}
+
+    builder.add_record(_record(1, "Acme AI", ["Sequoia"]))
+    assert builder.take_delta() == {"entities": [], "relationships": []}
+
+
+def test_export_kg_ndjson_chunks_and_compresses(tmp_path) -> None:
+    import gzip
+
+    from techcrunch_intel.export import export_kg_ndjson
+
+    builder = KGBuilder()
+    builder.add_records([_record(i, f"Co {i}", ["Sequoia"]) for i in range(3)])
+
+    paths = export_kg_ndjson(builder, tmp_path, chunk_size=4, compression="gzip")
+    names = [p.name for p in paths]
+    assert names[0] == "entities-00000.ndjson.gz"
+    assert names[-1].startswith("relationships-")
+
+    entities = [
+        json.loads(ln)
+        for p in paths
+        if p.name.startswith("entities-")
+        for ln in gzip.open(p, "rt", encoding="utf-8")
+    ]
+    assert entities == builder.bundle()["entities"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names)
+
+
+def test_export_kg_ndjson_replaces_the_previous_export_as_a_whole(tmp_path) -> None:
+    import pytest
+
+    from techcrunch_intel.export import export_kg_ndjson
+
+    (tmp_path / "notes.txt").write_text("keep me", encoding="utf-8")
+    large = KGBuilder()
+    large.add_records([_record(i, f"Co {i}", ["Sequoia"]) for i in range(6)])
+    old = export_kg_ndjson(large, tmp_path, chunk_size=2)
+
+    def failing():
+        yield {"id": "x"}
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        export_kg_ndjson({"entities": failing(), "relationships": []}, tmp_path, chunk_size=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([p.name for p in old] + ["notes.txt"])
+
+    small = KGBuilder()
+    small.add_records([_record(0, "Co 0", ["Sequoia"])])
+    new = export_kg_ndjson(small, tmp_path, chunk_size=100)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([p.name for p in new] + ["notes.txt"])
+    assert [json.loads(ln) for ln in new[0].open(encoding="utf-8")] == small.bundle()["entities"]
+
+
+def test_kg_builder_bundle_returns_copies() -> None:
+    builder = KGBuilder()
+    builder.add_records([_record(1, "Acme AI", ["Sequoia"])])
+    before = json.loads(json.dumps(builder.bundle()))
+
+    snapshot = builder.bundle()
+    snapshot["entities"][0]["entity_type"] = "Changed"
+    snapshot["entities"][0]["properties"]["name"] = "Changed"
+    snapshot["relationships"][0]["properties"].clear()
+
+    assert builder.bundle() == before
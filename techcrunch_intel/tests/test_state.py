@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import time
+
+from techcrunch_intel.models import Article
+from techcrunch_intel.pipeline import build_intel_records
+from techcrunch_intel.state import SeenIndex
+
+
+def _article(guid: str) -> Article:
+    return Article(
+        title=f"Acme AI {guid} raises $5M in seed funding",
+        url=f"https://example.com/{guid}",
+        published_at=None,
+        summary="The AI startup raised a seed round.",
+        guid=guid,
+    )
+
+
+def test_seen_index_filters_previous_runs(tmp_path) -> None:
+    db = tmp_path / "seen.sqlite"
+    with SeenIndex(db) as seen:
+        first = build_intel_records([_article("a"), _article("b")], seen=seen)
+        # Nothing is marked until the caller commits (i.e. after writing its output).
+        assert len(seen) == 0 and seen.staged == ["a", "b"]
+        seen.commit()
+    with SeenIndex(db) as seen:
+        # An export that failed: staged keys are never committed.
+        build_intel_records([_article("c")], seen=seen)
+    with SeenIndex(db) as seen:
+        second = build_intel_records([_article("b"), _article("c"), _article("c")], seen=seen)
+        seen.commit()
+        assert "a" in seen and "c" in seen
+
+    assert [r.article.guid for r in first] == ["a", "b"]
+    assert [r.article.guid for r in second] == ["c"]
+
+
+def test_seen_index_compact_applies_retention(tmp_path) -> None:
+    with SeenIndex(tmp_path / "seen.sqlite", retention_days=0) as seen:
+        seen.mark_seen(["x", "y", None])
+        assert len(seen) == 2
+        time.sleep(0.01)
+        assert seen.compact() == 2
+        assert len(seen) == 0
+
+
+def test_seen_index_compact_only_vacuums_when_much_is_free(tmp_path) -> None:
+    db = tmp_path / "seen.sqlite"
+    with SeenIndex(db, retention_days=0) as seen:
+        seen.mark_seen(f"https://example.com/{i:06d}/{'x' * 100}" for i in range(20_000))
+        time.sleep(0.01)
+        assert seen.compact() == 20_000
+        assert seen._conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    with SeenIndex(db, retention_days=1) as seen:
+        seen.mark_seen(f"k{i}" for i in range(20_000))
+        with seen._conn:
+            seen._conn.execute("UPDATE seen SET seen_at = 0 WHERE key IN ('k1', 'k2', 'k3')")
+        pages = seen._conn.execute("PRAGMA page_count").fetchone()[0]
+        assert seen.compact() == 3
+        # Only a few keys went: their pages stay allocated for reuse instead of a rewrite.
+        assert seen._conn.execute("PRAGMA page_count").fetchone()[0] == pages
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+
+from techcrunch_intel.models import Article, IntelRecord, InvestmentSignal
+from techcrunch_intel.store import IntelStore, main
+
+
+def _item(source: str, record_id: str, published_at: str | None, *, entities=(), tags=()) -> dict:
+    # The JSON shape shared by every extractor's `InvestmentIntelItem`.
+    return {
+        "source": source,
+        "source_record_type": "post" if source == "reddit" else "funding_round",
+        "source_record_id": record_id,
+        "url": f"https://example.com/{record_id}",
+        "title": f"title {record_id}",
+        "summary": None,
+        "published_at": published_at,
+        "collected_at": "2026-02-10T00:00:00Z",
+        "entities": list(entities),
+        "tags": list(tags),
+        "raw": {"id": record_id},
+    }
+
+
+def _record() -> IntelRecord:
+    article = Article(
+        title="Acme AI raises $20M Series A",
+        url="https://techcrunch.com/2026/02/03/acme/",
+        published_at=datetime(2026, 2, 3, 9, 0, tzinfo=timezone.utc),
+        categories=["AI", "Venture"],
+        guid="tc-1",
+    )
+    signal = InvestmentSignal(
+        ai_relevant=True, company="Acme AI", amount_text="$20M", stage="Series A", investors=["Accel"]
+    )
+    return IntelRecord(article=article, investment=signal, extracted_at=datetime(2026, 2, 3, tzinfo=timezone.utc))
+
+
+def test_store_indexes_all_shapes_and_queries_by_time_entity_and_tag(tmp_path) -> None:
+    with IntelStore(tmp_path / "intel.sqlite") as store:
+        store.add(
+            [
+                _item("crunchbase", "r1", "2026-02-02T00:00:00", entities=["ORG:Acme AI"], tags=["funding_round"]),
+                _item("reddit", "p1", "2026-02-05T12:00:00+00:00", entities=["TICKER:NVDA"], tags=["financing"]),
+                _item("crunchbase", "r2", "2026-01-20T00:00:00", tags=["funding_round"]),
+                _item("techcrunch", "x1", None),
+                _record(),
+            ]
+        )
+        # Re-ingesting updates in place.
+        store.add([_item("reddit", "p1", "2026-02-05T12:00:00+00:00", entities=["TICKER:AMD"])])
+        assert len(store) == 5
+
+        week = list(store.query(since=datetime(2026, 2, 1), until=datetime(2026, 2, 8)))
+        assert [i.record_id for i in week] == ["r1", "tc-1", "p1"]
+        assert [i.record_id for i in store.query(entity="ORG:Acme AI")] == ["r1", "tc-1"]
+        assert [i.record_id for i in store.query(tag="funding_round", newest_first=True)] == ["tc-1", "r1", "r2"]
+        assert [i.record_id for i in store.query(source="reddit", entity="TICKER:NVDA")] == []
+
+        stored = store.get("techcrunch:intel_record:tc-1")
+        assert stored is not None
+        assert stored.entities == ["ORG:Acme AI", "INVESTOR:Accel"]
+        assert stored.tags == ["AI", "Venture", "ai_relevant", "funding_round"]
+        assert stored.payload["investment"]["stage"] == "Series A"
+
+
+def test_store_cli_ingests_jsonl_and_queries(tmp_path, capsys) -> None:
+    src = tmp_path / "items.jsonl"
+    src.write_text(
+        "\n".join(
+            json.dumps(_item("crunchbase", f"r{i}", f"2026-02-0{i}T00:00:00", tags=["funding_round"]))
+            for i in range(1, 6)
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    db = tmp_path / "intel.sqlite"
+
+    assert main(["--db", str(db), "ingest", str(src)]) == 0
+    capsys.readouterr()
+    assert main(["--db", str(db), "query", "--since", "2026-02-02", "--until", "2026-02-04", "--tag", "funding_round"]) == 0
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["uid"] for line in lines] == ["crunchbase:funding_round:r2", "crunchbase:funding_round:r3"]